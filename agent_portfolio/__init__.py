@@ -0,0 +1,10 @@
+"""
+Support modules for the AI Agent Portfolio generators
+
+create_agents_excel.py (Excel) and agents-sheet.py (Google Apps Script) both
+render the same agent catalog; the pieces they share live here.
+"""
+
+from .catalog import DEFAULT_CATALOG_PATH, load_catalog
+
+__all__ = ['DEFAULT_CATALOG_PATH', 'load_catalog']
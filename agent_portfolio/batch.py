@@ -0,0 +1,125 @@
+"""
+Parallel batch generation of per-stakeholder portfolios
+
+A batch is a list of workbook specs, usually kept in a JSON file:
+
+    [
+      {"output": "sheets/teams/research.xlsx",
+       "title": "🔬 RESEARCH AGENT FORCE",
+       "areas": ["Research Oversight", "Regulatory"]},
+      {"output": "sheets/teams/ceo.xlsx", "categories": ["💼 INVESTOR RELATIONS"]}
+    ]
+
+Specs are rendered on a process pool. The catalog is handed to each worker
+once, when the worker starts, so tasks only carry their small spec.
+
+    python -m agent_portfolio.batch specs.json --workers 4
+"""
+
+import argparse
+import json
+import os
+import time
+from collections import defaultdict
+from concurrent.futures import ProcessPoolExecutor, as_completed
+
+import create_agents_excel as generator
+
+from .records import Agent
+
+# Catalog shared by every task of a worker process
+_agents_data = None
+
+
+def _init_worker(agents_data):
+    global _agents_data
+    _agents_data = agents_data
+
+
+def _render(spec):
+    started = time.perf_counter()
+    agents_data = generator.filter_agents_data(_agents_data, spec.get('areas'), spec.get('categories'))
+    generator.create_agent_portfolio_excel(
+        agents_data=agents_data,
+        output_path=spec['output'],
+        title=spec.get('title', generator.DEFAULT_TITLE),
+        top_n=spec.get('top_n', generator.TOP_N),
+        streaming=spec.get('streaming', False),
+        incremental=spec.get('incremental', False),
+        verbose=False,
+    )
+    agents = sum(1 for item in agents_data if isinstance(item, Agent))
+    return os.getpid(), spec['output'], agents, time.perf_counter() - started
+
+
+def load_specs(path):
+    with open(path, encoding='utf-8') as f:
+        specs = json.load(f)
+    for index, spec in enumerate(specs, 1):
+        if not spec.get('output'):
+            raise ValueError(f'{path}: spec {index} has no "output" path')
+    return specs
+
+
+def run_batch(specs, workers=None, catalog_path=generator.DEFAULT_CATALOG_PATH, on_result=None):
+    """Render every spec on a pool of ``workers`` processes.
+
+    Returns a report with the wall time and, per worker process, the number
+    of workbooks and agent rows rendered, busy time and throughput.
+    ``on_result(output, agents, seconds)`` is called as each workbook lands.
+    """
+    agents_data = generator.build_agents_data(generator.COLORS, catalog_path)
+    per_worker = defaultdict(lambda: {'workbooks': 0, 'agents': 0, 'busy': 0.0})
+
+    started = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker,
+                             initargs=(agents_data,)) as pool:
+        futures = [pool.submit(_render, spec) for spec in specs]
+        for future in as_completed(futures):
+            pid, output, agents, seconds = future.result()
+            stats = per_worker[pid]
+            stats['workbooks'] += 1
+            stats['agents'] += agents
+            stats['busy'] += seconds
+            if on_result is not None:
+                on_result(output, agents, seconds)
+    wall = time.perf_counter() - started
+
+    for stats in per_worker.values():
+        busy = stats['busy'] or float('inf')
+        stats['workbooks_per_sec'] = stats['workbooks'] / busy
+        stats['agents_per_sec'] = stats['agents'] / busy
+    return {
+        'workbooks': len(specs),
+        'wall_seconds': wall,
+        'workbooks_per_sec': len(specs) / wall if wall else 0.0,
+        'workers': dict(per_worker),
+    }
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Render a batch of Agent Portfolio workbooks in parallel')
+    parser.add_argument('specs', help='JSON file with a list of workbook specs')
+    parser.add_argument('--workers', type=int, default=None, help='worker processes (default: CPU count)')
+    parser.add_argument('--catalog', default=generator.DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--report', help='also write the throughput report to this JSON file')
+    args = parser.parse_args(argv)
+
+    specs = load_specs(args.specs)
+    report = run_batch(specs, args.workers, args.catalog,
+                       on_result=lambda output, agents, seconds: print(f"✅ {output} ({agents} agents, {seconds:.2f}s)"))
+
+    print(f"\n📊 {report['workbooks']} workbooks in {report['wall_seconds']:.2f}s "
+          f"({report['workbooks_per_sec']:.1f}/s)")
+    for pid, stats in sorted(report['workers'].items()):
+        print(f"   worker {pid}: {stats['workbooks']} workbooks, {stats['agents']} agents, "
+              f"{stats['busy']:.2f}s busy, {stats['workbooks_per_sec']:.1f} workbooks/s, "
+              f"{stats['agents_per_sec']:.0f} agents/s")
+
+    if args.report:
+        with open(args.report, 'w', encoding='utf-8') as f:
+            json.dump(report, f, indent=2)
+
+
+if __name__ == '__main__':
+    main()
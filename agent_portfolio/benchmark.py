@@ -0,0 +1,312 @@
+"""
+Benchmarks for Agent Portfolio generation
+
+Synthesizes catalogs of 10, 1k, 10k and 100k agents spread over the nine
+categories of the real catalog, renders each one and records, for every
+stage of create_agent_portfolio_excel() (see STAGES there), the wall time
+and the peak memory traced by tracemalloc, plus the size of the output file.
+Stages are measured with agent_portfolio.instrument.
+
+Times and memory come from separate runs, since tracing allocations slows
+the code down; each time is the best of REPEAT runs, kept with the spread
+of those runs so that noisy stages need a bigger slowdown to fail. Results
+are compared against a JSON baseline; the run fails when any stage is
+slower or bigger than the baseline by more than the threshold, when a stage
+or size shows up on one side only, or when there is no baseline to compare
+against.
+
+    python -m agent_portfolio.benchmark --update     # record the baseline
+    python -m agent_portfolio.benchmark              # compare against it
+
+--compare-compression instead renders every size once per compression
+profile (see agent_portfolio.package) and reports save time against file
+size, without touching the baseline; it takes neither --compression,
+--no-memory nor --update.
+"""
+
+import argparse
+import json
+import os
+import platform
+import shutil
+import sys
+import tempfile
+
+import create_agents_excel as generator
+
+from .catalog import DEFAULT_CATALOG_PATH, PRIORITIES, load_catalog, save_catalog
+from .instrument import Instrumentation
+from .package import COMPRESSION_PROFILES, DEFAULT_COMPRESSION
+from .records import Agent
+
+SIZES = [10, 1000, 10000, 100000]
+
+DEFAULT_BASELINE = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'benchmarks', 'portfolio_baseline.json'
+)
+
+# Allowed slowdown / growth over the baseline before a stage counts as regressed
+DEFAULT_THRESHOLD = 0.25
+
+# Differences below these are noise, whatever the ratio: back-to-back runs
+# of an unchanged tree move stages by tens of milliseconds
+MIN_SECONDS = 0.1
+MIN_BYTES = 256 * 1024
+
+# A slowdown must also exceed this many times the stage's baseline spread
+# (slowest minus fastest of its REPEAT runs)
+SPREAD_FACTOR = 3
+
+# Timed runs per size; the best is kept
+REPEAT = 3
+
+
+def synthesize_catalog(size, path, template_path=DEFAULT_CATALOG_PATH):
+    """Write a catalog of ``size`` agents to ``path``, modelled on the real one.
+
+    Agents are dealt round-robin over the template's categories, cycling
+    through each category's own agents with a numbered name; every third
+    agent gets a priority so ranking has work to do.
+    """
+    categories = load_catalog(template_path, use_cache=False)
+    templates = [category['agents'] for category in categories]
+    synthesized = [dict(category, agents=[]) for category in categories]
+    for index in range(size):
+        slot = index % len(categories)
+        template = templates[slot][(index // len(categories)) % len(templates[slot])]
+        agent = Agent(*template.cells())
+        agent.name = f'{template.name} #{index + 1}'
+        agent.priority = PRIORITIES[index % len(PRIORITIES)] if index % 3 == 0 else ''
+        synthesized[slot]['agents'].append(agent)
+    save_catalog([category for category in synthesized if category['agents']], path)
+    return path
+
+
+def _render(catalog_path, output_path, streaming, memory, backend='openpyxl', workers=None,
+            compression=DEFAULT_COMPRESSION):
+    """Render once and return {stage: seconds}, or {stage: peak bytes} with ``memory``"""
+    # A cold catalog cache every run, so the catalog stage always parses
+    shutil.rmtree(os.path.join(os.path.dirname(catalog_path), '__pycache__'), ignore_errors=True)
+    with Instrumentation(allocations=memory) as probe:
+        generator.create_agent_portfolio_excel(catalog_path=catalog_path, output_path=output_path,
+                                               streaming=streaming, verbose=False, stage=probe,
+                                               backend=backend, workers=workers, compression=compression)
+    metric = 'peak_bytes' if memory else 'seconds'
+    return {event['stage']: event[metric] for event in probe.events if event['event'] == 'stage'}
+
+
+def run_benchmarks(sizes=SIZES, streaming=False, repeat=REPEAT, memory=True, on_result=None,
+                   backend='openpyxl', workers=None, compression=DEFAULT_COMPRESSION):
+    """Benchmark every catalog size and return {size: {stages, output_bytes}}.
+
+    Each stage reports the best ``seconds`` of ``repeat`` runs, their
+    ``spread`` (slowest minus fastest) and, unless
+    ``memory`` is False, its ``peak_bytes`` above what was allocated when
+    the stage started.
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            catalog_path = synthesize_catalog(size, os.path.join(workdir, f'catalog_{size}.json'))
+            output_path = os.path.join(workdir, f'portfolio_{size}.xlsx')
+
+            stages = {}
+            for _ in range(repeat):
+                for name, seconds in _render(catalog_path, output_path, streaming, False, backend, workers,
+                                             compression).items():
+                    stages.setdefault(name, {}).setdefault('runs', []).append(seconds)
+            for metrics in stages.values():
+                runs = metrics.pop('runs')
+                metrics['seconds'] = min(runs)
+                metrics['spread'] = max(runs) - min(runs)
+            if memory:
+                for name, peak in _render(catalog_path, output_path, streaming, True, backend, workers,
+                                          compression).items():
+                    stages[name]['peak_bytes'] = peak
+
+            results[str(size)] = {'stages': stages, 'output_bytes': os.path.getsize(output_path)}
+            if on_result is not None:
+                on_result(size, results[str(size)])
+    return results
+
+
+def compare_compression(sizes=SIZES, streaming=False, repeat=REPEAT, on_result=None, backend='openpyxl',
+                        workers=None, profiles=tuple(COMPRESSION_PROFILES)):
+    """Render every size with each compression profile; return {size: {profile: {save_seconds, output_bytes}}}.
+
+    ``save_seconds`` is the best of ``repeat`` runs of the save stage, the
+    only one the profile changes (with ``workers``, the 'sheets' stage that
+    compresses the sheet parts is added to it).
+    """
+    results = {}
+    with tempfile.TemporaryDirectory() as workdir:
+        for size in sizes:
+            catalog_path = synthesize_catalog(size, os.path.join(workdir, f'catalog_{size}.json'))
+            output_path = os.path.join(workdir, f'portfolio_{size}.xlsx')
+            by_profile = results[str(size)] = {}
+            for profile in profiles:
+                seconds = min(
+                    sum(stages.get(name, 0) for name in ('sheets', 'save'))
+                    for stages in (_render(catalog_path, output_path, streaming, False, backend, workers, profile)
+                                   for _ in range(repeat))
+                )
+                by_profile[profile] = {'save_seconds': seconds, 'output_bytes': os.path.getsize(output_path)}
+            if on_result is not None:
+                on_result(size, by_profile)
+    return results
+
+
+def find_regressions(baseline, current, threshold=DEFAULT_THRESHOLD):
+    """List (size, stage, metric, baseline value, current value) that grew past the threshold"""
+    floors = {'seconds': MIN_SECONDS, 'peak_bytes': MIN_BYTES, 'output_bytes': MIN_BYTES}
+    regressions = []
+
+    def check(size, stage, metric, before, after, spread=0.0):
+        if before is None or after is None:
+            return
+        floor = max(floors[metric], SPREAD_FACTOR * spread)
+        if after > before * (1 + threshold) and after - before > floor:
+            regressions.append((size, stage, metric, before, after))
+
+    for size, result in current.items():
+        previous = baseline.get(size)
+        if previous is None:
+            continue
+        for stage, metrics in result['stages'].items():
+            before = previous['stages'].get(stage, {})
+            for metric, value in metrics.items():
+                if metric in floors:
+                    spread = before.get('spread', 0.0) if metric == 'seconds' else 0.0
+                    check(size, stage, metric, before.get(metric), value, spread)
+        check(size, 'output', 'output_bytes', previous.get('output_bytes'), result['output_bytes'])
+    return regressions
+
+
+def unmatched(baseline, current):
+    """List (size, stage, side) for the sizes and stages found on one ``side`` only.
+
+    Sizes left out of the current run are not reported; a size missing from
+    the baseline is reported with stage None.
+    """
+    found = []
+    for size, result in current.items():
+        previous = baseline.get(size)
+        if previous is None:
+            found.append((size, None, 'current'))
+            continue
+        before, after = set(previous['stages']), set(result['stages'])
+        found += [(size, stage, 'baseline') for stage in sorted(before - after)]
+        found += [(size, stage, 'current') for stage in sorted(after - before)]
+    return found
+
+
+def _environment(streaming, backend, compression):
+    from openpyxl import __version__ as openpyxl_version
+    return {'python': platform.python_version(), 'openpyxl': openpyxl_version,
+            'machine': platform.machine(), 'streaming': streaming, 'backend': backend,
+            'compression': compression}
+
+
+def _format_result(size, result):
+    stages = result['stages']
+    parts = []
+    for name in generator.STAGES:
+        if name in stages:
+            text = f"{name} {stages[name]['seconds'] * 1000:.0f}ms"
+            if 'peak_bytes' in stages[name]:
+                text += f"/{stages[name]['peak_bytes'] / 2 ** 20:.1f}MB"
+            parts.append(text)
+    return f"{size:>7} agents: " + ', '.join(parts) + f", file {result['output_bytes'] / 1024:.0f}KB"
+
+
+def _format_compression(size, by_profile):
+    reference = by_profile.get(DEFAULT_COMPRESSION)
+    parts = []
+    for profile, result in by_profile.items():
+        text = f"{profile} {result['save_seconds'] * 1000:.0f}ms/{result['output_bytes'] / 1024:.0f}KB"
+        if reference is not None and profile != DEFAULT_COMPRESSION:
+            text += (f" ({result['save_seconds'] / reference['save_seconds']:.2f}x time,"
+                     f" {result['output_bytes'] / reference['output_bytes']:.2f}x size)")
+        parts.append(text)
+    return f"{size:>7} agents: " + ', '.join(parts)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Benchmark Agent Portfolio workbook generation')
+    parser.add_argument('--sizes', default=','.join(map(str, SIZES)),
+                        help='comma-separated catalog sizes (default: %(default)s)')
+    parser.add_argument('--baseline', default=DEFAULT_BASELINE, help='baseline JSON file')
+    parser.add_argument('--update', action='store_true', help='write the results as the new baseline')
+    parser.add_argument('--threshold', type=float, default=DEFAULT_THRESHOLD,
+                        help='allowed relative regression per stage (default: %(default)s)')
+    parser.add_argument('--repeat', type=int, default=REPEAT,
+                        help='timed runs per size; the best is kept (default: %(default)s)')
+    parser.add_argument('--streaming', action='store_true', help='benchmark write-only mode')
+    parser.add_argument('--backend', choices=generator.BACKENDS, default='openpyxl',
+                        help='workbook writer to benchmark (default: %(default)s)')
+    parser.add_argument('--no-memory', action='store_true', help='skip the tracemalloc runs')
+    parser.add_argument('--workers', type=int, help='render the sheets on this many processes (native backend)')
+    parser.add_argument('--compression', choices=COMPRESSION_PROFILES,
+                        help=f'zip profile of the benchmarked output (default: {DEFAULT_COMPRESSION})')
+    parser.add_argument('--compare-compression', action='store_true',
+                        help='report save time and file size for every compression profile instead; '
+                             'cannot be combined with --compression, --no-memory or --update')
+    args = parser.parse_args(argv)
+    if args.compare_compression:
+        # The comparison times every profile, never traces memory and writes no baseline
+        conflicting = [flag for flag, given in (('--compression', args.compression is not None),
+                                                ('--no-memory', args.no_memory), ('--update', args.update))
+                       if given]
+        if conflicting:
+            parser.error(f"--compare-compression cannot be combined with {', '.join(conflicting)}")
+    compression = args.compression or DEFAULT_COMPRESSION
+
+    sizes = [int(size) for size in args.sizes.split(',') if size]
+    if args.compare_compression:
+        compare_compression(sizes, args.streaming, args.repeat,
+                            on_result=lambda size, result: print(_format_compression(size, result)),
+                            backend=args.backend, workers=args.workers)
+        return 0
+
+    results = run_benchmarks(sizes, args.streaming, args.repeat, not args.no_memory,
+                             on_result=lambda size, result: print(_format_result(size, result)),
+                             backend=args.backend, workers=args.workers, compression=compression)
+
+    if args.update:
+        os.makedirs(os.path.dirname(args.baseline) or '.', exist_ok=True)
+        with open(args.baseline, 'w', encoding='utf-8') as f:
+            json.dump({'environment': _environment(args.streaming, args.backend, compression), 'results': results}, f,
+                      indent=2)
+            f.write('\n')
+        print(f"📏 Baseline written to {os.path.relpath(args.baseline)}")
+        return 0
+
+    if not os.path.exists(args.baseline):
+        print(f"❌ No baseline at {os.path.relpath(args.baseline)}; run with --update to record one")
+        return 2
+    with open(args.baseline, encoding='utf-8') as f:
+        baseline = json.load(f)
+    if baseline.get('environment', {}).get('streaming', False) != args.streaming:
+        print('⚠️  Baseline was recorded in the other (streaming / in-memory) mode')
+    if baseline.get('environment', {}).get('backend', 'openpyxl') != args.backend:
+        print('⚠️  Baseline was recorded with another backend')
+    if baseline.get('environment', {}).get('compression', DEFAULT_COMPRESSION) != compression:
+        print('⚠️  Baseline was recorded with another compression profile')
+
+    regressions = find_regressions(baseline['results'], results, args.threshold)
+    for size, stage, metric, before, after in regressions:
+        print(f"❌ {size} agents, {stage} {metric}: {before:.4g} -> {after:.4g} (+{(after / before - 1) * 100:.0f}%)")
+    missing = unmatched(baseline['results'], results)
+    for size, stage, side in missing:
+        if stage is None:
+            print(f"❌ {size} agents: not in the baseline")
+        else:
+            print(f"❌ {size} agents, {stage}: only in the {side} run")
+    if regressions or missing:
+        return 1
+    print(f"✅ No stage regressed by more than {args.threshold:.0%}")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
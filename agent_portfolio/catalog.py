@@ -0,0 +1,214 @@
+"""
+Agent catalog loading and saving
+
+The catalog lives in sheets/agents_catalog.json (a CSV export with one row per
+agent is accepted as well). Parsing and validating it is compiled into a pickle
+cache keyed on the source file's mtime, size and SHA-256, so repeat runs skip
+straight to the parsed result.
+"""
+
+import csv
+import hashlib
+import io
+import json
+import os
+import pickle
+
+from .records import Agent
+
+DEFAULT_CATALOG_PATH = os.path.join(
+    os.path.dirname(os.path.dirname(os.path.abspath(__file__))), 'sheets', 'agents_catalog.json'
+)
+
+# Bump whenever the cached payload layout changes
+CACHE_VERSION = 2
+
+# Allowed values for the dropdown columns
+PRIORITIES = ['5 - Critical', '4 - High', '3 - Medium', '2 - Low', '1 - Not Now']
+IMPACT_LEVELS = ['HIGH', 'MEDIUM', 'LOW']
+COMPLEXITY_LEVELS = ['Low', 'Medium', 'High']
+STATUSES = ['Not Started', 'Planning', 'In Progress', 'Complete']
+
+AGENT_FIELDS = ['area', 'name', 'description', 'time_saved', 'impact', 'complexity', 'status', 'quick_win']
+CSV_FIELDS = ['category', 'color', 'font_color'] + AGENT_FIELDS + ['priority', 'notes']
+
+
+def _parse_json(text):
+    return json.loads(text)['categories']
+
+
+def _parse_csv(text):
+    """Group flat CSV rows (one per agent) into categories, keeping file order"""
+    categories = []
+    by_name = {}
+    for record in csv.DictReader(io.StringIO(text)):
+        name = record['category']
+        if name not in by_name:
+            by_name[name] = {'name': name, 'color': record['color'], 'agents': []}
+            if record.get('font_color'):
+                by_name[name]['font_color'] = record['font_color']
+            categories.append(by_name[name])
+        agent = {field: record.get(field) or '' for field in AGENT_FIELDS + ['priority', 'notes']}
+        agent['quick_win'] = agent['quick_win'].strip().lower() in ('true', 'yes', '1')
+        by_name[name]['agents'].append(agent)
+    return categories
+
+
+def _validate(categories, path):
+    """Check every agent and turn it into an Agent record"""
+    compiled = []
+    for cat_index, category in enumerate(categories):
+        where = f'{path}: category {cat_index + 1}'
+        for key in ('name', 'color'):
+            if not category.get(key):
+                raise ValueError(f'{where} is missing "{key}"')
+
+        rows = []
+        for agent_index, agent in enumerate(category.get('agents', [])):
+            where = f'{path}: {category["name"]} agent {agent_index + 1}'
+            missing = [field for field in AGENT_FIELDS if field not in agent]
+            if missing:
+                raise ValueError(f'{where} is missing {", ".join(missing)}')
+            for field, allowed in (('impact', IMPACT_LEVELS),
+                                   ('complexity', COMPLEXITY_LEVELS),
+                                   ('status', STATUSES)):
+                if agent[field] not in allowed:
+                    raise ValueError(f'{where} has {field} {agent[field]!r}, expected one of {allowed}')
+            priority = agent.get('priority', '')
+            if priority and priority not in PRIORITIES:
+                raise ValueError(f'{where} has priority {priority!r}, expected one of {PRIORITIES}')
+            if not isinstance(agent['quick_win'], bool):
+                raise ValueError(f'{where} has non-boolean quick_win {agent["quick_win"]!r}')
+
+            rows.append(Agent(priority, agent['area'], agent['name'], agent['description'],
+                              agent['time_saved'], agent['impact'], agent['complexity'],
+                              agent['status'], agent.get('notes', ''), agent['quick_win']))
+
+        compiled.append({
+            'name': category['name'],
+            'color': category['color'],
+            'font_color': category.get('font_color', 'white'),
+            'agents': rows,
+        })
+    return compiled
+
+
+def _cache_path(path, cache_dir):
+    if cache_dir is None:
+        cache_dir = os.path.join(os.path.dirname(os.path.abspath(path)), '__pycache__')
+    return os.path.join(cache_dir, os.path.basename(path) + '.pickle')
+
+
+def _read_cache(cache_path, stat, source_digest=None):
+    """Return the cached payload if it still matches the source, else None.
+
+    The header is pickled separately ahead of the payload, so a stale cache is
+    rejected without unpickling the catalog itself.
+    """
+    try:
+        with open(cache_path, 'rb') as f:
+            header = pickle.load(f)
+            if header.get('version') != CACHE_VERSION:
+                return None
+            if (header['mtime_ns'], header['size']) == (stat.st_mtime_ns, stat.st_size):
+                return pickle.load(f)
+            if source_digest is not None and header['sha256'] == source_digest:
+                return pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, KeyError, AttributeError):
+        pass
+    return None
+
+
+def _write_cache(cache_path, stat, digest, payload):
+    header = {'version': CACHE_VERSION, 'mtime_ns': stat.st_mtime_ns,
+              'size': stat.st_size, 'sha256': digest}
+    tmp_path = f'{cache_path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(cache_path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(header, f, protocol=pickle.HIGHEST_PROTOCOL)
+            pickle.dump(payload, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, cache_path)
+    except OSError:
+        # A read-only checkout just means every run parses the source
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
+
+
+def load_catalog(path=DEFAULT_CATALOG_PATH, cache_dir=None, use_cache=True):
+    """Load the agent catalog as a list of categories.
+
+    Each category is a dict with ``name``, ``color`` and ``font_color`` (keys
+    into the generators' color palette) and ``agents``, a list of Agent
+    records (see agent_portfolio.records). The compiled result is cached
+    under ``cache_dir`` (default: ``__pycache__`` next to the source) and
+    reused while the source file's mtime and size are unchanged, or its
+    content hash still matches.
+    """
+    stat = os.stat(path)
+    cache_path = _cache_path(path, cache_dir)
+
+    if use_cache:
+        payload = _read_cache(cache_path, stat)
+        if payload is not None:
+            return payload
+
+    with open(path, 'rb') as f:
+        raw = f.read()
+    digest = hashlib.sha256(raw).hexdigest()
+
+    if use_cache:
+        # Touched but unchanged (e.g. a fresh checkout): refresh the stat key
+        payload = _read_cache(cache_path, stat, digest)
+        if payload is not None:
+            _write_cache(cache_path, stat, digest, payload)
+            return payload
+
+    text = raw.decode('utf-8-sig')
+    if path.lower().endswith('.csv'):
+        categories = _parse_csv(text)
+    else:
+        categories = _parse_json(text)
+    payload = _validate(categories, path)
+
+    if use_cache:
+        _write_cache(cache_path, stat, digest, payload)
+    return payload
+
+
+def _agent_record(agent):
+    """Inverse of the Agent built by _validate()"""
+    record = {field: getattr(agent, field) for field in Agent.FIELDS}
+    # Only keep the optional columns once someone has filled them in
+    for field in ('priority', 'notes'):
+        if not record[field]:
+            del record[field]
+    return record
+
+
+def save_catalog(categories, path=DEFAULT_CATALOG_PATH):
+    """Write categories in load_catalog() form back to a JSON or CSV catalog file"""
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    with open(tmp_path, 'w', encoding='utf-8', newline='') as f:
+        if path.lower().endswith('.csv'):
+            writer = csv.DictWriter(f, CSV_FIELDS)
+            writer.writeheader()
+            for category in categories:
+                font_color = category['font_color'] if category['font_color'] != 'white' else ''
+                for agent in category['agents']:
+                    record = {'category': category['name'], 'color': category['color'],
+                              'font_color': font_color, 'priority': '', 'notes': ''}
+                    record.update(_agent_record(agent))
+                    writer.writerow(record)
+        else:
+            document = {'version': 1, 'categories': []}
+            for category in categories:
+                entry = {'name': category['name'], 'color': category['color']}
+                if category['font_color'] != 'white':
+                    entry['font_color'] = category['font_color']
+                entry['agents'] = [_agent_record(agent) for agent in category['agents']]
+                document['categories'].append(entry)
+            f.write(json.dumps(document, ensure_ascii=False, indent=2) + '\n')
+    os.replace(tmp_path, path)
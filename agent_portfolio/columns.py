@@ -0,0 +1,193 @@
+"""
+Typed numeric columns of the agent catalog
+
+The catalog keeps Time Saved, Business Impact and Build Complexity as text
+('3 hours', 'HIGH', 'Low'). AgentColumns parses them once into compact
+column arrays (hours as doubles, impact and complexity as small integer
+codes, plus the category and priority of every agent), so totals, quick-win
+sums, level counts, per-category rollups and the dashboard's results are
+computed over whole columns instead of re-reading every row. NumPy is used for the rollups when it is installed;
+plain arrays work the same, only slower. It is imported on the first rollup,
+not with the module, so the CSV export and --help keep their fast start.
+"""
+
+import re
+from array import array
+
+from .records import Agent, Category
+
+_numpy = None
+
+# Small integer codes, higher meaning more impact / harder to build; 0 = unknown
+IMPACT_CODES = {'LOW': 1, 'MEDIUM': 2, 'HIGH': 3}
+COMPLEXITY_CODES = {'Low': 1, 'Medium': 2, 'High': 3}
+
+_HOURS = re.compile(r'(\d+(?:\.\d+)?)\s*(min)?', re.IGNORECASE)
+
+
+def _np():
+    """The numpy module, imported on first use, or None when it is not installed"""
+    global _numpy
+    if _numpy is None:
+        try:
+            import numpy
+        except ImportError:  # optional: only speeds up the rollups
+            numpy = False
+        _numpy = numpy
+    return _numpy or None
+
+
+def parse_hours(value):
+    """Hours per week from a Time Saved cell ('3 hours', '1 hour', '30 min', 2.5), or 0.0"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return float(value)
+    match = _HOURS.search(str(value)) if value else None
+    if match is None:
+        return 0.0
+    hours = float(match.group(1))
+    return hours / 60 if match.group(2) else hours
+
+
+def format_hours(hours):
+    """Hours as the dashboards print them: 25, 2.5, 0.333333"""
+    return f'{hours:g}'
+
+
+# Build Complexity codes by lower-cased level: the dashboard's COUNTIF
+# compares text ignoring case
+_COMPLEXITY_BY_TEXT = {level.lower(): code for level, code in COMPLEXITY_CODES.items()}
+
+_NAN = float('nan')
+
+
+def is_number(value):
+    """Whether Excel's AVERAGE() would count the cell: ints and floats, not booleans"""
+    return isinstance(value, (int, float)) and not isinstance(value, bool)
+
+
+def is_filled(value):
+    """Whether COUNTA() would count the cell"""
+    # openpyxl writes '' as an empty string cell, which Excel treats as blank too
+    return value is not None and value != ''
+
+
+class AgentColumns:
+    """Column-oriented numeric view of the agents in a flat ``agents_data`` list.
+
+    Row ``i`` of every column is the ``i``-th agent in render order.
+    ``category`` indexes into ``category_names``. ``priority`` holds numeric
+    Priority cells (NaN otherwise), and ``named`` and ``rated`` flag filled
+    Agent Name and Priority cells, as the dashboard's formulas see them.
+    """
+
+    __slots__ = ('hours', 'impact', 'complexity', 'quick_win', 'category', 'category_names',
+                 'priority', 'named', 'rated')
+
+    def __init__(self):
+        self.hours = array('d')
+        self.impact = array('b')
+        self.complexity = array('b')
+        self.quick_win = array('b')
+        self.category = array('q')
+        self.category_names = []
+        self.priority = array('d')
+        self.named = array('b')
+        self.rated = array('b')
+
+    @classmethod
+    def from_agents_data(cls, agents_data):
+        columns = cls()
+        category = -1
+        for item in agents_data:
+            if isinstance(item, Category):
+                columns.category_names.append(item.name)
+                category += 1
+            elif isinstance(item, Agent):
+                level, priority = item.complexity, item.priority
+                columns.hours.append(parse_hours(item.time_saved))
+                columns.impact.append(IMPACT_CODES.get(item.impact, 0))
+                columns.complexity.append(_COMPLEXITY_BY_TEXT.get(level.lower(), 0) if isinstance(level, str) else 0)
+                columns.quick_win.append(item.quick_win is True)
+                columns.category.append(max(category, 0))
+                columns.priority.append(priority if is_number(priority) else _NAN)
+                columns.named.append(is_filled(item.name))
+                columns.rated.append(is_filled(priority))
+        if category < 0 and columns.hours:
+            columns.category_names.append('')
+        return columns
+
+    def __len__(self):
+        return len(self.hours)
+
+    def total_hours(self):
+        np = _np()
+        if np is not None:
+            return float(np.frombuffer(self.hours, dtype=np.float64).sum()) if self.hours else 0.0
+        return sum(self.hours)
+
+    def quick_win_hours(self):
+        np = _np()
+        if np is not None:
+            if not self.hours:
+                return 0.0
+            hours = np.frombuffer(self.hours, dtype=np.float64)
+            return float(hours[np.frombuffer(self.quick_win, dtype=np.int8).astype(bool)].sum())
+        return sum(hours for hours, quick in zip(self.hours, self.quick_win) if quick)
+
+    def named_count(self):
+        """Agents with a filled Agent Name cell"""
+        return _count(self.named)
+
+    def rated_count(self):
+        """Agents with a filled Priority cell, numeric or not"""
+        return _count(self.rated)
+
+    def average_priority(self):
+        """Mean of the numeric Priority cells, or None when there are none"""
+        np = _np()
+        if np is not None:
+            priority = np.frombuffer(self.priority, dtype=np.float64)
+            numbers = priority[~np.isnan(priority)]
+            return float(numbers.mean()) if numbers.size else None
+        numbers = [value for value in self.priority if value == value]
+        return sum(numbers) / len(numbers) if numbers else None
+
+    def complexity_counts(self):
+        """{Build Complexity level: agents at that level}, unknown levels left out"""
+        return _code_counts(self.complexity, COMPLEXITY_CODES)
+
+    def impact_counts(self):
+        """{Business Impact level: agents at that level}, unknown levels left out"""
+        return _code_counts(self.impact, IMPACT_CODES)
+
+    def hours_by_category(self):
+        """{category name: total hours}, in catalog order"""
+        np = _np()
+        if np is not None and self.hours:
+            totals = np.bincount(np.frombuffer(self.category, dtype=np.int64),
+                                 weights=np.frombuffer(self.hours, dtype=np.float64),
+                                 minlength=len(self.category_names)).tolist()
+        else:
+            totals = [0.0] * len(self.category_names)
+            for category, hours in zip(self.category, self.hours):
+                totals[category] += hours
+        return dict(zip(self.category_names, totals))
+
+
+def _count(flags):
+    np = _np()
+    if np is not None and flags:
+        return int(np.count_nonzero(np.frombuffer(flags, dtype=np.int8)))
+    return sum(flags)
+
+
+def _code_counts(codes, levels):
+    """{level: entries of ``codes`` equal to its code} for a {level: code} mapping"""
+    np = _np()
+    if np is not None and codes:
+        counts = np.bincount(np.frombuffer(codes, dtype=np.int8), minlength=len(levels) + 1).tolist()
+    else:
+        counts = [0] * (len(levels) + 1)
+        for code in codes:
+            counts[code] += 1
+    return {level: counts[code] for level, code in levels.items()}
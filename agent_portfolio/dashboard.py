@@ -0,0 +1,44 @@
+"""
+Summary dashboard values
+
+The dashboard next to the agent table is made of formulas over the data rows.
+dashboard_values() works out what Excel would show for each of them, so the
+results can be stored as cached values and read back without recalculating
+(openpyxl ``data_only=True``, pandas). Every result is a rollup over the
+typed columns of agent_portfolio.columns, so no catalog item is read again.
+"""
+
+from .columns import AgentColumns, is_filled
+
+# Formula errors are stored as cells of type "e"
+DIV_ZERO = '#DIV/0!'
+
+# Dashboard cells holding a formula result
+TOTAL_AGENTS = 'M3'
+RATED = 'M5'
+AVERAGE_PRIORITY = 'M6'
+COMPLEXITY_COUNTS = {'M13': 'Low', 'M14': 'Medium', 'M15': 'High'}
+
+
+def dashboard_values(agents_data, columns=None):
+    """Return {cell: value} for every dashboard formula over ``agents_data``.
+
+    ``agents_data`` is the flat record list rendered from row 7 down and
+    ``columns`` an AgentColumns over it, built here when not given. Each
+    value matches the formula's Excel result: COUNTA counts filled cells,
+    AVERAGE only sees numbers and COUNTIF compares text ignoring case.
+    """
+    if columns is None:
+        columns = AgentColumns.from_agents_data(agents_data)
+    average = columns.average_priority()
+    values = {
+        TOTAL_AGENTS: columns.named_count(),
+        # Category labels sit in column A of their merged row
+        RATED: sum(map(is_filled, columns.category_names)) + columns.rated_count(),
+        AVERAGE_PRIORITY: DIV_ZERO if average is None else average,
+    }
+    complexity = columns.complexity_counts()
+    for cell, level in COMPLEXITY_COUNTS.items():
+        values[cell] = complexity[level]
+
+    return values
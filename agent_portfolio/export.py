@@ -0,0 +1,218 @@
+"""
+Command line entry point: render the portfolio as xlsx, csv, jsonl or parquet
+
+    python -m agent_portfolio                                  # sheets/Agent_Portfolio.xlsx
+    python -m agent_portfolio -f csv -f jsonl --area Regulatory
+    python -m agent_portfolio -f parquet --output-dir exports/
+
+Only the backend of a chosen format is imported: openpyxl (through
+create_agents_excel) for xlsx, pyarrow for parquet. CSV and JSON lines, like
+--help, need nothing beyond the standard library and the catalog, so they
+start in a few tens of milliseconds for cron jobs and webhooks.
+"""
+
+import argparse
+import csv
+import json
+import os
+import sys
+
+from .catalog import DEFAULT_CATALOG_PATH, load_catalog
+from .layout import COLORS
+from .records import SPACING, Agent, Category, filter_records
+from .views import VIEWS
+
+FORMATS = ('xlsx', 'csv', 'jsonl', 'parquet')
+DEFAULT_OUTPUT_DIR = './sheets'
+BASENAME = 'Agent_Portfolio'
+
+# One flat row per agent
+EXPORT_FIELDS = ['category'] + list(Agent.FIELDS)
+
+
+def catalog_records(categories, colors=None):
+    """Flatten load_catalog() output into Category/Agent/Spacing records.
+
+    Category colors stay palette keys unless ``colors`` maps them to hex codes.
+    """
+    records = []
+    for category in categories:
+        color, font_color = category['color'], category['font_color']
+        if colors is not None:
+            color, font_color = colors[color], colors[font_color]
+        records.append(Category(category['name'], color, font_color))
+        records.extend(category['agents'])
+        records.append(SPACING)
+    return records
+
+
+def iter_export_rows(records):
+    """Yield one {field: value} dict per agent, in EXPORT_FIELDS order"""
+    category = ''
+    for item in records:
+        if isinstance(item, Category):
+            category = item.name
+        elif isinstance(item, Agent):
+            row = {'category': category}
+            row.update(zip(Agent.FIELDS, item.cells()))
+            yield row
+
+
+def _atomic_open(path, mode):
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    if 'b' in mode:
+        return tmp_path, open(tmp_path, mode)
+    return tmp_path, open(tmp_path, mode, encoding='utf-8', newline='')
+
+
+def write_csv(records, path):
+    tmp_path, f = _atomic_open(path, 'w')
+    with f:
+        writer = csv.DictWriter(f, EXPORT_FIELDS)
+        writer.writeheader()
+        writer.writerows(iter_export_rows(records))
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_jsonl(records, path):
+    tmp_path, f = _atomic_open(path, 'w')
+    with f:
+        for row in iter_export_rows(records):
+            f.write(json.dumps(row, ensure_ascii=False) + '\n')
+    os.replace(tmp_path, path)
+    return path
+
+
+def write_parquet(records, path):
+    try:
+        import pyarrow as pa
+        import pyarrow.parquet as pq
+    except ImportError:
+        raise RuntimeError('parquet output needs pyarrow (pip install pyarrow)') from None
+    columns = {field: [] for field in EXPORT_FIELDS}
+    for row in iter_export_rows(records):
+        for field, value in row.items():
+            columns[field].append(value)
+    types = {field: pa.bool_() if field == 'quick_win' else pa.string() for field in EXPORT_FIELDS}
+    # Priorities typed in by hand may be numbers; keep the column uniformly text
+    columns['priority'] = [value if isinstance(value, str) else str(value) for value in columns['priority']]
+    table = pa.table({field: pa.array(values, type=types[field]) for field, values in columns.items()})
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    pq.write_table(table, tmp_path)
+    os.replace(tmp_path, path)
+    return path
+
+
+WRITERS = {'csv': write_csv, 'jsonl': write_jsonl, 'parquet': write_parquet}
+
+
+def export(formats=('xlsx',), output_dir=DEFAULT_OUTPUT_DIR, catalog_path=DEFAULT_CATALOG_PATH,
+           areas=None, categories=None, output=None, usage=None, **xlsx_options):
+    """Write the portfolio in each of ``formats`` and return the paths written.
+
+    Files are named Agent_Portfolio.<format> in ``output_dir``; ``output`` sets
+    the full path instead when a single format is requested. ``usage`` (from
+    agent_portfolio.usage.read_usage()) replaces the catalog's Time Saved/Week
+    and Business Impact with measured values. ``xlsx_options`` are passed on
+    to create_agent_portfolio_excel().
+    """
+    if output is not None and len(formats) > 1:
+        raise ValueError('an explicit output path needs exactly one format')
+    os.makedirs(output_dir if output is None else os.path.dirname(output) or '.', exist_ok=True)
+
+    records = filter_records(catalog_records(load_catalog(catalog_path), COLORS), areas, categories)
+    if usage is not None:
+        from .usage import apply_usage
+
+        records = apply_usage(records, usage)
+    paths = []
+    for fmt in formats:
+        path = output or os.path.join(output_dir, f'{BASENAME}.{fmt}')
+        if fmt == 'xlsx':
+            import create_agents_excel as generator
+
+            generator.create_agent_portfolio_excel(agents_data=records, output_path=path, **xlsx_options)
+        else:
+            WRITERS[fmt](records, path)
+        paths.append(path)
+    return paths
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(prog='python -m agent_portfolio',
+                                     description='Render the AI Agent Portfolio from the agent catalog')
+    parser.add_argument('-f', '--format', action='append', choices=FORMATS, dest='formats',
+                        help='output format, repeatable (default: xlsx)')
+    parser.add_argument('-o', '--output-dir', default=DEFAULT_OUTPUT_DIR,
+                        help='directory for Agent_Portfolio.<format> (default: %(default)s)')
+    parser.add_argument('--output', help='exact output path (single format only)')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--area', action='append', dest='areas', help='only agents of this area, repeatable')
+    parser.add_argument('--category', action='append', dest='categories',
+                        help='only this category (full name), repeatable')
+    parser.add_argument('--usage-db', metavar='URL',
+                        help='fill Time Saved/Week and Business Impact from platform usage in this database')
+    parser.add_argument('--usage-map', metavar='FILE', help='source-to-agent mapping for --usage-db')
+    xlsx = parser.add_argument_group('xlsx options')
+    xlsx.add_argument('--streaming', action='store_true', help='write-only mode for very large catalogs')
+    xlsx.add_argument('--incremental', action='store_true', help='reuse unchanged sheets from the previous file')
+    xlsx.add_argument('--title', help='title banner of the Agent Portfolio sheet')
+    xlsx.add_argument('--top-n', type=int, help='number of top priorities to list')
+    xlsx.add_argument('--view', action='append', choices=VIEWS, dest='views',
+                      help='derived sheet to include, repeatable (default: quick-wins)')
+    xlsx.add_argument('--roadmap-plan', metavar='PLAN',
+                      help='schedule the Build Roadmap from this plan file (see agent_portfolio.roadmap)')
+    xlsx.add_argument('--scenarios', action='store_true',
+                      help='add a Scenarios sheet of simulated time savings per roadmap phase (needs numpy)')
+    xlsx.add_argument('--scenario-runs', type=int, metavar='RUNS',
+                      help='simulated roadmaps behind --scenarios (default: 100000)')
+    xlsx.add_argument('--backend', choices=('openpyxl', 'native'), default='openpyxl',
+                      help='workbook writer; native is much faster on large catalogs (default: %(default)s)')
+    xlsx.add_argument('--workers', type=int,
+                      help='render the sheets on this many processes (native backend only)')
+    xlsx.add_argument('--compression', choices=('fast', 'balanced', 'smallest'), default='balanced',
+                      help='zip profile: fast for local handoffs, smallest for mailed copies (default: %(default)s)')
+    parser.add_argument('-q', '--quiet', action='store_true', help='print nothing on success')
+    args = parser.parse_args(argv)
+
+    formats = args.formats or ['xlsx']
+    xlsx_options = {'streaming': args.streaming, 'incremental': args.incremental, 'verbose': False,
+                    'backend': args.backend, 'compression': args.compression}
+    if args.title is not None:
+        xlsx_options['title'] = args.title
+    if args.top_n is not None:
+        xlsx_options['top_n'] = args.top_n
+    if args.workers:
+        xlsx_options['workers'] = args.workers
+    if args.scenarios or args.scenario_runs:
+        xlsx_options['scenarios'] = {'runs': args.scenario_runs} if args.scenario_runs else {}
+    if args.views:
+        xlsx_options['views'] = tuple(VIEWS[name] for name in dict.fromkeys(args.views))
+
+    try:
+        if args.roadmap_plan:
+            # Imported on request only, like the format backends, to keep the fast start
+            from .roadmap import load_plan
+            xlsx_options['roadmap_plan'] = load_plan(args.roadmap_plan)
+        usage = None
+        if args.usage_db:
+            if not args.usage_map:
+                raise ValueError('--usage-db needs --usage-map')
+            from .usage import connect, load_mapping, read_usage
+
+            connection = connect(args.usage_db)
+            try:
+                usage = read_usage(connection, load_mapping(args.usage_map))
+            finally:
+                connection.close()
+        paths = export(formats, args.output_dir, args.catalog, args.areas, args.categories,
+                       args.output, usage, **xlsx_options)
+    except (RuntimeError, ValueError, OSError) as e:
+        print(f'❌ {e}', file=sys.stderr)
+        return 2
+
+    if not args.quiet:
+        for path in paths:
+            print(f"✅ {os.path.abspath(path)}")
+    return 0
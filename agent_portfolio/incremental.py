@@ -0,0 +1,66 @@
+"""
+Incremental workbook regeneration
+
+A workbook written in incremental mode carries a manifest of input
+fingerprints (one per sheet, plus one for the shared style table) in its zip
+archive comment. On the next run, a sheet whose fingerprint is unchanged is
+not rendered again: its XML part is copied from the previous file while the
+rest of the package is rebuilt around it (see agent_portfolio.package).
+Excel and other tools drop the archive comment when they rewrite a file, so
+an edited workbook is always regenerated in full.
+"""
+
+import hashlib
+import json
+import zipfile
+
+MANIFEST_FORMAT = 'agent-portfolio-fingerprints/1'
+
+
+def fingerprint(parts, version=''):
+    """SHA-256 over the repr of each part, fed in one at a time"""
+    digest = hashlib.sha256(version.encode('utf-8'))
+    for part in parts:
+        digest.update(repr(part).encode('utf-8'))
+        digest.update(b'\0')
+    return digest.hexdigest()
+
+
+def sheet_part(index):
+    """Zip member name openpyxl uses for the ``index``-th worksheet (1-based)"""
+    return f'xl/worksheets/sheet{index}.xml'
+
+
+def read_manifest(path):
+    """Return the fingerprints stored in a previous output, or {} if there are none"""
+    try:
+        with zipfile.ZipFile(path) as archive:
+            comment = archive.comment
+    except (OSError, zipfile.BadZipFile):
+        return {}
+    try:
+        manifest = json.loads(comment.decode('utf-8'))
+    except ValueError:
+        return {}
+    if not isinstance(manifest, dict) or manifest.get('format') != MANIFEST_FORMAT:
+        return {}
+    return manifest.get('fingerprints', {})
+
+
+def reusable_sheets(previous, current, titles):
+    """Titles whose rendered XML can be taken from the previous output.
+
+    Sheet parts reference the shared style table by index, so nothing is
+    reused unless the style fingerprint matches as well.
+    """
+    if not previous or previous.get('styles') != current['styles']:
+        return set()
+    return {title for title in titles if previous.get(title) == current[title]}
+
+
+def manifest_comment(fingerprints):
+    """Archive comment carrying ``fingerprints`` for the next run's read_manifest()"""
+    return json.dumps(
+        {'format': MANIFEST_FORMAT, 'fingerprints': fingerprints},
+        sort_keys=True,
+    ).encode('utf-8')
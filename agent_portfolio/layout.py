@@ -0,0 +1,98 @@
+"""
+Portfolio layout shared by every renderer
+
+The palette, column headers, sheet names and banners used by
+create_agents_excel.py (Excel) and agent_portfolio.sheets (Google Sheets),
+mirroring agents-sheet.py. Colors are hex codes without the leading '#'.
+"""
+
+# Colors (hex codes from the original script)
+COLORS = {
+    'purpleGrad': '8B5CF6',
+    'lightPurple': 'F3E8FF',
+    'lightBlue': 'DBEAFE',
+    'darkGray': '374151',
+    'white': 'FFFFFF',
+    'purple': 'A78BFA',
+    'blue': '60A5FA',
+    'green': '34D399',
+    'orange': 'FB923C',
+    'cyan': '22D3EE',
+    'pink': 'F472B6',
+    'yellow': 'FBBF24',
+    'red': 'EF4444',
+    'indigo': '6366F1',
+    'lightGray': 'E5E7EB',
+    'black': '000000',
+    'amber': 'F59E0B',
+    'gray700': '6B7280',
+    'blue500': '3B82F6',
+    'green500': '10B981',
+    'red600': 'DC2626'
+}
+
+# Agent Portfolio / Quick Wins columns
+HEADERS = ['Priority', 'Area', 'Agent Name', 'What It Does', 'Time Saved/Week',
+           'Business Impact', 'Build Complexity', 'Status', 'Your Notes', 'Quick Win?']
+
+# Build Roadmap columns
+R_HEADERS = ['Phase', 'Agent Name', 'Priority Score', 'Time Saved', 'Build Time', 'Dependencies',
+             'Start Date', 'Launch Date', 'Owner']
+
+# Scenarios columns, one row per point of the roadmap (agent_portfolio.scenarios)
+S_HEADERS = ['Scenario', 'Agents Live (P50)', 'P10 hrs/week', 'P50 hrs/week', 'P90 hrs/week',
+             'Added (P50)', 'Your Week (P50)', 'Chance of Target (%)']
+
+# Title banner of the Agent Portfolio sheet
+DEFAULT_TITLE = "🤖 MADHAVAN'S AI AGENT FORCE\nIntelligent Agents to 10x Your\nExecutive Leverage"
+
+# Build Roadmap phase banners: (label, color key)
+ROADMAP_PHASES = [
+    ('PHASE 1: FOUNDATIONS (Weeks 1-4)\nQuick wins with immediate impact', 'blue'),
+    ('PHASE 2: INTELLIGENCE (Weeks 5-12)\nStrategic and analytical agents', 'cyan'),
+    ('PHASE 3: AUTOMATION (Weeks 13-24)\nProcess optimization agents', 'green'),
+]
+
+# Last week of each phase, as the banners state; the last phase also takes
+# whatever a schedule (agent_portfolio.roadmap) launches after it
+ROADMAP_PHASE_WEEKS = (4, 12, 24)
+
+# Rows under each phase banner; Phase 1 grows to fit the top-N agents
+ROADMAP_PHASE_ROWS = 5
+
+SHEET_MAIN = 'Agent Portfolio'
+SHEET_QUICK = 'Quick Wins'
+SHEET_ROADMAP = 'Build Roadmap'
+SHEET_SCENARIOS = 'Scenarios'
+SHEET_LISTS = 'Lists'
+
+# Agent rows start right below the header row on the main sheet
+FIRST_DATA_ROW = 7
+
+# The summary dashboard starts in this column (L), next to the agent table
+DASHBOARD_COLUMN = 12
+
+# Color coding by value, as agents-sheet.py applies it with conditional
+# format rules: (column header, match, value, fill color key, font color key,
+# bold). 'contains' matches text containing the value, 'equals' the whole
+# text.
+VALUE_COLORS = [
+    ('Priority', 'contains', '5', 'red600', 'white', True),
+    ('Priority', 'contains', '4', 'amber', 'white', True),
+    ('Priority', 'contains', '3', 'blue500', 'white', False),
+    ('Priority', 'contains', '2', 'green500', 'white', False),
+    ('Priority', 'contains', '1', 'gray700', 'white', False),
+    ('Business Impact', 'equals', 'HIGH', 'green500', 'white', True),
+    ('Business Impact', 'equals', 'MEDIUM', 'amber', 'black', False),
+    ('Business Impact', 'equals', 'LOW', 'gray700', 'white', False),
+    ('Build Complexity', 'equals', 'Low', 'green500', 'white', False),
+    ('Build Complexity', 'equals', 'Medium', 'amber', 'black', False),
+    ('Build Complexity', 'equals', 'High', 'red', 'white', False),
+    ('Status', 'equals', 'Complete', 'green500', 'white', True),
+    ('Status', 'equals', 'In Progress', 'blue500', 'white', True),
+    ('Status', 'equals', 'Planning', 'amber', 'black', False),
+    ('Status', 'equals', 'Not Started', 'lightGray', 'black', False),
+]
+
+# Columns of the Quick Wins sheet that keep their color coding
+QUICK_VALUE_COLUMNS = ('Priority', 'Status')
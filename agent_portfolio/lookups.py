@@ -0,0 +1,103 @@
+"""
+Validation lists on a hidden lookup sheet
+
+Dropdown validations used to carry their values inline
+('"5 - Critical,4 - High,..."'), which Excel caps at 255 characters. Each
+list now fills one column of the hidden Lists sheet instead, under a
+workbook-level defined name (PriorityList, AreaList, ...). A validation is
+then one small object per column range, however many values its list holds:
+areas, owners from the roadmap plan. Validations cover the data rows only,
+not the banner rows between them (see row_spans()). Used by
+create_agents_excel.py and agent_portfolio.sheets alike.
+
+The roadmap's Dependencies column is not validated: it lists several agent
+names in one cell, which no single-value dropdown accepts.
+"""
+
+from itertools import zip_longest
+
+from .catalog import COMPLEXITY_LEVELS, IMPACT_LEVELS, PRIORITIES, STATUSES
+from .layout import SHEET_LISTS, SHEET_MAIN, SHEET_ROADMAP
+
+# Validated columns: (sheet, column header, defined name of the list)
+VALIDATIONS = [
+    (SHEET_MAIN, 'Priority', 'PriorityList'),
+    (SHEET_MAIN, 'Area', 'AreaList'),
+    (SHEET_MAIN, 'Business Impact', 'ImpactList'),
+    (SHEET_MAIN, 'Build Complexity', 'ComplexityList'),
+    (SHEET_MAIN, 'Status', 'StatusList'),
+    (SHEET_ROADMAP, 'Owner', 'OwnerList'),
+]
+
+
+def _column_letter(column):
+    letters = ''
+    while column:
+        column, remainder = divmod(column - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+class LookupList:
+    """One column of the Lists sheet: a header in row 1, then the values"""
+
+    __slots__ = ('name', 'header', 'values', 'column')
+
+    def __init__(self, name, header, values, column):
+        self.name = name
+        self.header = header
+        self.values = values
+        self.column = column
+
+    @property
+    def ref(self):
+        """Absolute reference to the values, as the defined name holds it"""
+        letter = _column_letter(self.column)
+        return f'{SHEET_LISTS}!${letter}$2:${letter}${len(self.values) + 1}'
+
+    def __repr__(self):
+        return f'LookupList({self.name!r}, {self.header!r}, {self.values!r}, {self.column})'
+
+
+def lookup_lists(index, owners=()):
+    """The validation lists for a catalog, by defined name, in Lists column order.
+
+    ``index`` is a CatalogIndex over the catalog; ``owners`` come from the
+    roadmap plan. Empty lists are left out, along with their validations.
+    """
+    candidates = [
+        ('PriorityList', 'Priority', PRIORITIES),
+        ('ImpactList', 'Business Impact', IMPACT_LEVELS),
+        ('ComplexityList', 'Build Complexity', COMPLEXITY_LEVELS),
+        ('StatusList', 'Status', STATUSES),
+        ('AreaList', 'Area', [area for area in index.keys['area'] if area]),
+        ('OwnerList', 'Owner', list(dict.fromkeys(owners))),
+    ]
+    lists = {}
+    for name, header, values in candidates:
+        if values:
+            lists[name] = LookupList(name, header, list(values), len(lists) + 1)
+    return lists
+
+
+def lookup_rows(lists):
+    """Rows of the Lists sheet, starting at row 1"""
+    yield [lookup.header for lookup in lists.values()]
+    yield from map(list, zip_longest(*(lookup.values for lookup in lists.values())))
+
+
+def row_spans(rows):
+    """(first, last) of each run of consecutive numbers in the sorted ``rows``"""
+    spans = []
+    for row in rows:
+        if spans and spans[-1][1] == row - 1:
+            spans[-1][1] = row
+        else:
+            spans.append([row, row])
+    return [tuple(span) for span in spans]
+
+
+def validations(sheet, headers, lists):
+    """(column number, LookupList) for each validated column of ``sheet`` whose list exists"""
+    return [(headers.index(header) + 1, lists[name])
+            for title, header, name in VALIDATIONS if title == sheet and name in lists]
@@ -0,0 +1,584 @@
+"""
+Native SpreadsheetML writer
+
+An alternative to openpyxl for the portfolio layout, selected with
+create_agent_portfolio_excel(backend='native'). Rows are serialized straight
+to XML as they are appended: there is no per-cell object, no per-cell style
+hashing, and every string goes through one sharedStrings table, so the area,
+status, impact and complexity values that repeat on every row are stored
+once. The style sheet is precomputed from the named styles registered on the
+workbook before any row is written.
+
+Only what create_agents_excel.py uses is supported: merged cells, solid
+fills, fonts, alignment, column widths, row heights, list data validations,
+conditional format rules, formulas (with cached results) and string, number
+and boolean values. The rows of each sheet are spooled to a temporary file,
+which keeps memory flat for very large catalogs, and the package is
+assembled in one pass on save().
+
+NativeWorkbook and NativeSheet mimic the parts of the openpyxl write-only
+API the row generators rely on (create_sheet, append, merge_cells,
+column_dimensions, row_dimensions, data_validations, conditional_formatting).
+"""
+
+import os
+import re
+import shutil
+import tempfile
+import zipfile
+import zlib
+from collections import defaultdict
+from functools import lru_cache
+from itertools import groupby
+from operator import itemgetter
+from xml.sax.saxutils import escape, quoteattr
+
+from .package import DEFAULT_COMPRESSION, cached_value, compression_profile
+
+# Sheet rows stay in memory up to this size, then spill to disk
+SPOOL_BYTES = 4 * 2 ** 20
+
+_MAIN_NS = 'http://schemas.openxmlformats.org/spreadsheetml/2006/main'
+_REL_NS = 'http://schemas.openxmlformats.org/officeDocument/2006/relationships'
+_PACKAGE_REL_NS = 'http://schemas.openxmlformats.org/package/2006/relationships'
+_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.'
+_XML_HEADER = '<?xml version="1.0" encoding="UTF-8" standalone="yes"?>\n'
+_BUILTIN_NORMAL = ' builtinId="0"'
+_TAB_SELECTED = ' tabSelected="1"'
+
+# Same rule as openpyxl: control characters are not allowed in XML 1.0
+_ILLEGAL_CHARACTERS = re.compile(r'[\000-\010]|[\013-\014]|[\016-\037]')
+
+
+@lru_cache(maxsize=None)
+def column_letter(index):
+    """'A' for 1, 'Z' for 26, 'AA' for 27, ..."""
+    letters = ''
+    while index:
+        index, remainder = divmod(index - 1, 26)
+        letters = chr(65 + remainder) + letters
+    return letters
+
+
+def column_index(letters):
+    index = 0
+    for letter in letters:
+        index = index * 26 + ord(letter) - 64
+    return index
+
+
+class NativeCell:
+    """A value with a named style, as appended to a NativeSheet"""
+
+    __slots__ = ('value', 'style')
+
+    def __init__(self, value=None, style=None):
+        self.value = value
+        self.style = style
+
+
+class _ConditionalFormats:
+    """(range, rule) pairs of a sheet; rules are numbered by priority as added, like openpyxl"""
+
+    def __init__(self):
+        self.rules = []
+
+    def add(self, ref, rule):
+        rule.priority = len(self.rules) + 1
+        self.rules.append((ref, rule))
+
+    def __len__(self):
+        return len(self.rules)
+
+
+class _Dimension:
+    __slots__ = ('width', 'height')
+
+    def __init__(self):
+        self.width = None
+        self.height = None
+
+
+def _color_xml(tag, color):
+    if color is None:
+        return ''
+    if color.type == 'theme':
+        return f'<{tag} theme="{color.theme}"/>'
+    if color.type == 'indexed':
+        return f'<{tag} indexed="{color.indexed}"/>'
+    return f'<{tag} rgb="{color.rgb}"/>'
+
+
+def _font_xml(font):
+    parts = ['<font>']
+    if font.name:
+        parts.append(f'<name val={quoteattr(font.name)}/>')
+    if font.family is not None:
+        parts.append(f'<family val="{font.family:g}"/>')
+    if font.b:
+        parts.append('<b val="1"/>')
+    if font.i:
+        parts.append('<i val="1"/>')
+    parts.append(_color_xml('color', font.color))
+    if font.sz is not None:
+        parts.append(f'<sz val="{font.sz:g}"/>')
+    if font.scheme:
+        parts.append(f'<scheme val="{font.scheme}"/>')
+    parts.append('</font>')
+    return ''.join(parts)
+
+
+def _fill_xml(fill):
+    if fill is None or not fill.fill_type:
+        return '<fill><patternFill/></fill>'
+    return (f'<fill><patternFill patternType="{fill.fill_type}">'
+            f'{_color_xml("fgColor", fill.fgColor)}{_color_xml("bgColor", fill.bgColor)}'
+            '</patternFill></fill>')
+
+
+def _alignment_xml(alignment):
+    if alignment is None:
+        return ''
+    attributes = ''
+    if alignment.horizontal:
+        attributes += f' horizontal="{alignment.horizontal}"'
+    if alignment.vertical:
+        attributes += f' vertical="{alignment.vertical}"'
+    if alignment.wrap_text:
+        attributes += ' wrapText="1"'
+    return f'<alignment{attributes}/>' if attributes else ''
+
+
+class _StyleSheet:
+    """Fonts, fills and cell formats of the named styles, numbered on registration"""
+
+    _DEFAULT_FONT = ('<font><name val="Calibri"/><family val="2"/><color theme="1"/><sz val="11"/>'
+                     '<scheme val="minor"/></font>')
+
+    def __init__(self):
+        self.fonts = {self._DEFAULT_FONT: 0}
+        self.fills = {'<fill><patternFill/></fill>': 0, '<fill><patternFill patternType="gray125"/></fill>': 1}
+        # (name, fontId, fillId, alignment xml); index 0 is Normal
+        self.formats = [('Normal', 0, 0, '')]
+        self.index = {}
+        self.dxfs = {}
+        self._xml = None
+
+    def copy(self):
+        """An independent copy, e.g. of a prebuilt skeleton's style sheet"""
+        styles = _StyleSheet.__new__(_StyleSheet)
+        styles.fonts = dict(self.fonts)
+        styles.fills = dict(self.fills)
+        styles.formats = list(self.formats)
+        styles.index = dict(self.index)
+        styles.dxfs = dict(self.dxfs)
+        styles._xml = self._xml
+        return styles
+
+    def dxf(self, style):
+        """Index of a conditional format's differential style (font and fill)"""
+        xml = f'<dxf>{_font_xml(style.font) if style.font else ""}{_fill_xml(style.fill) if style.fill else ""}</dxf>'
+        return self.dxfs.setdefault(xml, len(self.dxfs))
+
+    def add(self, style):
+        font = self.fonts.setdefault(_font_xml(style.font), len(self.fonts))
+        fill = self.fills.setdefault(_fill_xml(style.fill), len(self.fills))
+        self.index[style.name] = len(self.formats)
+        self.formats.append((style.name, font, fill, _alignment_xml(style.alignment)))
+
+    def xml(self):
+        """styles.xml, serialized again only when a style was added since the last call"""
+        state = (len(self.fonts), len(self.fills), len(self.formats), len(self.dxfs))
+        if self._xml is None or self._xml[0] != state:
+            self._xml = (state, self._serialize())
+        return self._xml[1]
+
+    def _serialize(self):
+        def xf(index, font, fill, alignment, cell):
+            attributes = f'numFmtId="0" fontId="{font}" fillId="{fill}" borderId="0"'
+            if cell:
+                attributes += f' xfId="{index}"'
+            if font:
+                attributes += ' applyFont="1"'
+            if fill:
+                attributes += ' applyFill="1"'
+            if alignment:
+                return f'<xf {attributes} applyAlignment="1">{alignment}</xf>'
+            return f'<xf {attributes}/>'
+
+        formats = [(index, font, fill, alignment) for index, (_, font, fill, alignment) in enumerate(self.formats)]
+        return ''.join([
+            _XML_HEADER, f'<styleSheet xmlns="{_MAIN_NS}">',
+            f'<fonts count="{len(self.fonts)}">', *self.fonts, '</fonts>',
+            f'<fills count="{len(self.fills)}">', *self.fills, '</fills>',
+            '<borders count="1"><border><left/><right/><top/><bottom/><diagonal/></border></borders>',
+            f'<cellStyleXfs count="{len(formats)}">', *(xf(*f, False) for f in formats), '</cellStyleXfs>',
+            f'<cellXfs count="{len(formats)}">', *(xf(*f, True) for f in formats), '</cellXfs>',
+            f'<cellStyles count="{len(formats)}">',
+            *(f'<cellStyle name={quoteattr(name)} xfId="{index}"{_BUILTIN_NORMAL if index == 0 else ""}/>'
+              for index, (name, *_) in enumerate(self.formats)),
+            f'</cellStyles><dxfs count="{len(self.dxfs)}">', *self.dxfs, '</dxfs>',
+            '<tableStyles count="0"/></styleSheet>',
+        ])
+
+
+class _SharedStrings:
+    """Every distinct string written, numbered in order of first use.
+
+    A frozen table takes no new strings: it returns None for them, and the
+    sheet writes them inline instead.
+    """
+
+    def __init__(self):
+        self.index = {}
+        self.count = 0
+        self.frozen = False
+
+    def __call__(self, text):
+        index = self.index.get(text)
+        if index is None:
+            if _ILLEGAL_CHARACTERS.search(text):
+                raise ValueError(f'{text!r} contains characters that cannot be written to a worksheet')
+            if self.frozen:
+                return None
+            index = self.index[text] = len(self.index)
+        self.count += 1
+        return index
+
+    def write(self, stream):
+        stream.write(f'{_XML_HEADER}<sst xmlns="{_MAIN_NS}" count="{self.count}" '
+                     f'uniqueCount="{len(self.index)}">'.encode('utf-8'))
+        for text in self.index:
+            space = ' xml:space="preserve"' if text != text.strip() else ''
+            stream.write(f'<si><t{space}>{escape(text)}</t></si>'.encode('utf-8'))
+        stream.write(b'</sst>')
+
+
+def frozen_strings(texts):
+    """A frozen shared string table holding ``texts``, numbered in order of first appearance.
+
+    Sheets rendered in separate processes all start from the same one, so
+    their string indexes agree without merging tables afterwards.
+    """
+    strings = _SharedStrings()
+    for text in texts:
+        strings(text)
+    strings.count = 0
+    strings.frozen = True
+    return strings
+
+
+def _inline_string(ref, style, text):
+    space = ' xml:space="preserve"' if text != text.strip() else ''
+    return f'<c r="{ref}"{style} t="inlineStr"><is><t{space}>{escape(text)}</t></is></c>'
+
+
+class RenderedPart:
+    """A worksheet part already deflated to a file, copied into the package as it is"""
+
+    __slots__ = ('path', 'crc', 'size', 'compress_size')
+
+    def __init__(self, path, crc, size, compress_size):
+        self.path = path
+        self.crc = crc
+        self.size = size
+        self.compress_size = compress_size
+
+
+class _DeflateWriter:
+    """Binary stream that deflates what is written to it, as a zip member would be stored"""
+
+    def __init__(self, f, level=zlib.Z_DEFAULT_COMPRESSION):
+        self.f = f
+        self.crc = 0
+        self.size = 0
+        self.compress_size = 0
+        # Raw deflate, as zipfile.ZIP_DEFLATED writes it
+        self._compressor = zlib.compressobj(level, zlib.DEFLATED, -15)
+
+    def write(self, data):
+        self.crc = zlib.crc32(data, self.crc)
+        self.size += len(data)
+        self._out(self._compressor.compress(data))
+
+    def close(self):
+        self._out(self._compressor.flush())
+
+    def _out(self, data):
+        self.compress_size += len(data)
+        self.f.write(data)
+
+
+def render_part(ws, directory, selected=False, compression=DEFAULT_COMPRESSION):
+    """Serialize and deflate the worksheet part of ``ws`` into a file in ``directory``.
+
+    Returns a RenderedPart; setting it as ``rendered`` on the same sheet of
+    another NativeWorkbook has that workbook's save() copy it in, so sheets
+    can be rendered and compressed in other processes. The part is deflated
+    at the level of the ``compression`` profile.
+    """
+    level = compression_profile(compression).level
+    fd, path = tempfile.mkstemp(suffix='.xml.deflate', dir=directory)
+    with os.fdopen(fd, 'wb') as f:
+        writer = _DeflateWriter(f, level)
+        ws.write(writer, selected)
+        writer.close()
+    return RenderedPart(path, writer.crc, writer.size, writer.compress_size)
+
+
+def _write_rendered(archive, name, part):
+    """Add ``part`` to ``archive`` as member ``name`` without compressing it again.
+
+    zipfile has no public way to add compressed data, so the local header is
+    written here and the member registered the way ZipFile.open() does.
+    """
+    info = zipfile.ZipInfo(name)
+    info.compress_type = zipfile.ZIP_DEFLATED
+    info.CRC, info.file_size, info.compress_size = part.crc, part.size, part.compress_size
+    info.header_offset = archive.fp.tell()
+    archive.fp.write(info.FileHeader())
+    with open(part.path, 'rb') as f:
+        shutil.copyfileobj(f, archive.fp)
+    archive.filelist.append(info)
+    archive.NameToInfo[name] = info
+    archive.start_dir = archive.fp.tell()
+
+
+class NativeSheet:
+    """A worksheet whose rows are serialized as they are appended.
+
+    Set ``column_dimensions``/``row_dimensions`` before the rows they apply to.
+    ``cached_values`` ({cell: result}) are stored next to the formulas at
+    those cells, so readers see results without recalculating. A sheet whose
+    ``rendered`` part was produced elsewhere (see render_part()) is saved
+    from that part instead of its own rows.
+    """
+
+    def __init__(self, workbook, title):
+        self.workbook = workbook
+        self.title = title
+        self.column_dimensions = defaultdict(_Dimension)
+        self.row_dimensions = defaultdict(_Dimension)
+        self.merged_cells = []
+        self.data_validations = []
+        self.conditional_formatting = _ConditionalFormats()
+        self.cached_values = {}
+        self.sheet_state = 'visible'
+        self.rendered = None
+        self._rows = tempfile.SpooledTemporaryFile(SPOOL_BYTES)
+        self._row = 0
+
+    def merge_cells(self, ref):
+        self.merged_cells.append(ref)
+
+    def append(self, values):
+        self._row += 1
+        row = self._row
+        styles = self.workbook.styles.index
+        strings = self.workbook.shared_strings
+        cells = []
+        for col_num, value in enumerate(values, 1):
+            style = ''
+            if type(value) is NativeCell:
+                if value.style is not None:
+                    style = f' s="{styles[value.style]}"'
+                value = value.value
+            if value is None:
+                if style:
+                    cells.append(f'<c r="{column_letter(col_num)}{row}"{style}/>')
+                continue
+            ref = f'{column_letter(col_num)}{row}'
+            if type(value) is str:
+                if value.startswith('=') and len(value) > 1:
+                    cells.append(self._formula(ref, style, value))
+                elif not value:
+                    # As openpyxl writes it; an empty shared string reads back as no value
+                    cells.append(f'<c r="{ref}"{style} t="inlineStr"/>')
+                else:
+                    index = strings(value)
+                    cells.append(f'<c r="{ref}"{style} t="s"><v>{index}</v></c>' if index is not None
+                                 else _inline_string(ref, style, value))
+            elif type(value) is bool:
+                cells.append(f'<c r="{ref}"{style} t="b"><v>{value:d}</v></c>')
+            elif isinstance(value, (int, float)):
+                cells.append(f'<c r="{ref}"{style} t="n"><v>{value!r}</v></c>')
+            else:
+                value = str(value)
+                index = strings(value)
+                cells.append(f'<c r="{ref}"{style} t="s"><v>{index}</v></c>' if index is not None
+                             else _inline_string(ref, style, value))
+
+        height = self.row_dimensions[row].height if row in self.row_dimensions else None
+        if not cells and height is None:
+            return
+        attributes = f' ht="{height:g}" customHeight="1"' if height is not None else ''
+        self._rows.write(f'<row r="{row}"{attributes}>{"".join(cells)}</row>'.encode('utf-8'))
+
+    def _formula(self, ref, style, formula):
+        text = f'<f>{escape(formula[1:])}</f>'
+        if ref not in self.cached_values:
+            return f'<c r="{ref}"{style}>{text}</c>'
+        data_type, cached = cached_value(self.cached_values[ref])
+        return f'<c r="{ref}"{style}{data_type.decode()}>{text}<v>{cached.decode("utf-8")}</v></c>'
+
+    def write(self, stream, selected=False):
+        """Write the worksheet part to ``stream`` and release the spooled rows"""
+        head = [_XML_HEADER, f'<worksheet xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">',
+                f'<sheetViews><sheetView{_TAB_SELECTED if selected else ""} workbookViewId="0">'
+                '<selection activeCell="A1" sqref="A1"/></sheetView></sheetViews>',
+                '<sheetFormatPr baseColWidth="8" defaultRowHeight="15"/>']
+        widths = sorted((column_index(letter), dimension.width)
+                        for letter, dimension in self.column_dimensions.items() if dimension.width is not None)
+        if widths:
+            head.append('<cols>')
+            head.extend(f'<col min="{index}" max="{index}" width="{width:g}" customWidth="1"/>'
+                        for index, width in widths)
+            head.append('</cols>')
+        head.append('<sheetData>')
+        stream.write(''.join(head).encode('utf-8'))
+
+        self._rows.seek(0)
+        shutil.copyfileobj(self._rows, stream)
+        self._rows.close()
+
+        tail = ['</sheetData>']
+        if self.merged_cells:
+            tail.append(f'<mergeCells count="{len(self.merged_cells)}">')
+            tail.extend(f'<mergeCell ref="{ref}"/>' for ref in self.merged_cells)
+            tail.append('</mergeCells>')
+        for ref, rules in groupby(self.conditional_formatting.rules, key=itemgetter(0)):
+            tail.append(f'<conditionalFormatting sqref="{ref}">')
+            for _, rule in rules:
+                attributes = f' type="{rule.type}" priority="{rule.priority}"'
+                if rule.operator:
+                    attributes += f' operator="{rule.operator}"'
+                if rule.dxf is not None:
+                    attributes += f' dxfId="{self.workbook.styles.dxf(rule.dxf)}"'
+                if rule.text is not None:
+                    attributes += f' text={quoteattr(rule.text)}'
+                formulas = ''.join(f'<formula>{escape(formula)}</formula>' for formula in rule.formula)
+                tail.append(f'<cfRule{attributes}>{formulas}</cfRule>')
+            tail.append('</conditionalFormatting>')
+        if self.data_validations:
+            tail.append(f'<dataValidations count="{len(self.data_validations)}">')
+            for dv in self.data_validations:
+                attributes = f' type="{dv.type}"'
+                if dv.allow_blank:
+                    attributes += ' allowBlank="1"'
+                tail.append(f'<dataValidation{attributes} sqref="{dv.sqref}">'
+                            f'<formula1>{escape(dv.formula1)}</formula1></dataValidation>')
+            tail.append('</dataValidations>')
+        tail.append('<pageMargins left="0.75" right="0.75" top="1" bottom="1" header="0.5" footer="0.5"/>'
+                    '</worksheet>')
+        stream.write(''.join(tail).encode('utf-8'))
+
+
+class NativeWorkbook:
+    """A workbook written without openpyxl; see the module docstring"""
+
+    write_only = True
+
+    def __init__(self):
+        self.worksheets = []
+        # {name: openpyxl DefinedName}; only the name and attr_text are used
+        self.defined_names = {}
+        self.styles = _StyleSheet()
+        self.shared_strings = _SharedStrings()
+
+    def add_named_style(self, style):
+        """Register an openpyxl NamedStyle; only its font, fill and alignment are used"""
+        self.styles.add(style)
+
+    @property
+    def named_styles(self):
+        return [name for name, *_ in self.styles.formats]
+
+    def create_sheet(self, title, index=None):
+        ws = NativeSheet(self, title)
+        self.worksheets.insert(len(self.worksheets) if index is None else index, ws)
+        return ws
+
+    def save(self, output_path, compression=DEFAULT_COMPRESSION):
+        """Assemble the package next to ``output_path`` and swap it in atomically.
+
+        A binary file object for ``output_path`` gets the package directly.
+        Parts are compressed as the ``compression`` profile (see
+        agent_portfolio.package) says; streamed parts, whose size is not
+        known up front, are always deflated.
+        """
+        profile = compression_profile(compression)
+        tmp_path = None if hasattr(output_path, 'write') else f'{output_path}.{os.getpid()}.tmp'
+
+        def add(archive, name, text):
+            data = text.encode('utf-8')
+            method, level = profile.method(len(data))
+            archive.writestr(name, data, method, level)
+
+        try:
+            with zipfile.ZipFile(tmp_path or output_path, 'w', zipfile.ZIP_DEFLATED, allowZip64=True,
+                                 compresslevel=profile.level) as archive:
+                add(archive, '[Content_Types].xml', self._content_types())
+                add(archive, '_rels/.rels', self._package_rels())
+                add(archive, 'xl/workbook.xml', self._workbook())
+                add(archive, 'xl/_rels/workbook.xml.rels', self._workbook_rels())
+                for index, ws in enumerate(self.worksheets, 1):
+                    name = f'xl/worksheets/sheet{index}.xml'
+                    if ws.rendered is not None:
+                        _write_rendered(archive, name, ws.rendered)
+                        continue
+                    with archive.open(name, 'w', force_zip64=True) as stream:
+                        ws.write(stream, selected=index == 1)
+                add(archive, 'xl/styles.xml', self.styles.xml())
+                with archive.open('xl/sharedStrings.xml', 'w', force_zip64=True) as stream:
+                    self.shared_strings.write(stream)
+            if tmp_path is not None:
+                os.replace(tmp_path, output_path)
+        finally:
+            if tmp_path is not None and os.path.exists(tmp_path):
+                os.remove(tmp_path)
+
+    def _content_types(self):
+        overrides = [('/xl/workbook.xml', _CONTENT_TYPE + 'sheet.main+xml'),
+                     ('/xl/styles.xml', _CONTENT_TYPE + 'styles+xml'),
+                     ('/xl/sharedStrings.xml', _CONTENT_TYPE + 'sharedStrings+xml')]
+        overrides += [(f'/xl/worksheets/sheet{index}.xml', _CONTENT_TYPE + 'worksheet+xml')
+                      for index in range(1, len(self.worksheets) + 1)]
+        return ''.join([
+            _XML_HEADER, '<Types xmlns="http://schemas.openxmlformats.org/package/2006/content-types">',
+            '<Default Extension="rels" ContentType="application/vnd.openxmlformats-package.relationships+xml"/>',
+            '<Default Extension="xml" ContentType="application/xml"/>',
+            *(f'<Override PartName="{part}" ContentType="{content_type}"/>' for part, content_type in overrides),
+            '</Types>',
+        ])
+
+    def _package_rels(self):
+        return (f'{_XML_HEADER}<Relationships xmlns="{_PACKAGE_REL_NS}">'
+                f'<Relationship Id="rId1" Type="{_REL_NS}/officeDocument" Target="xl/workbook.xml"/>'
+                '</Relationships>')
+
+    def _workbook(self):
+        sheets = ''.join(f'<sheet name={quoteattr(ws.title)} sheetId="{index}"'
+                         + (f' state="{ws.sheet_state}"' if ws.sheet_state != 'visible' else '')
+                         + f' r:id="rId{index}"/>'
+                         for index, ws in enumerate(self.worksheets, 1))
+        names = ''.join(f'<definedName name={quoteattr(name)}>{escape(defined.attr_text)}</definedName>'
+                        for name, defined in self.defined_names.items())
+        if names:
+            names = f'<definedNames>{names}</definedNames>'
+        # Every formula carries its cached result, so no recalculation on load
+        return (f'{_XML_HEADER}<workbook xmlns="{_MAIN_NS}" xmlns:r="{_REL_NS}">'
+                '<workbookPr/><bookViews><workbookView activeTab="0"/></bookViews>'
+                f'<sheets>{sheets}</sheets>{names}<calcPr calcId="124519" fullCalcOnLoad="0"/></workbook>')
+
+    def _workbook_rels(self):
+        count = len(self.worksheets)
+        relationships = [(f'rId{index}', 'worksheet', f'worksheets/sheet{index}.xml')
+                         for index in range(1, count + 1)]
+        relationships += [(f'rId{count + 1}', 'styles', 'styles.xml'),
+                          (f'rId{count + 2}', 'sharedStrings', 'sharedStrings.xml')]
+        return ''.join([
+            _XML_HEADER, f'<Relationships xmlns="{_PACKAGE_REL_NS}">',
+            *(f'<Relationship Id="{rid}" Type="{_REL_NS}/{kind}" Target="{target}"/>'
+              for rid, kind, target in relationships),
+            '</Relationships>',
+        ])
@@ -0,0 +1,206 @@
+"""
+Writing the .xlsx package
+
+write_package() has openpyxl serialize the workbook straight into the final
+zip. Worksheets, which openpyxl spools to temporary files, are copied in
+chunks, so memory stays flat however large the sheets are. On the way,
+worksheets can be taken from a previous output instead of being serialized
+(incremental mode), and cached formula results are written into the head of
+a sheet as it streams past.
+
+How each part is compressed is set by a CompressionProfile: ``fast`` for
+local handoffs, ``balanced`` (the zip defaults) and ``smallest`` for copies
+that are mailed around.
+"""
+
+import os
+import re
+import shutil
+import zipfile
+from xml.sax.saxutils import escape
+
+from openpyxl.cell.cell import ERROR_CODES
+from openpyxl.drawing.spreadsheet_drawing import SpreadsheetDrawing
+from openpyxl.packaging.relationship import RelationshipList
+from openpyxl.writer.excel import ExcelWriter
+
+
+class CompressionProfile:
+    """Zip method and deflate level for the parts of a package.
+
+    Parts smaller than ``store_below`` bytes are stored: they shrink by a few
+    hundred bytes at most, which is not worth a compressor.
+    """
+
+    __slots__ = ('name', 'level', 'store_below')
+
+    def __init__(self, name, level, store_below=0):
+        self.name = name
+        self.level = level
+        self.store_below = store_below
+
+    def method(self, size=None):
+        """(compress_type, compresslevel) for a part of ``size`` bytes, if known"""
+        if size is not None and size < self.store_below:
+            return zipfile.ZIP_STORED, None
+        return zipfile.ZIP_DEFLATED, self.level
+
+
+COMPRESSION_PROFILES = {
+    'fast': CompressionProfile('fast', 1, store_below=64 * 1024),
+    'balanced': CompressionProfile('balanced', 6),
+    'smallest': CompressionProfile('smallest', 9),
+}
+DEFAULT_COMPRESSION = 'balanced'
+
+
+def compression_profile(name):
+    """The CompressionProfile called ``name``"""
+    try:
+        return COMPRESSION_PROFILES[name]
+    except KeyError:
+        raise ValueError(f'unknown compression profile {name!r}; expected one of '
+                         f'{", ".join(COMPRESSION_PROFILES)}') from None
+
+
+# Parts are copied in chunks of this many bytes
+CHUNK_SIZE = 1024 * 1024
+
+# A formula cell as openpyxl writes it: no type, empty or missing value
+_FORMULA_CELL = re.compile(
+    rb'<c r="([A-Z]+[0-9]+)"((?: [a-z]+="[^"]*")*)>(<f>.*?</f>)(?:<v ?/>|<v></v>)?</c>',
+    re.S,
+)
+
+
+def cached_value(value):
+    """(type attribute, <v> text) for a formula result"""
+    if isinstance(value, bool):
+        return b' t="b"', b'1' if value else b'0'
+    if isinstance(value, (int, float)):
+        return b'', repr(value).encode('ascii')
+    if value in ERROR_CODES:
+        return b' t="e"', value.encode('ascii')
+    return b' t="str"', escape(value).encode('utf-8')
+
+
+def _row_after(values):
+    """Pattern of the first row after the last cell in ``values``"""
+    last_row = max(int(re.sub('[A-Z]+', '', cell)) for cell in values)
+    return re.compile(rb'<row r="%d"[ >]' % (last_row + 1))
+
+
+def cache_formula_values(sheet_xml, values):
+    """Store ``values`` ({cell: result}) as the cached results of formula cells.
+
+    Only the rows up to the last cell in ``values`` are scanned, so the cost
+    does not grow with the size of the sheet.
+    """
+    tail = _row_after(values).search(sheet_xml)
+    split = tail.start() if tail else len(sheet_xml)
+
+    def fill(match):
+        cell = match.group(1).decode('ascii')
+        if cell not in values:
+            return match.group(0)
+        data_type, text = cached_value(values[cell])
+        return b'<c r="%s"%s%s>%s<v>%s</v></c>' % (
+            match.group(1), match.group(2), data_type, match.group(3), text)
+
+    return _FORMULA_CELL.sub(fill, sheet_xml[:split]) + sheet_xml[split:]
+
+
+def _cached_head(source, values):
+    """The head of the sheet XML in ``source``, through the last row of ``values``, with the results cached"""
+    row_after = _row_after(values)
+    head = b''
+    while True:
+        chunk = source.read(CHUNK_SIZE)
+        head += chunk
+        if not chunk or row_after.search(head):
+            return cache_formula_values(head, values)
+
+
+class _PackageArchive(zipfile.ZipFile):
+    """The output zip as openpyxl's ExcelWriter sees it.
+
+    Parts are compressed as ``profile`` says. Files are copied in chunks
+    rather than read whole, with the results in ``cached_values`` ({member
+    name: {cell: result}}) written into their head.
+    """
+
+    def __init__(self, file, profile, cached_values):
+        super().__init__(file, 'w', zipfile.ZIP_DEFLATED, allowZip64=True)
+        self.profile = profile
+        self.cached_values = cached_values
+
+    def writestr(self, zinfo_or_arcname, data, compress_type=None, compresslevel=None):
+        if compress_type is None:
+            compress_type, compresslevel = self.profile.method(len(data))
+        super().writestr(zinfo_or_arcname, data, compress_type, compresslevel)
+
+    def write(self, filename, arcname=None, compress_type=None, compresslevel=None):
+        with open(filename, 'rb') as source:
+            self.copy(source, arcname or os.path.basename(filename), os.path.getsize(filename))
+
+    def copy(self, source, name, size):
+        """Copy the binary stream ``source`` (``size`` bytes) into member ``name``"""
+        self.compression, self.compresslevel = self.profile.method(size)
+        # Cached results make the part a little longer than ``size``
+        with self.open(name, 'w', force_zip64=size > zipfile.ZIP64_LIMIT // 2) as part:
+            if name in self.cached_values:
+                part.write(_cached_head(source, self.cached_values[name]))
+            shutil.copyfileobj(source, part, CHUNK_SIZE)
+
+
+class _PackageWriter(ExcelWriter):
+    """ExcelWriter copying the worksheets in ``reuse_parts`` from ``previous`` rather than serializing them"""
+
+    def __init__(self, workbook, archive, reuse_parts=(), previous=None):
+        super().__init__(workbook, archive)
+        self.reuse_parts = reuse_parts
+        self.previous = previous
+
+    def write_worksheet(self, ws):
+        name = ws.path[1:]
+        if name not in self.reuse_parts:
+            super().write_worksheet(ws)
+            return
+        ws._drawing = SpreadsheetDrawing()
+        ws._rels = RelationshipList()
+        with self.previous.open(name) as source:
+            self._archive.copy(source, name, self.previous.getinfo(name).file_size)
+        self.manifest.append(ws)
+
+
+def write_package(wb, output_path, comment=None, cached_values=None,
+                  reuse_parts=(), previous_path=None, compression=DEFAULT_COMPRESSION):
+    """Serialize the openpyxl workbook ``wb`` into the .xlsx at ``output_path``.
+
+    Worksheet members named in ``reuse_parts`` are copied from
+    ``previous_path`` instead of being serialized; ``cached_values`` maps
+    member names to the {cell: result} to store with their formulas.
+    ``comment`` becomes the zip archive comment. The file is written next to
+    the target and swapped in atomically, unless ``output_path`` is a binary
+    file object, which gets the package directly. Parts are compressed as
+    the ``compression`` profile says.
+    """
+    profile = compression_profile(compression)
+    reuse_parts = set(reuse_parts)
+    if wb.write_only and not wb.worksheets:
+        wb.create_sheet()
+    tmp_path = None if hasattr(output_path, 'write') else f'{output_path}.{os.getpid()}.tmp'
+    previous = zipfile.ZipFile(previous_path) if reuse_parts else None
+    try:
+        archive = _PackageArchive(tmp_path or output_path, profile, cached_values or {})
+        if comment is not None:
+            archive.comment = comment
+        # save() closes the archive
+        _PackageWriter(wb, archive, reuse_parts, previous).save()
+        if tmp_path is not None:
+            os.replace(tmp_path, output_path)
+    finally:
+        if previous is not None:
+            previous.close()
+        if tmp_path is not None and os.path.exists(tmp_path):
+            os.remove(tmp_path)
@@ -0,0 +1,122 @@
+"""
+Parity check between the openpyxl and native workbook backends
+
+Renders the same catalog with both backends and compares what a reader
+sees: cell values (formulas and their cached results), fonts, fills,
+alignment, merged ranges, column widths, row heights, sheet visibility, data
+validations, defined names and conditional format rules. The XML of the two files differs (the native
+writer uses shared strings, for one), so the files are compared after
+loading them with openpyxl.
+
+    python -m agent_portfolio.parity                  # the real catalog
+    python -m agent_portfolio.parity --size 10000     # a synthesized one
+    python -m agent_portfolio.parity --area Regulatory  # fewer agents than dashboard rows
+"""
+
+import argparse
+import os
+import sys
+import tempfile
+
+from openpyxl import load_workbook
+from openpyxl.cell import MergedCell
+
+from .catalog import DEFAULT_CATALOG_PATH
+
+
+def _color(color):
+    return color.rgb if color is not None and color.type == 'rgb' else None
+
+
+def _describe(path, data_only):
+    """{(sheet, cell or topic): what a reader sees there} for the workbook at ``path``"""
+    wb = load_workbook(path, data_only=data_only)
+    seen = {('workbook', 'defined_names'): {name: defined.attr_text for name, defined in wb.defined_names.items()}}
+    for ws in wb.worksheets:
+        seen[ws.title, 'state'] = ws.sheet_state
+        for row in ws.iter_rows():
+            for cell in row:
+                if isinstance(cell, MergedCell) or (cell.value in (None, '') and not cell.has_style):
+                    continue
+                seen[ws.title, cell.coordinate] = (
+                    cell.value if cell.value != '' else None,
+                    cell.font.b, cell.font.i, cell.font.sz, _color(cell.font.color),
+                    cell.fill.fill_type and _color(cell.fill.fgColor),
+                    cell.alignment.horizontal, cell.alignment.vertical, bool(cell.alignment.wrap_text),
+                )
+        seen[ws.title, 'merged'] = sorted(str(ref) for ref in ws.merged_cells.ranges)
+        seen[ws.title, 'widths'] = {key: dim.width for key, dim in ws.column_dimensions.items() if dim.customWidth}
+        seen[ws.title, 'heights'] = {key: dim.height for key, dim in ws.row_dimensions.items() if dim.height}
+        seen[ws.title, 'conditional_formats'] = sorted(
+            (str(cf.sqref), rule.priority, rule.type, rule.operator, rule.text, list(rule.formula),
+             rule.dxf.font.b, _color(rule.dxf.font.color), _color(rule.dxf.fill.fgColor))
+            for cf in ws.conditional_formatting for rule in cf.rules)
+        seen[ws.title, 'validations'] = sorted((dv.type, dv.formula1, str(dv.sqref), bool(dv.allow_blank))
+                                               for dv in ws.data_validations.dataValidation)
+    return seen
+
+
+def workbook_differences(path_a, path_b):
+    """List (sheet, cell or topic, seen in a, seen in b) wherever the workbooks differ.
+
+    Formulas are compared as written and, separately, their cached results.
+    """
+    differences = []
+    for data_only in (False, True):
+        a, b = _describe(path_a, data_only), _describe(path_b, data_only)
+        for key in sorted(a.keys() | b.keys()):
+            if a.get(key) != b.get(key):
+                differences.append((*key, a.get(key), b.get(key)))
+    return differences
+
+
+def check_backends(catalog_path=DEFAULT_CATALOG_PATH, workdir=None, areas=None, categories=None, **options):
+    """Render ``catalog_path`` with both backends and return workbook_differences().
+
+    ``areas``/``categories`` render only those agents, as filter_records()
+    selects them; a small selection leaves the dashboard longer than the
+    agent table.
+    """
+    import create_agents_excel as generator
+
+    if areas or categories:
+        options['agents_data'] = generator.filter_agents_data(
+            generator.build_agents_data(catalog_path=catalog_path), areas, categories)
+    with tempfile.TemporaryDirectory(dir=workdir) as tmp:
+        paths = {}
+        for backend in generator.BACKENDS:
+            paths[backend] = os.path.join(tmp, f'{backend}.xlsx')
+            generator.create_agent_portfolio_excel(catalog_path=catalog_path, output_path=paths[backend],
+                                                   verbose=False, backend=backend, **options)
+        return workbook_differences(*(paths[backend] for backend in generator.BACKENDS))
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Compare the openpyxl and native workbook backends')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--size', type=int, help='check a synthesized catalog of this many agents instead')
+    parser.add_argument('--streaming', action='store_true', help='render the openpyxl side in write-only mode')
+    parser.add_argument('--area', action='append', dest='areas', help='only agents of this area, repeatable')
+    parser.add_argument('--category', action='append', dest='categories',
+                        help='only this category (full name), repeatable')
+    args = parser.parse_args(argv)
+
+    with tempfile.TemporaryDirectory() as workdir:
+        catalog_path = args.catalog
+        if args.size is not None:
+            from .benchmark import synthesize_catalog
+            catalog_path = synthesize_catalog(args.size, os.path.join(workdir, 'catalog.json'))
+        differences = check_backends(catalog_path, streaming=args.streaming, areas=args.areas,
+                                     categories=args.categories)
+
+    for sheet, where, a, b in differences[:50]:
+        print(f"❌ {sheet}!{where}: openpyxl {a!r} / native {b!r}")
+    if differences:
+        print(f"{len(differences)} difference(s)")
+        return 1
+    print('✅ Both backends produce the same workbook')
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
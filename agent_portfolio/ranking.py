@@ -0,0 +1,66 @@
+"""
+Top-N priority ranking
+
+Picks the highest-rated agents for the dashboard's TOP PRIORITIES list and
+the first rows of the Build Roadmap. Agents are ranked by priority; ties go
+to higher business impact, then lower build complexity, then more time saved,
+and finally to catalog order, so every agent appears at most once and the
+result is the same on every run. Unrated agents are left out.
+"""
+
+import heapq
+import re
+
+from .columns import COMPLEXITY_CODES, IMPACT_CODES, parse_hours
+from .records import Agent
+
+TOP_N = 5
+
+_NUMBER = re.compile(r'\d+(?:\.\d+)?')
+
+
+def _parse_number(value):
+    """First number in a cell (5, 4.0, '3 - Medium', '2 hours'), or None"""
+    if isinstance(value, (int, float)) and not isinstance(value, bool):
+        return value
+    match = _NUMBER.search(str(value)) if value else None
+    if match is None:
+        return None
+    number = float(match.group())
+    return int(number) if number.is_integer() else number
+
+
+def priority_score(value):
+    """Numeric priority of a Priority cell, or None if the agent is unrated"""
+    return _parse_number(value)
+
+
+def rank_key(agent, position, score=None):
+    """Sort key of an agent at catalog ``position``; higher ranks first.
+
+    ``score`` stands in for the priority score, e.g. 0 for unrated agents.
+    """
+    if score is None:
+        score = priority_score(agent.priority)
+    # Higher is better for every part of the key; unknown levels rank last
+    return (score, IMPACT_CODES.get(agent.impact, 0),
+            -COMPLEXITY_CODES.get(agent.complexity, len(COMPLEXITY_CODES) + 1),
+            parse_hours(agent.time_saved), -position)
+
+
+def top_agents(agents_data, n=TOP_N):
+    """Return the ``n`` best-ranked agents as (priority score, Agent) pairs.
+
+    Runs in one pass with a heap of at most ``n`` entries, so the cost is
+    O(rows * log n) regardless of how the ties fall.
+    """
+    def ranked():
+        for position, item in enumerate(agents_data):
+            if not isinstance(item, Agent):
+                continue
+            score = priority_score(item.priority)
+            if score is None:
+                continue
+            yield rank_key(item, position, score), item
+
+    return [(key[0], agent) for key, agent in heapq.nlargest(n, ranked(), key=lambda entry: entry[0])]
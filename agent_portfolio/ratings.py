@@ -0,0 +1,162 @@
+"""
+Import ratings from returned Agent Portfolio workbooks
+
+People fill in Priority (column A), Status (H) and Your Notes (I) on the
+Agent Portfolio sheet and send the file back. This module streams those edits
+out of any number of returned workbooks with openpyxl's read-only mode, one
+file at a time, and merges them into the catalog keyed by Agent Name (C).
+Memory is bounded by the catalog size, not by the number or size of files.
+
+    python -m agent_portfolio.ratings returned/*.xlsx
+"""
+
+import argparse
+import glob
+import os
+
+from openpyxl import load_workbook
+
+from .catalog import DEFAULT_CATALOG_PATH, PRIORITIES, STATUSES, load_catalog, save_catalog
+
+SHEET_NAME = 'Agent Portfolio'
+NAME_HEADER = 'Agent Name'
+
+# Portfolio header -> Agent field
+FIELDS = {'Priority': 'priority', 'Status': 'status', 'Your Notes': 'notes'}
+
+# A typed rating 1-5 -> its dropdown value
+_PRIORITY_BY_NUMBER = {int(value.split(' - ')[0]): value for value in PRIORITIES}
+
+
+def normalize_priority(value):
+    """Map a typed rating onto its dropdown value, or None if it is not a rating.
+
+    A rating is a whole number from 1 to 5 (5, 4.0, '3') or a dropdown value
+    ('2 - Low'); anything else (10, 4.7, '9', 'High') is None.
+    """
+    if isinstance(value, bool):
+        return None
+    if isinstance(value, str):
+        value = value.strip()
+        if value in PRIORITIES:
+            return value
+        if not value.isdigit():
+            return None
+        value = int(value)
+    if isinstance(value, float):
+        if not value.is_integer():
+            return None
+        value = int(value)
+    return _PRIORITY_BY_NUMBER.get(value) if isinstance(value, int) else None
+
+
+def read_ratings(path):
+    """Yield (agent name, {Agent field: value}) for each edited agent row of a workbook"""
+    wb = load_workbook(path, read_only=True, data_only=True)
+    try:
+        rows = wb[SHEET_NAME].iter_rows(values_only=True)
+
+        # The header row sits above the agents; the dashboard to its right
+        # never repeats these names, so the first match per header wins
+        columns = None
+        for row in rows:
+            if NAME_HEADER in row:
+                columns = {}
+                for col, header in enumerate(row):
+                    if isinstance(header, str):
+                        columns.setdefault(header, col)
+                break
+        if columns is None:
+            raise ValueError(f'{path}: no "{NAME_HEADER}" header row on the {SHEET_NAME!r} sheet')
+
+        name_col = columns[NAME_HEADER]
+        wanted = [(columns[header], field) for header, field in FIELDS.items() if header in columns]
+        for row in rows:
+            # Category and spacing rows have no agent name
+            if name_col >= len(row) or not row[name_col]:
+                continue
+            edits = {}
+            for col, field in wanted:
+                value = row[col] if col < len(row) else None
+                if value is not None and value != '':
+                    edits[field] = value
+            if edits:
+                yield str(row[name_col]).strip(), edits
+    finally:
+        wb.close()
+
+
+def merge_ratings(categories, paths):
+    """Apply returned ratings to ``categories`` (load_catalog() form) in place.
+
+    Only cells that differ from the catalog as it was before the merge count
+    as edits, so an untouched "Not Started" in one file never reverts a status
+    changed in another. When several files edit the same cell, the later file
+    wins. Returns a report with the number of files, rows and updated fields,
+    agent names that are not in the catalog, and the (path, agent name,
+    field, value) of every value rejected, such as a rating outside 1-5.
+    """
+    agents = {agent.name: agent for category in categories for agent in category['agents']}
+    original = {name: {field: getattr(agent, field) for field in FIELDS.values()}
+                for name, agent in agents.items()}
+    report = {'files': 0, 'rows': 0, 'updated': 0, 'unknown_agents': set(), 'rejected': []}
+
+    for path in paths:
+        report['files'] += 1
+        for name, edits in read_ratings(path):
+            report['rows'] += 1
+            agent = agents.get(name)
+            if agent is None:
+                report['unknown_agents'].add(name)
+                continue
+            baseline = original[name]
+            for field, value in edits.items():
+                if field == 'priority':
+                    clean = normalize_priority(value)
+                elif field == 'status':
+                    clean = value if value in STATUSES else None
+                else:
+                    clean = str(value).strip()
+                if clean is None:
+                    report['rejected'].append((path, name, field, value))
+                elif clean != baseline[field] and clean != getattr(agent, field):
+                    setattr(agent, field, clean)
+                    report['updated'] += 1
+
+    report['unknown_agents'] = sorted(report['unknown_agents'])
+    return report
+
+
+def import_ratings(paths, catalog_path=DEFAULT_CATALOG_PATH, dry_run=False):
+    """Merge returned workbooks into the catalog file and return the merge report"""
+    categories = load_catalog(catalog_path, use_cache=False)
+    report = merge_ratings(categories, paths)
+    if report['updated'] and not dry_run:
+        save_catalog(categories, catalog_path)
+    return report
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(
+        description='Merge ratings from returned Agent Portfolio workbooks into the catalog')
+    parser.add_argument('workbooks', nargs='+', help='returned .xlsx files (glob patterns are expanded)')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='catalog file to update')
+    parser.add_argument('--dry-run', action='store_true', help='report changes without writing the catalog')
+    args = parser.parse_args(argv)
+
+    paths = []
+    for pattern in args.workbooks:
+        paths.extend(sorted(glob.glob(pattern)) or [pattern])
+
+    report = import_ratings(paths, args.catalog, args.dry_run)
+    print(f"📥 Read {report['rows']} agent rows from {report['files']} workbooks")
+    print(f"✅ {report['updated']} fields updated in {os.path.relpath(args.catalog)}"
+          + (' (dry run, not written)' if args.dry_run else ''))
+    if report['unknown_agents']:
+        print(f"⚠️  Not in catalog: {', '.join(report['unknown_agents'])}")
+    for path, name, field, value in report['rejected']:
+        print(f"⚠️  {path}: ignored invalid {field} {value!r} for {name}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,108 @@
+"""
+Catalog records
+
+The Agent Portfolio sheet is rendered from a flat list of records, one per
+row: a Category banner, then its Agents, then a Spacing row. The records use
+__slots__, so a catalog of hundreds of thousands of agents carries no
+per-row dict, and fields are read by name instead of by column position.
+Values that repeat across many agents (area, time saved, impact, complexity,
+status) are interned, so every row shares one copy of each string.
+"""
+
+import sys
+
+
+def _intern(value):
+    return sys.intern(value) if type(value) is str else value
+
+
+class Agent:
+    """One agent row; ``cells()`` gives its values in column order (A:J)"""
+
+    __slots__ = FIELDS = ('priority', 'area', 'name', 'description', 'time_saved',
+                          'impact', 'complexity', 'status', 'notes', 'quick_win')
+
+    def __init__(self, priority, area, name, description, time_saved,
+                 impact, complexity, status, notes='', quick_win=False):
+        self.priority = _intern(priority)
+        self.area = _intern(area)
+        self.name = name
+        self.description = description
+        self.time_saved = _intern(time_saved)
+        self.impact = _intern(impact)
+        self.complexity = _intern(complexity)
+        self.status = _intern(status)
+        self.notes = notes
+        self.quick_win = quick_win
+
+    def cells(self):
+        return [self.priority, self.area, self.name, self.description, self.time_saved,
+                self.impact, self.complexity, self.status, self.notes, self.quick_win]
+
+    def __eq__(self, other):
+        if not isinstance(other, Agent):
+            return NotImplemented
+        return self.cells() == other.cells()
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f"Agent({', '.join(map(repr, self.cells()))})"
+
+
+class Category:
+    """A category banner row; colors are hex codes"""
+
+    __slots__ = ('name', 'color', 'font_color')
+
+    def __init__(self, name, color, font_color):
+        self.name = name
+        self.color = color
+        self.font_color = font_color
+
+    def __eq__(self, other):
+        if not isinstance(other, Category):
+            return NotImplemented
+        return (self.name, self.color, self.font_color) == (other.name, other.color, other.font_color)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return f'Category({self.name!r}, {self.color!r}, {self.font_color!r})'
+
+
+class Spacing:
+    """The empty row closing a category"""
+
+    __slots__ = ()
+
+    def __eq__(self, other):
+        return isinstance(other, Spacing)
+
+    __hash__ = None
+
+    def __repr__(self):
+        return 'Spacing()'
+
+
+SPACING = Spacing()
+
+
+def filter_records(records, areas=None, categories=None):
+    """Return the records of the given areas and/or category names, dropping empty categories"""
+    areas = set(areas) if areas else None
+    categories = set(categories) if categories else None
+    filtered = []
+    block = []
+    for item in records:
+        if isinstance(item, Category):
+            block = [item] if categories is None or item.name in categories else None
+        elif isinstance(item, Agent):
+            if block is not None and (areas is None or item.area in areas):
+                block.append(item)
+        elif isinstance(item, Spacing):
+            if block is not None and len(block) > 1:
+                filtered.extend(block)
+                filtered.append(item)
+            block = None
+    return filtered
@@ -0,0 +1,215 @@
+"""
+Dependency-aware build roadmap
+
+Schedules every agent that is not yet Complete onto a team of builders and
+into the Build Roadmap phases. Each agent takes a number of build weeks set
+by its Build Complexity (EFFORT_WEEKS). It can start once the agents it
+depends on have launched and a builder is free. Among the agents that are
+ready, the best-ranked goes first, using the order of
+agent_portfolio.ranking with unrated agents last. An agent belongs to the
+first phase whose last week (ROADMAP_PHASE_WEEKS) is on or after its launch.
+
+The plan comes from a JSON file:
+
+    {
+      "start": "2026-01-05",
+      "capacity": 2,
+      "owners": ["Alex", "Sam"],
+      "dependencies": {"Investor Update Generator": ["Competitive Intelligence Agent"]},
+      "effort_weeks": {"Low": 1, "Medium": 2, "High": 4}
+    }
+
+Every key is optional. The capacity defaults to one builder per owner, and
+the start to the Monday of the current week. Scheduling is list scheduling
+over a topological order: every agent and dependency passes through a heap
+once, so a plan costs O((agents + dependencies) * log agents).
+"""
+
+import datetime
+import heapq
+import json
+
+from .layout import ROADMAP_PHASES, ROADMAP_PHASE_ROWS, ROADMAP_PHASE_WEEKS
+from .ranking import priority_score, rank_key
+from .records import Agent
+
+# Build weeks by Build Complexity
+EFFORT_WEEKS = {'Low': 1, 'Medium': 2, 'High': 4}
+
+# Agents with this status are built already and need no slot
+DONE = 'Complete'
+
+
+def _weeks(weeks):
+    return f"{weeks:g} week{'' if weeks == 1 else 's'}"
+
+
+class ScheduledAgent:
+    """One agent's place on the roadmap; ``cells()`` gives its Build Roadmap row"""
+
+    __slots__ = ('agent', 'score', 'weeks', 'dependencies', 'start', 'launch', 'owner', 'phase')
+
+    def __init__(self, agent, score, weeks, dependencies, start, launch, owner, phase):
+        self.agent = agent
+        self.score = score
+        self.weeks = weeks
+        self.dependencies = dependencies
+        self.start = start
+        self.launch = launch
+        self.owner = owner
+        self.phase = phase
+
+    def cells(self):
+        """Values of the R_HEADERS columns; the Phase column is left to the banners"""
+        return [None, self.agent.name, self.score, self.agent.time_saved, _weeks(self.weeks),
+                ', '.join(self.dependencies), self.start.isoformat(), self.launch.isoformat(), self.owner]
+
+    def __repr__(self):
+        return (f'ScheduledAgent({self.agent.name!r}, phase={self.phase}, start={self.start}, '
+                f'launch={self.launch}, owner={self.owner!r})')
+
+
+def phase_rows(top=(), top_n=0, scheduled=None):
+    """(rows, size) under each Build Roadmap phase banner, in phase order.
+
+    ``rows`` are the filled rows, padded with empty ones up to ``size``.
+    The ranked ``top`` (score, Agent) pairs go under Phase 1, which grows
+    to ``top_n`` rows, and the last phase has none; a ``scheduled`` roadmap
+    fills every phase instead.
+    """
+    last = len(ROADMAP_PHASES) - 1
+    sections = []
+    for index in range(len(ROADMAP_PHASES)):
+        if scheduled is not None:
+            rows = [entry.cells() for entry in scheduled if entry.phase == index]
+            size = len(rows) if index == last else max(ROADMAP_PHASE_ROWS, len(rows))
+        elif index == last:
+            rows, size = [], 0
+        elif index == 0:
+            rows = [[None, agent.name, score, agent.time_saved] for score, agent in top]
+            size = max(ROADMAP_PHASE_ROWS, top_n, len(rows))
+        else:
+            rows, size = [], ROADMAP_PHASE_ROWS
+        sections.append((rows, size))
+    return sections
+
+
+def _monday(day):
+    return day - datetime.timedelta(days=day.weekday())
+
+
+def load_plan(path):
+    """Read a roadmap plan file into keyword arguments for schedule()"""
+    with open(path, encoding='utf-8') as f:
+        document = json.load(f)
+    plan = {}
+    if document.get('start'):
+        plan['start'] = datetime.date.fromisoformat(document['start'])
+    if document.get('capacity') is not None:
+        plan['capacity'] = int(document['capacity'])
+    if document.get('owners'):
+        plan['owners'] = tuple(document['owners'])
+    if document.get('dependencies'):
+        plan['dependencies'] = {name: tuple(needs) for name, needs in document['dependencies'].items()}
+    if document.get('effort_weeks'):
+        plan['effort'] = dict(EFFORT_WEEKS, **document['effort_weeks'])
+    return plan
+
+
+def schedule(agents_data, dependencies=None, capacity=None, owners=(), start=None, effort=EFFORT_WEEKS):
+    """Schedule the open agents of ``agents_data`` and return them as ScheduledAgents.
+
+    ``dependencies`` maps an agent name to the names of the agents it
+    depends on. ``capacity`` is the number of agents built at once, by
+    ``owners`` in turn when given. Dates are counted in weeks from the
+    Monday of ``start``; an agent launches on the Friday of its last build
+    week. The result is in phase order, then by start date and rank.
+    Raises ValueError for unknown or ambiguous agent names and for cyclic
+    dependencies.
+    """
+    if capacity is None:
+        capacity = len(owners) or 1
+    if capacity < 1:
+        raise ValueError(f'capacity must be at least 1, not {capacity}')
+    start = _monday(start or datetime.date.today())
+    longest = max(effort.values())
+
+    agents = [item for item in agents_data if isinstance(item, Agent)]
+    positions = {}
+    for position, agent in enumerate(agents):
+        positions.setdefault(agent.name, []).append(position)
+
+    def lookup(name):
+        found = positions.get(name)
+        if not found:
+            raise ValueError(f'roadmap dependency names unknown agent {name!r}')
+        if len(found) > 1:
+            raise ValueError(f'roadmap dependency names {name!r}, which {len(found)} agents share')
+        return found[0]
+
+    # Dependency graph between open agents; built ones are satisfied already
+    is_open = [agent.status != DONE for agent in agents]
+    waiting = [0] * len(agents)
+    dependents = [[] for _ in agents]
+    needs_of = {}
+    for name, needs in (dependencies or {}).items():
+        target = lookup(name)
+        needs_of[target] = tuple(needs)
+        for need in needs:
+            source = lookup(need)
+            if source == target:
+                raise ValueError(f'roadmap agent {name!r} depends on itself')
+            if is_open[target] and is_open[source]:
+                waiting[target] += 1
+                dependents[source].append(target)
+
+    # Sort keys: min-heaps, so the rank is negated
+    keys = [tuple(-part for part in rank_key(agent, position, priority_score(agent.priority) or 0))
+            for position, agent in enumerate(agents)]
+    # (week the dependencies are done, key, position) / (key, position)
+    pending = [(0, keys[position], position) for position in range(len(agents))
+               if is_open[position] and not waiting[position]]
+    heapq.heapify(pending)
+    ready = []
+    ready_week = [0] * len(agents)
+    builders = [(0, slot) for slot in range(capacity)]
+
+    entries = []
+    now = 0
+    while pending or ready:
+        free, slot = heapq.heappop(builders)
+        now = max(now, free)
+        if not ready:
+            now = max(now, pending[0][0])
+        while pending and pending[0][0] <= now:
+            _, key, position = heapq.heappop(pending)
+            heapq.heappush(ready, (key, position))
+        _, position = heapq.heappop(ready)
+
+        agent = agents[position]
+        weeks = effort.get(agent.complexity, longest)
+        begin = max(free, ready_week[position])
+        end = begin + weeks
+        heapq.heappush(builders, (end, slot))
+        for target in dependents[position]:
+            ready_week[target] = max(ready_week[target], end)
+            waiting[target] -= 1
+            if not waiting[target]:
+                heapq.heappush(pending, (ready_week[target], keys[target], target))
+
+        phase = next((index for index, last in enumerate(ROADMAP_PHASE_WEEKS) if end <= last),
+                     len(ROADMAP_PHASE_WEEKS) - 1)
+        entries.append((phase, begin, keys[position], ScheduledAgent(
+            agent, priority_score(agent.priority), weeks, needs_of.get(position, ()),
+            start + datetime.timedelta(weeks=begin),
+            start + datetime.timedelta(weeks=end, days=-3),
+            owners[slot] if slot < len(owners) else None, phase,
+        )))
+
+    if len(entries) < sum(is_open):
+        stuck = [agents[position].name for position in range(len(agents)) if is_open[position] and waiting[position]]
+        raise ValueError(f"roadmap dependencies form a cycle through {', '.join(map(repr, stuck[:5]))}"
+                         + (f' and {len(stuck) - 5} more' if len(stuck) > 5 else ''))
+
+    entries.sort(key=lambda entry: entry[:3])
+    return [entry[3] for entry in entries]
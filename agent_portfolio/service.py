@@ -0,0 +1,285 @@
+"""
+Warm workbook-rendering service
+
+A long-running local HTTP server around create_agent_portfolio_excel(). The
+interpreter, openpyxl and the parsed catalog stay loaded between requests.
+Workbooks are rendered into memory, and the finished xlsx bytes are kept in
+a size-bounded LRU cache. A repeated request is answered from memory without
+rendering.
+
+The cache key is the SHA-256 of the catalog file plus the request's
+options. Editing the catalog changes the hash, so stale workbooks are
+never served; they age out of the cache instead.
+
+    python -m agent_portfolio.service --port 8765 --cache-mb 256
+
+    GET /portfolio.xlsx?area=Regulatory&view=by-status&top_n=10&backend=native
+    GET /metrics        cache hits, misses, evictions and render latency (Prometheus text format)
+    GET /healthz
+
+Query parameters: ``area`` and ``category`` (repeatable), ``view``
+(repeatable; see agent_portfolio.views), ``title``, ``top_n`` (1 to
+MAX_TOP_N) and ``backend``. Bad parameters, and a filter that selects no
+agents, are answered with 400; a render that fails with 500. The server
+listens on 127.0.0.1 unless told otherwise; it has no authentication and is
+meant to sit behind the app's own routes.
+"""
+
+import argparse
+import hashlib
+import os
+import sys
+import threading
+import time
+from collections import OrderedDict
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from io import BytesIO
+from urllib.parse import parse_qs, urlsplit
+
+import create_agents_excel as generator
+
+from .catalog import DEFAULT_CATALOG_PATH, load_catalog
+from .export import catalog_records
+from .layout import COLORS
+from .records import filter_records
+from .views import DEFAULT_VIEWS, VIEWS
+
+XLSX_CONTENT_TYPE = 'application/vnd.openxmlformats-officedocument.spreadsheetml.sheet'
+DEFAULT_PORT = 8765
+DEFAULT_CACHE_MB = 256
+
+# Each rank is a dashboard row, so ``top_n`` is bounded per request
+MAX_TOP_N = 1000
+
+
+class RenderCache:
+    """LRU of rendered workbooks, bounded by the total size of their bytes"""
+
+    def __init__(self, max_bytes):
+        self.max_bytes = max_bytes
+        self.bytes = 0
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self._entries = OrderedDict()
+        self._lock = threading.Lock()
+
+    def __len__(self):
+        return len(self._entries)
+
+    def get(self, key):
+        with self._lock:
+            data = self._entries.get(key)
+            if data is None:
+                self.misses += 1
+                return None
+            self._entries.move_to_end(key)
+            self.hits += 1
+            return data
+
+    def peek(self, key):
+        """The cached bytes for ``key`` or None, without counting a lookup"""
+        with self._lock:
+            return self._entries.get(key)
+
+    def put(self, key, data):
+        """Store ``data`` and evict the least recently used entries to make room.
+
+        A workbook larger than the whole cache is not stored.
+        """
+        with self._lock:
+            if len(data) > self.max_bytes:
+                return
+            previous = self._entries.pop(key, None)
+            if previous is not None:
+                self.bytes -= len(previous)
+            self._entries[key] = data
+            self.bytes += len(data)
+            while self.bytes > self.max_bytes:
+                _, evicted = self._entries.popitem(last=False)
+                self.bytes -= len(evicted)
+                self.evictions += 1
+
+
+class PortfolioService:
+    """Renders portfolios from a catalog kept in memory, through a RenderCache.
+
+    The catalog file is checked (stat only) on every request, and parsed
+    again only when it changed.
+    """
+
+    def __init__(self, catalog_path=DEFAULT_CATALOG_PATH, cache_bytes=DEFAULT_CACHE_MB * 2 ** 20):
+        self.catalog_path = catalog_path
+        self.cache = RenderCache(cache_bytes)
+        self.renders = 0
+        self.render_seconds = 0.0
+        self.last_render_seconds = 0.0
+        self._stat = None
+        self._records = None
+        self._catalog_hash = None
+        self._catalog_lock = threading.Lock()
+        # Rendering is CPU-bound, so renders take turns; cache hits never wait
+        self._render_lock = threading.Lock()
+
+    def _catalog(self):
+        """(SHA-256 of the catalog file, its records), reloaded when the file changes"""
+        stat = os.stat(self.catalog_path)
+        with self._catalog_lock:
+            if self._stat is None or (stat.st_mtime_ns, stat.st_size) != self._stat:
+                with open(self.catalog_path, 'rb') as f:
+                    self._catalog_hash = hashlib.sha256(f.read()).hexdigest()
+                self._records = catalog_records(load_catalog(self.catalog_path), COLORS)
+                self._stat = (stat.st_mtime_ns, stat.st_size)
+            return self._catalog_hash, self._records
+
+    def render(self, areas=(), categories=(), views=None, title=None, top_n=None, backend='openpyxl'):
+        """Return (xlsx bytes, cache key, whether it came from the cache).
+
+        Raises ValueError for an unknown backend or view, a ``top_n`` out of
+        range, or areas/categories that select no agents.
+        """
+        if backend not in generator.BACKENDS:
+            raise ValueError(f'unknown backend {backend!r}')
+        if top_n is not None and not 1 <= top_n <= MAX_TOP_N:
+            raise ValueError(f'top_n must be between 1 and {MAX_TOP_N}, not {top_n}')
+        unknown = [name for name in views or () if name not in VIEWS]
+        if unknown:
+            raise ValueError(f"unknown view {unknown[0]!r}; expected one of {', '.join(VIEWS)}")
+        catalog_hash, records = self._catalog()
+        key = hashlib.sha256(repr((catalog_hash, sorted(areas), sorted(categories), tuple(views or ()),
+                                   title, top_n, backend)).encode('utf-8')).hexdigest()
+
+        data = self.cache.get(key)
+        if data is not None:
+            return data, key, True
+        with self._render_lock:
+            # Another request may have rendered it while this one waited
+            data = self.cache.peek(key)
+            if data is not None:
+                return data, key, True
+            options = {'backend': backend, 'verbose': False}
+            if views:
+                options['views'] = tuple(VIEWS[name] for name in dict.fromkeys(views))
+            else:
+                options['views'] = DEFAULT_VIEWS
+            if title is not None:
+                options['title'] = title
+            if top_n is not None:
+                options['top_n'] = top_n
+            started = time.perf_counter()
+            buffer = BytesIO()
+            agents_data = filter_records(records, list(areas) or None, list(categories) or None)
+            if not agents_data:
+                raise ValueError('no agents match the area/category filter')
+            generator.create_agent_portfolio_excel(agents_data=agents_data, output_path=buffer, **options)
+            data = buffer.getvalue()
+            elapsed = time.perf_counter() - started
+            self.renders += 1
+            self.render_seconds += elapsed
+            self.last_render_seconds = elapsed
+            self.cache.put(key, data)
+        return data, key, False
+
+    def metrics(self):
+        """Prometheus text exposition of the cache and render statistics"""
+        cache = self.cache
+        lookups = cache.hits + cache.misses
+        lines = [
+            ('portfolio_cache_hits_total', 'counter', 'Requests answered from the cache', cache.hits),
+            ('portfolio_cache_misses_total', 'counter', 'Requests that needed a render', cache.misses),
+            ('portfolio_cache_evictions_total', 'counter', 'Workbooks evicted to stay within the size bound',
+             cache.evictions),
+            ('portfolio_cache_hit_ratio', 'gauge', 'Share of requests answered from the cache',
+             cache.hits / lookups if lookups else 0),
+            ('portfolio_cache_entries', 'gauge', 'Workbooks in the cache', len(cache)),
+            ('portfolio_cache_bytes', 'gauge', 'Total size of the cached workbooks', cache.bytes),
+            ('portfolio_cache_max_bytes', 'gauge', 'Size bound of the cache', cache.max_bytes),
+            ('portfolio_render_seconds_sum', 'counter', 'Time spent rendering', self.render_seconds),
+            ('portfolio_render_seconds_count', 'counter', 'Workbooks rendered', self.renders),
+            ('portfolio_render_last_seconds', 'gauge', 'Duration of the latest render', self.last_render_seconds),
+        ]
+        out = []
+        for name, kind, help_text, value in lines:
+            # repr(): ints exactly, floats with every digit ({:g} rounds to six)
+            out += [f'# HELP {name} {help_text}', f'# TYPE {name} {kind}', f'{name} {value!r}']
+        return '\n'.join(out) + '\n'
+
+
+def make_server(service, host='127.0.0.1', port=DEFAULT_PORT):
+    """A ThreadingHTTPServer answering for ``service``; call serve_forever() on it"""
+
+    class Handler(BaseHTTPRequestHandler):
+        def do_GET(self):
+            url = urlsplit(self.path)
+            if url.path == '/healthz':
+                self._reply(200, b'ok\n', 'text/plain')
+            elif url.path == '/metrics':
+                self._reply(200, service.metrics().encode('utf-8'), 'text/plain; version=0.0.4')
+            elif url.path in ('/', '/portfolio.xlsx'):
+                self._portfolio(parse_qs(url.query))
+            else:
+                self._reply(404, b'not found\n', 'text/plain')
+
+        def _portfolio(self, query):
+            try:
+                top_n = int(query['top_n'][0]) if 'top_n' in query else None
+                data, key, cached = service.render(
+                    areas=query.get('area', ()), categories=query.get('category', ()),
+                    views=query.get('view'), title=query.get('title', [None])[0], top_n=top_n,
+                    backend=query.get('backend', ['openpyxl'])[0])
+            except ValueError as e:
+                self._reply(400, f'{e}\n'.encode('utf-8'), 'text/plain')
+                return
+            except Exception as e:
+                # Keep the handler alive and tell the client, whatever broke the render
+                self._reply(500, f'render failed: {e}\n'.encode('utf-8'), 'text/plain')
+                return
+            if self.headers.get('If-None-Match') == f'"{key}"':
+                self._reply(304, b'', None, {'ETag': f'"{key}"'})
+                return
+            self._reply(200, data, XLSX_CONTENT_TYPE, {
+                'ETag': f'"{key}"',
+                'X-Cache': 'HIT' if cached else 'MISS',
+                'Content-Disposition': 'attachment; filename="Agent_Portfolio.xlsx"',
+            })
+
+        def _reply(self, status, body, content_type, headers=None):
+            self.send_response(status)
+            if content_type:
+                self.send_header('Content-Type', content_type)
+            for name, value in (headers or {}).items():
+                self.send_header(name, value)
+            self.send_header('Content-Length', str(len(body)))
+            self.end_headers()
+            self.wfile.write(body)
+
+        def log_message(self, *args):
+            pass
+
+    return ThreadingHTTPServer((host, port), Handler)
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Serve rendered Agent Portfolio workbooks over HTTP')
+    parser.add_argument('--host', default='127.0.0.1', help='interface to listen on (default: %(default)s)')
+    parser.add_argument('--port', type=int, default=DEFAULT_PORT, help='port (default: %(default)s)')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--cache-mb', type=float, default=DEFAULT_CACHE_MB,
+                        help='size bound of the workbook cache in MB (default: %(default)s)')
+    args = parser.parse_args(argv)
+
+    service = PortfolioService(args.catalog, int(args.cache_mb * 2 ** 20))
+    service.render()  # warm up: catalog, imports and the default workbook
+    server = make_server(service, args.host, args.port)
+    print(f"🌐 Serving portfolios on http://{args.host}:{server.server_address[1]}/portfolio.xlsx")
+    try:
+        server.serve_forever()
+    except KeyboardInterrupt:
+        pass
+    finally:
+        server.server_close()
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,486 @@
+"""
+Google Sheets renderer: the whole portfolio as one batchUpdate call
+
+agents-sheet.py builds the portfolio with a getRange() and a setter call per
+cell (agentRow alone makes 8 per agent), and every call is a round trip, so
+large catalogs run into the Apps Script execution time limit. This module
+compiles the same layout into a single Sheets API spreadsheets.batchUpdate
+payload. Values go out as one updateCells per sheet. Formats, validations and
+conditional format rules each cover a whole column range, so the number of
+requests depends on the number of categories, not on the number of agents.
+
+    python -m agent_portfolio.sheets --spreadsheet-id ID      # token in $SHEETS_ACCESS_TOKEN
+    python -m agent_portfolio.sheets --payload batch.json     # write the payload only
+    python -m agent_portfolio.sheets --stub                   # send to a local stub endpoint
+
+publish() sends the payload to ``endpoint``, which can point to a local stub
+(see StubEndpoint) for offline runs. It reports the number of HTTP calls and
+batchUpdate requests made.
+"""
+
+import argparse
+import json
+import os
+import sys
+import threading
+import urllib.request
+from http.server import BaseHTTPRequestHandler, ThreadingHTTPServer
+from itertools import groupby
+
+from .catalog import DEFAULT_CATALOG_PATH, load_catalog
+from .columns import AgentColumns, format_hours
+from .export import catalog_records
+from .layout import (
+    COLORS, DASHBOARD_COLUMN, DEFAULT_TITLE, FIRST_DATA_ROW, HEADERS, R_HEADERS, ROADMAP_PHASES,
+    QUICK_VALUE_COLUMNS, SHEET_LISTS, SHEET_MAIN, SHEET_QUICK, SHEET_ROADMAP, VALUE_COLORS,
+)
+from .lookups import lookup_lists, lookup_rows, row_spans, validations
+from .ranking import TOP_N, top_agents
+from .records import Agent, Category, Spacing, filter_records
+from .roadmap import load_plan, phase_rows, schedule
+from .views import CatalogIndex
+
+SHEETS_ENDPOINT = 'https://sheets.googleapis.com'
+TOKEN_ENV = 'SHEETS_ACCESS_TOKEN'
+
+# Column widths in pixels, as agents-sheet.py sets them
+PIXEL_WIDTHS = [80, 150, 200, 350, 120, 120, 120, 100, 250, 80]
+R_PIXEL_WIDTHS = [120, 300, 140, 120, 120, 220, 120, 120, 160]
+
+# Fixed ids, so every request can refer to a sheet added in the same batch
+SHEET_IDS = {SHEET_MAIN: 1001, SHEET_QUICK: 1002, SHEET_ROADMAP: 1003, SHEET_LISTS: 1004}
+
+# A spreadsheet must keep at least one sheet, so when every sheet is stale
+# publish() holds this one open until the new sheets are in
+PLACEHOLDER_TITLE = 'Publishing…'
+
+FONT = 'Arial'
+
+# Grid size of a new sheet in Google Sheets
+MIN_ROWS = 1000
+MIN_COLUMNS = 26
+
+
+def _rgb(color):
+    return {'red': int(color[0:2], 16) / 255, 'green': int(color[2:4], 16) / 255,
+            'blue': int(color[4:6], 16) / 255}
+
+
+def grid_range(sheet_id, first_row, first_column, last_row=None, last_column=None):
+    """GridRange from 1-based inclusive bounds; an omitted end is open-ended"""
+    grid = {'sheetId': sheet_id, 'startRowIndex': first_row - 1, 'startColumnIndex': first_column - 1}
+    if last_row is not None:
+        grid['endRowIndex'] = last_row
+    grid['endColumnIndex'] = last_column if last_column is not None else first_column
+    return grid
+
+
+def _value(value):
+    if value is None or value == '':
+        return {}
+    if isinstance(value, bool):
+        return {'userEnteredValue': {'boolValue': value}}
+    if isinstance(value, (int, float)):
+        return {'userEnteredValue': {'numberValue': value}}
+    if value.startswith('='):
+        return {'userEnteredValue': {'formulaValue': value}}
+    return {'userEnteredValue': {'stringValue': value}}
+
+
+def _values(sheet_id, rows):
+    """One updateCells writing ``rows`` (lists of values) from A1"""
+    return {'updateCells': {
+        'start': {'sheetId': sheet_id, 'rowIndex': 0, 'columnIndex': 0},
+        'rows': [{'values': [_value(value) for value in row]} for row in rows],
+        'fields': 'userEnteredValue',
+    }}
+
+
+def cell_format(background=None, color=None, size=None, bold=None, italic=None,
+                horizontal=None, vertical=None, wrap=None, font=None):
+    """(CellFormat, field mask) with only the given properties set"""
+    fmt, text, fields = {}, {}, []
+    if background is not None:
+        fmt['backgroundColor'] = _rgb(background)
+        fields.append('backgroundColor')
+    for key, value in (('foregroundColor', color and _rgb(color)), ('fontSize', size),
+                       ('bold', bold), ('italic', italic), ('fontFamily', font)):
+        if value is not None:
+            text[key] = value
+            fields.append(f'textFormat.{key}')
+    if text:
+        fmt['textFormat'] = text
+    if horizontal is not None:
+        fmt['horizontalAlignment'] = horizontal
+        fields.append('horizontalAlignment')
+    if vertical is not None:
+        fmt['verticalAlignment'] = vertical
+        fields.append('verticalAlignment')
+    if wrap is not None:
+        fmt['wrapStrategy'] = 'WRAP' if wrap else 'OVERFLOW_CELL'
+        fields.append('wrapStrategy')
+    return fmt, ','.join(f'userEnteredFormat.{field}' for field in fields)
+
+
+def _format(grid, **properties):
+    fmt, fields = cell_format(**properties)
+    return {'repeatCell': {'range': grid, 'cell': {'userEnteredFormat': fmt}, 'fields': fields}}
+
+
+def _merge(grid):
+    return {'mergeCells': {'range': grid, 'mergeType': 'MERGE_ALL'}}
+
+
+def _widths(sheet_id, widths):
+    """One updateDimensionProperties per run of equally wide columns"""
+    requests = []
+    column = 0
+    for width, run in groupby(widths):
+        count = len(list(run))
+        requests.append({'updateDimensionProperties': {
+            'range': {'sheetId': sheet_id, 'dimension': 'COLUMNS', 'startIndex': column,
+                      'endIndex': column + count},
+            'properties': {'pixelSize': width}, 'fields': 'pixelSize',
+        }})
+        column += count
+    return requests
+
+
+def _height(sheet_id, row, pixels):
+    return {'updateDimensionProperties': {
+        'range': {'sheetId': sheet_id, 'dimension': 'ROWS', 'startIndex': row - 1, 'endIndex': row},
+        'properties': {'pixelSize': pixels}, 'fields': 'pixelSize',
+    }}
+
+
+def _add_sheet(sheet_id, title, index, frozen_rows, rows, hidden=False):
+    properties = {
+        'sheetId': sheet_id, 'title': title, 'index': index,
+        'gridProperties': {'rowCount': max(MIN_ROWS, rows), 'columnCount': MIN_COLUMNS,
+                           'frozenRowCount': frozen_rows},
+    }
+    if hidden:
+        properties['hidden'] = True
+    return {'addSheet': {'properties': properties}}
+
+
+def _range_validation(grid, lookup):
+    """Dropdown of the values of a LookupList, read from the hidden Lists sheet"""
+    return {'setDataValidation': {'range': grid, 'rule': {
+        'condition': {'type': 'ONE_OF_RANGE', 'values': [{'userEnteredValue': f'={lookup.ref}'}]},
+        'showCustomUi': True, 'strict': False,
+    }}}
+
+
+def _lookup_validations(sheet_title, headers, lists, rows):
+    """One dropdown per validated column and run of data ``rows``, skipping banner rows"""
+    sheet = SHEET_IDS[sheet_title]
+    return [_range_validation(grid_range(sheet, first_row, column, last_row), lookup)
+            for column, lookup in validations(sheet_title, headers, lists)
+            for first_row, last_row in row_spans(rows)]
+
+
+def _checkbox_validation(grid):
+    return {'setDataValidation': {'range': grid, 'rule': {'condition': {'type': 'BOOLEAN'}}}}
+
+
+def value_color_rules(sheet_id, first_row, last_row=None, headers=HEADERS, columns=None, colors=COLORS):
+    """addConditionalFormatRule requests for VALUE_COLORS, one per value per column range"""
+    requests = []
+    for header, match, value, fill, font_color, bold in VALUE_COLORS:
+        if columns is not None and header not in columns:
+            continue
+        column = headers.index(header) + 1
+        text_format = {'foregroundColor': _rgb(colors[font_color])}
+        if bold:
+            text_format['bold'] = True
+        requests.append({'addConditionalFormatRule': {'index': len(requests), 'rule': {
+            'ranges': [grid_range(sheet_id, first_row, column, last_row)],
+            'booleanRule': {
+                'condition': {'type': 'TEXT_CONTAINS' if match == 'contains' else 'TEXT_EQ',
+                              'values': [{'userEnteredValue': value}]},
+                'format': {'backgroundColor': _rgb(colors[fill]), 'textFormat': text_format},
+            },
+        }}})
+    return requests
+
+
+def _main_requests(agents_data, colors, title, top, top_n, columns, lists):
+    sheet = SHEET_IDS[SHEET_MAIN]
+    last = FIRST_DATA_ROW + len(agents_data) - 1
+    white = colors['white']
+
+    rows = [
+        [title],
+        [f"Total Time Saved: {format_hours(columns.total_hours())} hours/week\n"
+         "Your Current Week: 80 hours →\nFuture Week: 40 hours strategic"],
+        [],
+        ["INSTRUCTIONS: Rate each agent 1-5 (1=Low Priority, 5=Critical)\nWe'll build your top 5 first"],
+        [],
+        list(HEADERS),
+    ]
+    categories = []
+    agent_rows = []
+    for row, item in enumerate(agents_data, FIRST_DATA_ROW):
+        if isinstance(item, Agent):
+            rows.append(item.cells())
+            agent_rows.append(row)
+        elif isinstance(item, Category):
+            rows.append([item.name])
+            categories.append(_merge(grid_range(sheet, row, 1, row, 10)))
+            categories.append(_format(grid_range(sheet, row, 1, row, 10), background=item.color,
+                                    color=item.font_color, size=12, bold=True,
+                                    horizontal='LEFT', vertical='MIDDLE'))
+        elif isinstance(item, Spacing):
+            rows.append([])
+
+    c, a, g = f'C{FIRST_DATA_ROW}:C{last}', f'A{FIRST_DATA_ROW}:A{last}', f'G{FIRST_DATA_ROW}:G{last}'
+    dashboard = [
+        ['📊 SUMMARY DASHBOARD'], [], ['Total Agents:', f'=COUNTA({c})'], [],
+        ['Rated by You:', f'=COUNTA({a})'], ['Avg Priority:', f'=AVERAGE({a})'], [],
+        ['TIME SAVINGS:'], ['Quick Wins:', f'{format_hours(columns.quick_win_hours())} hrs/week'],
+        ['Total Possible:', f'{format_hours(columns.total_hours())} hrs/week'], [],
+        ['COMPLEXITY:'], ['Low:', f'=COUNTIF({g},"Low")'], ['Medium:', f'=COUNTIF({g},"Medium")'],
+        ['High:', f'=COUNTIF({g},"High")'], [], [f'TOP {top_n} PRIORITIES:'],
+    ]
+    names = [agent.name for _, agent in top]
+    dashboard += [[f'{rank}.', names[rank - 1] if rank <= len(names) else None] for rank in range(1, top_n + 1)]
+    rows += [[] for _ in range(len(dashboard) - len(rows))]
+    for row, dash_row in zip(rows, dashboard):
+        if dash_row:
+            row.extend([None] * (DASHBOARD_COLUMN - 1 - len(row)) + dash_row)
+
+    banner = dict(horizontal='CENTER', vertical='MIDDLE', wrap=True, font=FONT)
+    requests = [
+        _add_sheet(sheet, SHEET_MAIN, 0, 6, len(rows)),
+        _values(sheet, rows),
+        *(_merge(grid_range(sheet, row, 1, row, 10)) for row in (1, 2, 4)),
+        _format(grid_range(sheet, 1, 1, 1, 10), color=white, background=colors['purpleGrad'],
+                size=24, bold=True, **banner),
+        _format(grid_range(sheet, 2, 1, 2, 10), background=colors['lightPurple'], size=14, **banner),
+        _format(grid_range(sheet, 4, 1, 4, 10), background=colors['lightBlue'], size=12, italic=True, **banner),
+        _height(sheet, 1, 72),
+        _height(sheet, 2, 60),
+        _format(grid_range(sheet, FIRST_DATA_ROW, 1, last, 10), font=FONT, size=10),
+        _format(grid_range(sheet, 6, 1, 6, 10), bold=True, size=11, background=colors['darkGray'],
+                color=white, horizontal='CENTER', vertical='MIDDLE', font=FONT),
+        *_widths(sheet, PIXEL_WIDTHS),
+        # Wrapped description and notes, centered short columns
+        *(_format(grid_range(sheet, FIRST_DATA_ROW, column, last), wrap=True) for column in (4, 9)),
+        *(_format(grid_range(sheet, FIRST_DATA_ROW, first, last, end), horizontal='CENTER')
+          for first, end in ((1, 1), (5, 8), (10, 10))),
+        *categories,
+        *_lookup_validations(SHEET_MAIN, HEADERS, lists, agent_rows),
+        *(_checkbox_validation(grid_range(sheet, first_row, 10, last_row))
+          for first_row, last_row in row_spans(agent_rows)),
+        # Summary dashboard (L:N)
+        _format(grid_range(sheet, 1, DASHBOARD_COLUMN, len(dashboard), DASHBOARD_COLUMN + 2), font=FONT),
+        _merge(grid_range(sheet, 1, DASHBOARD_COLUMN, 1, DASHBOARD_COLUMN + 2)),
+        _format(grid_range(sheet, 1, DASHBOARD_COLUMN, 1, DASHBOARD_COLUMN + 2), background=colors['darkGray'],
+                color=white, size=14, bold=True, horizontal='CENTER'),
+        *(_format(grid_range(sheet, row, DASHBOARD_COLUMN), bold=True) for row in (8, 12, 17)),
+    ]
+    requests += value_color_rules(sheet, FIRST_DATA_ROW, last, colors=colors)
+    return requests
+
+
+def _quick_requests(agents_data, colors):
+    sheet = SHEET_IDS[SHEET_QUICK]
+    last = FIRST_DATA_ROW + len(agents_data) - 1
+    portfolio = f"'{SHEET_MAIN}'"
+    rows = [
+        ['⚡ QUICK WIN AGENTS\nHigh Impact + Fast to Build'], [], list(HEADERS),
+        # Live view of the portfolio, so it follows edits to the Quick Win? column
+        [f'=FILTER({portfolio}!A{FIRST_DATA_ROW}:J{last}, {portfolio}!J{FIRST_DATA_ROW}:J{last}=TRUE)'],
+    ]
+    quick_wins = sum(1 for item in agents_data if isinstance(item, Agent) and item.quick_win is True)
+    return [
+        _add_sheet(sheet, SHEET_QUICK, 1, 3, 3 + quick_wins),
+        _values(sheet, rows),
+        _merge(grid_range(sheet, 1, 1, 1, 10)),
+        _format(grid_range(sheet, 1, 1, 1, 10), wrap=True, horizontal='CENTER', vertical='MIDDLE',
+                background=colors['amber'], color=colors['white'], bold=True, size=24),
+        _height(sheet, 1, 72),
+        _format(grid_range(sheet, 3, 1, 3, 10), bold=True, size=11, background=colors['darkGray'],
+                color=colors['white'], horizontal='CENTER'),
+        _format(grid_range(sheet, 4, 1, max(MIN_ROWS, 3 + quick_wins), 10), font=FONT, size=10),
+        *_widths(sheet, PIXEL_WIDTHS),
+        *value_color_rules(sheet, 4, columns=QUICK_VALUE_COLUMNS, colors=colors),
+    ]
+
+
+def _roadmap_requests(colors, top, top_n, lists, scheduled=None):
+    sheet = SHEET_IDS[SHEET_ROADMAP]
+    rows = [['🚀 AGENT BUILD ROADMAP'], [], list(R_HEADERS)]
+    banners = []
+    data_rows = []
+    for (label, color_key), (filled, size) in zip(ROADMAP_PHASES, phase_rows(top, top_n, scheduled)):
+        row = len(rows) + 1
+        rows.append([label])
+        banners.append(_merge(grid_range(sheet, row, 1, row, 9)))
+        banners.append(_format(grid_range(sheet, row, 1, row, 9), background=colors[color_key],
+                                color=colors['white'], bold=True, wrap=True))
+        rows += filled + [[] for _ in range(size - len(filled))]
+        data_rows += range(row + 1, row + 1 + size)
+
+    return [
+        _add_sheet(sheet, SHEET_ROADMAP, 2, 3, len(rows)),
+        _values(sheet, rows),
+        _merge(grid_range(sheet, 1, 1, 1, 9)),
+        _format(grid_range(sheet, 1, 1, 1, 9), background=colors['purpleGrad'], color=colors['white'],
+                horizontal='CENTER', bold=True, size=24),
+        _format(grid_range(sheet, 3, 1, 3, 9), bold=True, background=colors['darkGray'], color=colors['white']),
+        _format(grid_range(sheet, 3, 1, len(rows), 9), font=FONT, size=10),
+        *banners,
+        *_widths(sheet, R_PIXEL_WIDTHS),
+        *_lookup_validations(SHEET_ROADMAP, R_HEADERS, lists, data_rows),
+    ]
+
+
+def _lists_requests(lists):
+    sheet = SHEET_IDS[SHEET_LISTS]
+    rows = list(lookup_rows(lists))
+    return [
+        _add_sheet(sheet, SHEET_LISTS, 3, 1, len(rows), hidden=True),
+        _values(sheet, rows),
+    ]
+
+
+def build_requests(agents_data, colors=COLORS, title=DEFAULT_TITLE, top_n=TOP_N, roadmap_plan=None):
+    """The batchUpdate requests that build all the sheets from ``agents_data``.
+
+    ``agents_data`` is the flat Category/Agent/Spacing list the Excel
+    generator renders, with hex category colors. ``roadmap_plan`` schedules
+    the Build Roadmap as in create_agent_portfolio_excel().
+    """
+    top = top_agents(agents_data, top_n)
+    columns = AgentColumns.from_agents_data(agents_data)
+    scheduled = schedule(agents_data, **roadmap_plan) if roadmap_plan is not None else None
+    lists = lookup_lists(CatalogIndex(agents_data), (roadmap_plan or {}).get('owners', ()))
+    return (_main_requests(agents_data, colors, title, top, top_n, columns, lists)
+            + _quick_requests(agents_data, colors)
+            + _roadmap_requests(colors, top, top_n, lists, scheduled)
+            + _lists_requests(lists))
+
+
+def _call(method, url, token=None, body=None):
+    headers = {'Content-Type': 'application/json'}
+    if token:
+        headers['Authorization'] = f'Bearer {token}'
+    request = urllib.request.Request(url, data=body, headers=headers, method=method)
+    with urllib.request.urlopen(request) as response:
+        return json.load(response)
+
+
+def publish(spreadsheet_id, requests, token=None, endpoint=SHEETS_ENDPOINT):
+    """Replace the portfolio sheets of ``spreadsheet_id`` and return call statistics.
+
+    The spreadsheet's sheets are listed first, so sheets left by a previous
+    build are deleted in the same batch that adds the new ones. The API
+    refuses to delete a spreadsheet's last sheet, so when all of them are
+    stale a placeholder sheet is added first and deleted at the end of the
+    batch. The result has ``http_calls``, ``requests`` (batchUpdate requests
+    sent) and ``payload_bytes``.
+    """
+    base = f"{endpoint.rstrip('/')}/v4/spreadsheets/{spreadsheet_id}"
+    existing = [sheet['properties'] for sheet in
+                _call('GET', f'{base}?fields=sheets.properties(sheetId,title)', token).get('sheets', [])]
+    ours = set(SHEET_IDS) | set(SHEET_IDS.values())
+    stale = [{'deleteSheet': {'sheetId': sheet['sheetId']}}
+             for sheet in existing if sheet['title'] in ours or sheet['sheetId'] in ours]
+    if stale and len(stale) == len(existing):
+        placeholder = max([sheet['sheetId'] for sheet in existing] + list(SHEET_IDS.values())) + 1
+        stale.insert(0, {'addSheet': {'properties': {'sheetId': placeholder, 'title': PLACEHOLDER_TITLE}}})
+        requests = requests + [{'deleteSheet': {'sheetId': placeholder}}]
+    body = json.dumps({'requests': stale + requests}, ensure_ascii=False).encode('utf-8')
+    _call('POST', f'{base}:batchUpdate', token, body)
+    return {'http_calls': 2, 'requests': len(stale) + len(requests), 'payload_bytes': len(body)}
+
+
+class StubEndpoint:
+    """Local stand-in for the Sheets API, for offline runs.
+
+    Answers the sheet listing with ``sheets`` and records every batchUpdate
+    body in ``calls``. Use as a context manager; ``url`` is the endpoint.
+    """
+
+    def __init__(self, sheets=()):
+        self.sheets = list(sheets)
+        self.calls = []
+        stub = self
+
+        class Handler(BaseHTTPRequestHandler):
+            def do_GET(self):
+                self._reply({'sheets': [{'properties': properties} for properties in stub.sheets]})
+
+            def do_POST(self):
+                body = json.loads(self.rfile.read(int(self.headers['Content-Length'])))
+                stub.calls.append(body)
+                self._reply({'spreadsheetId': self.path.split('/')[-1].split(':')[0],
+                             'replies': [{} for _ in body['requests']]})
+
+            def _reply(self, payload):
+                data = json.dumps(payload).encode('utf-8')
+                self.send_response(200)
+                self.send_header('Content-Type', 'application/json')
+                self.send_header('Content-Length', str(len(data)))
+                self.end_headers()
+                self.wfile.write(data)
+
+            def log_message(self, *args):
+                pass
+
+        self._server = ThreadingHTTPServer(('127.0.0.1', 0), Handler)
+        self.url = f'http://127.0.0.1:{self._server.server_address[1]}'
+
+    def __enter__(self):
+        threading.Thread(target=self._server.serve_forever, daemon=True).start()
+        return self
+
+    def __exit__(self, *exc_info):
+        self._server.shutdown()
+        self._server.server_close()
+        return False
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Build the Agent Portfolio in Google Sheets with one batchUpdate')
+    parser.add_argument('--spreadsheet-id', help='target spreadsheet')
+    parser.add_argument('--endpoint', default=SHEETS_ENDPOINT, help='Sheets API endpoint (default: %(default)s)')
+    parser.add_argument('--stub', action='store_true', help='send to a local stub endpoint instead')
+    parser.add_argument('--payload', help='write the batchUpdate body to this file')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--area', action='append', dest='areas', help='only agents of this area, repeatable')
+    parser.add_argument('--top-n', type=int, default=TOP_N, help='number of top priorities to list')
+    parser.add_argument('--roadmap-plan', metavar='PLAN', help='schedule the Build Roadmap from this plan file')
+    args = parser.parse_args(argv)
+
+    agents_data = filter_records(catalog_records(load_catalog(args.catalog), COLORS), args.areas)
+    roadmap_plan = load_plan(args.roadmap_plan) if args.roadmap_plan else None
+    requests = build_requests(agents_data, top_n=args.top_n, roadmap_plan=roadmap_plan)
+    agents = sum(1 for item in agents_data if isinstance(item, Agent))
+    print(f"🧱 {len(requests)} batchUpdate requests for {agents} agents")
+
+    if args.payload:
+        with open(args.payload, 'w', encoding='utf-8') as f:
+            json.dump({'requests': requests}, f, ensure_ascii=False)
+        print(f"📝 Payload written to {args.payload}")
+
+    if args.stub:
+        with StubEndpoint() as stub:
+            stats = publish(args.spreadsheet_id or 'stub', requests, endpoint=stub.url)
+    elif args.spreadsheet_id:
+        token = os.environ.get(TOKEN_ENV)
+        if not token:
+            print(f"❌ Set {TOKEN_ENV} to an OAuth access token with the spreadsheets scope", file=sys.stderr)
+            return 2
+        stats = publish(args.spreadsheet_id, requests, token, args.endpoint)
+    else:
+        return 0
+    print(f"📤 {stats['http_calls']} HTTP calls, {stats['requests']} requests, "
+          f"{stats['payload_bytes'] / 1024:.0f}KB")
+    return 0
+
+
+if __name__ == '__main__':
+    sys.exit(main())
@@ -0,0 +1,94 @@
+"""
+Prebuilt workbook skeletons
+
+Before its first row, every native workbook carries the same scaffolding:
+the named styles of the banners, headers, categories and phases, and the
+differential styles of the value color rules. Only the palette and the set
+of category colors change it; the agents do not. Building that scaffolding
+means constructing a few hundred openpyxl style objects and serializing
+them, which was close to half the cost of a small workbook.
+
+A Skeleton is that scaffolding, built once and serialized: the numbered
+style sheet with its styles.xml, the style names and the value color
+styles. The MAX_SKELETONS most recently used are kept in memory, and every
+one is pickled as a template artifact under __pycache__, so batch jobs, the
+render service and fresh processes start each workbook from a copy. A
+long-running service asked for many category sets therefore keeps a bounded
+number in memory and reloads the rest from disk.
+"""
+
+import hashlib
+import os
+import pickle
+from collections import OrderedDict
+
+SKELETON_DIR = os.path.join(os.path.dirname(os.path.abspath(__file__)), '__pycache__')
+
+# Skeletons kept in memory: one per palette and category set in use
+MAX_SKELETONS = 16
+
+# Skeletons loaded or built by this process, by key, least recently used first
+_skeletons = OrderedDict()
+
+
+class Skeleton:
+    """The data-independent start of a native workbook; see the module docstring"""
+
+    __slots__ = ('key', 'styles', 'names', 'value_colors')
+
+    def __init__(self, key, styles, names, value_colors):
+        self.key = key
+        self.styles = styles
+        self.names = names
+        self.value_colors = value_colors
+
+
+def skeleton_key(*parts):
+    """Key of the skeleton built from ``parts`` (their repr must be stable)"""
+    return hashlib.sha256(repr(parts).encode('utf-8')).hexdigest()
+
+
+def _path(key, cache_dir):
+    return os.path.join(cache_dir or SKELETON_DIR, f'skeleton-{key[:24]}.pickle')
+
+
+def load_skeleton(key, cache_dir=None):
+    """The skeleton stored under ``key`` in memory or on disk, or None"""
+    skeleton = _skeletons.get(key)
+    if skeleton is not None:
+        _skeletons.move_to_end(key)
+        return skeleton
+    try:
+        with open(_path(key, cache_dir), 'rb') as f:
+            skeleton = pickle.load(f)
+    except (OSError, EOFError, pickle.UnpicklingError, AttributeError, ImportError):
+        return None
+    if not isinstance(skeleton, Skeleton) or skeleton.key != key:
+        return None
+    _remember(skeleton)
+    return skeleton
+
+
+def _remember(skeleton):
+    _skeletons[skeleton.key] = skeleton
+    _skeletons.move_to_end(skeleton.key)
+    while len(_skeletons) > MAX_SKELETONS:
+        _skeletons.popitem(last=False)
+
+
+def store_skeleton(skeleton, cache_dir=None):
+    """Keep ``skeleton`` for this process and write its template artifact"""
+    _remember(skeleton)
+    path = _path(skeleton.key, cache_dir)
+    tmp_path = f'{path}.{os.getpid()}.tmp'
+    try:
+        os.makedirs(os.path.dirname(path), exist_ok=True)
+        with open(tmp_path, 'wb') as f:
+            pickle.dump(skeleton, f, protocol=pickle.HIGHEST_PROTOCOL)
+        os.replace(tmp_path, path)
+    except OSError:
+        # A read-only checkout only loses the artifact, not the skeleton
+        try:
+            os.remove(tmp_path)
+        except OSError:
+            pass
@@ -0,0 +1,310 @@
+"""
+Usage-driven Time Saved/Week and Business Impact
+
+The platform records what every research source did in the tables of the
+Prisma schema (prisma/schema.prisma): Query, Response, Feedback and
+ResearchDigest. This module streams those tables in chunks, with a
+server-side cursor on Postgres, and aggregates usage per agent:
+
+- runs per week,
+- average latency, from Query.startedAt to Query.completedAt,
+- cost, at a configured rate per response,
+- feedback.
+
+The results replace the typed-in Time Saved/Week and Business Impact
+values. Memory is bounded by the number of agents and sources, not by the
+number of rows. Feedback is joined to its response by the database, so no
+response ids are held in Python.
+
+The schema has no notion of an agent, so a mapping file says which agent
+each Response.source stands for:
+
+    {
+      "sources": {"patents": "IP Landscape Monitor", "openalex": "Research Trend Scanner"},
+      "digest_agent": "Breakthrough Detector",
+      "minutes_per_run": {"*": 10, "Grant Intelligence Agent": 45},
+      "cost_per_run": {"claude": 0.02, "gpt4": 0.03}
+    }
+
+    python -m agent_portfolio.usage sqlite:///platform.db --map usage.json
+    python -m agent_portfolio.usage "$DATABASE_URL" --map usage.json --write-catalog
+"""
+
+import argparse
+import datetime
+import json
+import os
+import sqlite3
+from collections import Counter
+
+from .catalog import DEFAULT_CATALOG_PATH, load_catalog, save_catalog
+from .records import Agent
+
+# Rows fetched per round trip
+CHUNK_ROWS = 10_000
+
+# Minutes of work one run saves, unless the mapping says otherwise
+MINUTES_PER_RUN = 10
+
+# One row per response, with the timing of the query it answered
+RESPONSES_SQL = ('SELECT r."source", r."createdAt", q."startedAt", q."completedAt" '
+                 'FROM "Response" r JOIN "Query" q ON q."id" = r."queryId"')
+# Feedback given on a response
+FEEDBACK_SQL = ('SELECT r."source", f."type", f."importance" '
+                'FROM "Feedback" f JOIN "Response" r ON r."id" = f."responseId"')
+DIGESTS_SQL = 'SELECT "date" FROM "ResearchDigest"'
+
+POSITIVE_FEEDBACK = {'LIKE', 'IMPORTANT'}
+NEGATIVE_FEEDBACK = {'DISLIKE', 'WRONG', 'IRRELEVANT'}
+
+_WEEK = 7 * 24 * 3600
+
+
+def connect(url):
+    """Open a DB-API connection for ``url``: sqlite:///path, a .db/.sqlite path, or postgresql://"""
+    if url.startswith(('postgresql://', 'postgres://')):
+        try:
+            import psycopg
+        except ImportError:
+            try:
+                import psycopg2 as psycopg
+            except ImportError:
+                raise RuntimeError('Postgres ingestion needs psycopg (pip install "psycopg[binary]")') from None
+        return psycopg.connect(url)
+    if url.startswith('sqlite:///'):
+        url = url[len('sqlite:///'):]
+    elif url.startswith('file:'):
+        url = url[len('file:'):]
+    # Read-only, so a live database is never locked for writing
+    return sqlite3.connect(f'file:{url}?mode=ro', uri=True)
+
+
+def stream_rows(connection, sql, chunk_rows=CHUNK_ROWS):
+    """Yield the rows of ``sql`` while holding at most ``chunk_rows`` of them.
+
+    Postgres drivers get a named, server-side cursor, so the result set stays
+    on the server; SQLite steps through it as rows are fetched.
+    """
+    if isinstance(connection, sqlite3.Connection):
+        cursor = connection.cursor()
+    else:
+        cursor = connection.cursor(name='portfolio_usage')
+        cursor.itersize = chunk_rows
+    try:
+        cursor.execute(sql)
+        while True:
+            rows = cursor.fetchmany(chunk_rows)
+            if not rows:
+                break
+            yield from rows
+    finally:
+        cursor.close()
+
+
+def _seconds(value):
+    """POSIX seconds of a DateTime column as any driver returns it, or None"""
+    if value is None or value == '':
+        return None
+    if isinstance(value, datetime.datetime):
+        if value.tzinfo is None:
+            value = value.replace(tzinfo=datetime.timezone.utc)
+        return value.timestamp()
+    if isinstance(value, (int, float)):
+        # Prisma's SQLite connector stores milliseconds
+        return value / 1000 if value > 1e11 else float(value)
+    return _seconds(datetime.datetime.fromisoformat(str(value).replace(' ', 'T', 1)))
+
+
+def _hours_label(hours):
+    """Time Saved cell for ``hours`` a week, in the catalog's wording"""
+    if hours < 1:
+        return f'{max(1, round(hours * 60))} min'
+    hours = round(hours * 2) / 2
+    return f"{hours:g} hour{'' if hours == 1 else 's'}"
+
+
+class AgentUsage:
+    """What the platform recorded for one agent"""
+
+    __slots__ = ('runs', 'latency_total', 'timed_runs', 'cost', 'positive', 'negative',
+                 'importance_total', 'rated', 'minutes_per_run')
+
+    def __init__(self, minutes_per_run=MINUTES_PER_RUN):
+        self.runs = 0
+        self.latency_total = 0.0
+        self.timed_runs = 0
+        self.cost = 0.0
+        self.positive = 0
+        self.negative = 0
+        self.importance_total = 0
+        self.rated = 0
+        self.minutes_per_run = minutes_per_run
+
+    @property
+    def latency(self):
+        """Average seconds from query start to completion, or None"""
+        return self.latency_total / self.timed_runs if self.timed_runs else None
+
+    def hours_per_week(self, weeks):
+        return self.runs / weeks * self.minutes_per_run / 60
+
+    def impact(self):
+        """Business Impact from feedback: the 1-5 importance if given, else the share of positive votes"""
+        if self.rated:
+            importance = self.importance_total / self.rated
+            return 'HIGH' if importance >= 4 else 'MEDIUM' if importance >= 3 else 'LOW'
+        votes = self.positive + self.negative
+        if not votes:
+            return None
+        share = self.positive / votes
+        return 'HIGH' if share >= 0.7 else 'MEDIUM' if share >= 0.4 else 'LOW'
+
+
+class Usage:
+    """Per-agent usage over the period the rows span; see read_usage()"""
+
+    def __init__(self):
+        self.agents = {}
+        self.unmapped = Counter()
+        self.rows = 0
+        self.first = None
+        self.last = None
+
+    @property
+    def weeks(self):
+        """Weeks between the first and the last run, at least one"""
+        if self.first is None:
+            return 1
+        return max(1.0, (self.last - self.first) / _WEEK)
+
+    def _seen(self, seconds):
+        if seconds is not None:
+            self.first = seconds if self.first is None else min(self.first, seconds)
+            self.last = seconds if self.last is None else max(self.last, seconds)
+
+
+def load_mapping(path):
+    with open(path, encoding='utf-8') as f:
+        return json.load(f)
+
+
+def read_usage(connection, mapping, chunk_rows=CHUNK_ROWS):
+    """Stream the platform tables on ``connection`` and aggregate them per agent"""
+    sources = mapping.get('sources', {})
+    minutes = mapping.get('minutes_per_run', {})
+    if not isinstance(minutes, dict):
+        minutes = {'*': minutes}
+    rates = mapping.get('cost_per_run', {})
+    usage = Usage()
+
+    def agent_usage(name):
+        found = usage.agents.get(name)
+        if found is None:
+            found = usage.agents[name] = AgentUsage(minutes.get(name, minutes.get('*', MINUTES_PER_RUN)))
+        return found
+
+    by_source = {source: agent_usage(name) for source, name in sources.items()}
+
+    for source, created, started, completed in stream_rows(connection, RESPONSES_SQL, chunk_rows):
+        usage.rows += 1
+        agent = by_source.get(source)
+        if agent is None:
+            usage.unmapped[source] += 1
+            continue
+        agent.runs += 1
+        agent.cost += rates.get(source, 0)
+        usage._seen(_seconds(created))
+        started, completed = _seconds(started), _seconds(completed)
+        if started is not None and completed is not None:
+            agent.latency_total += completed - started
+            agent.timed_runs += 1
+
+    for source, kind, importance in stream_rows(connection, FEEDBACK_SQL, chunk_rows):
+        usage.rows += 1
+        agent = by_source.get(source)
+        if agent is None:
+            continue
+        if kind in POSITIVE_FEEDBACK:
+            agent.positive += 1
+        elif kind in NEGATIVE_FEEDBACK:
+            agent.negative += 1
+        if importance is not None:
+            agent.importance_total += importance
+            agent.rated += 1
+
+    if mapping.get('digest_agent'):
+        agent = agent_usage(mapping['digest_agent'])
+        for (date,) in stream_rows(connection, DIGESTS_SQL, chunk_rows):
+            usage.rows += 1
+            agent.runs += 1
+            usage._seen(_seconds(date))
+
+    return usage
+
+
+def apply_usage(records, usage):
+    """Return ``records`` with usage-driven Time Saved/Week and Business Impact.
+
+    Agents the platform has no runs or feedback for keep their catalog
+    values; changed agents are copies, so ``records`` is left as it was.
+    """
+    weeks = usage.weeks
+    result = []
+    for item in records:
+        found = usage.agents.get(item.name) if isinstance(item, Agent) else None
+        if found is not None:
+            time_saved = _hours_label(found.hours_per_week(weeks)) if found.runs else item.time_saved
+            impact = found.impact() or item.impact
+            if (time_saved, impact) != (item.time_saved, item.impact):
+                item = Agent(*item.cells())
+                item.time_saved = time_saved
+                item.impact = impact
+        result.append(item)
+    return result
+
+
+def main(argv=None):
+    parser = argparse.ArgumentParser(description='Fill Time Saved/Week and Business Impact from platform usage')
+    parser.add_argument('database', nargs='?', default=os.environ.get('DATABASE_URL'),
+                        help='sqlite:///path or postgresql:// URL (default: $DATABASE_URL)')
+    parser.add_argument('--map', required=True, dest='mapping', help='source-to-agent mapping file')
+    parser.add_argument('--catalog', default=DEFAULT_CATALOG_PATH, help='agent catalog file')
+    parser.add_argument('--chunk-rows', type=int, default=CHUNK_ROWS, help='rows fetched per round trip')
+    parser.add_argument('--write-catalog', action='store_true', help='save the new values to the catalog')
+    args = parser.parse_args(argv)
+    if not args.database:
+        parser.error('no database given and DATABASE_URL is not set')
+
+    connection = connect(args.database)
+    try:
+        usage = read_usage(connection, load_mapping(args.mapping), args.chunk_rows)
+    finally:
+        connection.close()
+
+    print(f"📥 Read {usage.rows} rows covering {usage.weeks:.1f} weeks")
+    for name, found in sorted(usage.agents.items()):
+        latency = f'{found.latency:.1f}s' if found.latency is not None else 'n/a'
+        print(f"   {name}: {found.runs} runs, {found.hours_per_week(usage.weeks):.1f} hrs/week, "
+              f"{latency} latency, ${found.cost:,.2f}, impact {found.impact() or 'unchanged'}")
+    if usage.unmapped:
+        unmapped = ', '.join(f'{source} ({rows})' for source, rows in usage.unmapped.most_common())
+        print(f"⚠️  Unmapped sources: {unmapped}")
+
+    categories = load_catalog(args.catalog, use_cache=False)
+    known = {agent.name for category in categories for agent in category['agents']}
+    missing = sorted(set(usage.agents) - known)
+    if missing:
+        print(f"⚠️  Not in catalog: {', '.join(missing)}")
+    if args.write_catalog:
+        updated = 0
+        for category in categories:
+            agents = apply_usage(category['agents'], usage)
+            updated += sum(1 for old, new in zip(category['agents'], agents) if old is not new)
+            category['agents'] = agents
+        if updated:
+            save_catalog(categories, args.catalog)
+        print(f"✅ {updated} agents updated in {os.path.relpath(args.catalog)}")
+
+
+if __name__ == '__main__':
+    main()
@@ -0,0 +1,120 @@
+"""
+Derived sheets
+
+A derived sheet (a View) lists a subset of the catalog's agents under the
+Agent Portfolio column headers. Quick Wins is one. The catalog is indexed
+once by each dimension (CatalogIndex), and every view is declared as a key
+match on one dimension, optionally grouped by another. Adding views
+therefore costs no extra scans of the catalog: each one reads the positions
+it needs from the index, and all of them share the header, width and style
+setup of create_agents_excel.py.
+
+    View('High Impact', '📈 HIGH IMPACT AGENTS', where=('impact', 'HIGH'), group_by='area')
+"""
+
+from heapq import merge
+
+from .layout import QUICK_VALUE_COLUMNS, SHEET_QUICK
+from .records import Agent
+
+# Agent fields a view can select or group on
+DIMENSIONS = ('priority', 'area', 'impact', 'complexity', 'status', 'quick_win')
+
+
+class CatalogIndex:
+    """Catalog positions of the agents, by value of each dimension.
+
+    ``agents`` lists the agents in catalog order; ``keys[dimension]`` maps
+    each value to the ascending positions of the agents that have it, in
+    order of first appearance.
+    """
+
+    __slots__ = ('agents', 'keys')
+
+    def __init__(self, agents_data, dimensions=DIMENSIONS):
+        self.agents = []
+        self.keys = {dimension: {} for dimension in dimensions}
+        for item in agents_data:
+            if isinstance(item, Agent):
+                position = len(self.agents)
+                self.agents.append(item)
+                for dimension, index in self.keys.items():
+                    index.setdefault(getattr(item, dimension), []).append(position)
+
+    def positions(self, dimension=None, match=None):
+        """Ascending positions of the agents whose ``dimension`` matches.
+
+        ``match`` is a value, a set/list/tuple of values, or a predicate
+        called once per distinct value; without a dimension every agent
+        matches.
+        """
+        if dimension is None:
+            return range(len(self.agents))
+        index = self.keys[dimension]
+        if callable(match):
+            keys = [key for key in index if match(key)]
+        elif isinstance(match, (set, frozenset, list, tuple)):
+            keys = [key for key in match if key in index]
+        else:
+            keys = [match] if match in index else []
+        if len(keys) == 1:
+            return index[keys[0]]
+        return list(merge(*(index[key] for key in keys)))
+
+
+class View:
+    """A derived sheet: the agents matching ``where``, optionally grouped.
+
+    ``where`` is a (dimension, match) pair as taken by
+    CatalogIndex.positions(), or None for every agent. With ``group_by``,
+    the agents are listed under one banner row per value of that dimension,
+    in order of first appearance. ``style`` names the title banner's style
+    and ``value_columns`` the columns that keep their value color coding.
+    """
+
+    __slots__ = ('title', 'banner', 'where', 'group_by', 'style', 'value_columns')
+
+    def __init__(self, title, banner, where=None, group_by=None, style='view-title',
+                 value_columns=QUICK_VALUE_COLUMNS):
+        self.title = title
+        self.banner = banner
+        self.where = where
+        self.group_by = group_by
+        self.style = style
+        self.value_columns = value_columns
+
+    def groups(self, index):
+        """[(group value or None, [agents])] for this view, in catalog order"""
+        positions = index.positions(*(self.where or ()))
+        if self.group_by is None:
+            return [(None, [index.agents[position] for position in positions])]
+        selected = set(positions)
+        groups = []
+        for key, members in index.keys[self.group_by].items():
+            agents = [index.agents[position] for position in members if position in selected]
+            if agents:
+                groups.append((key, agents))
+        return groups
+
+    def __repr__(self):
+        return (f'View({self.title!r}, {self.banner!r}, where={self.where!r}, group_by={self.group_by!r}, '
+                f'style={self.style!r}, value_columns={self.value_columns!r})')
+
+
+QUICK_WINS = View(SHEET_QUICK, '⚡ QUICK WIN AGENTS\nHigh Impact + Fast to Build',
+                  where=('quick_win', True), style='quick-title')
+BY_AREA = View('By Area', '🗂️ AGENTS BY AREA', group_by='area')
+BY_IMPACT = View('By Impact', '📈 AGENTS BY BUSINESS IMPACT', group_by='impact')
+BY_COMPLEXITY = View('By Complexity', '🛠️ AGENTS BY BUILD COMPLEXITY', group_by='complexity')
+BY_STATUS = View('By Status', '📋 AGENTS BY STATUS', group_by='status')
+
+# Views by command line name
+VIEWS = {
+    'quick-wins': QUICK_WINS,
+    'by-area': BY_AREA,
+    'by-impact': BY_IMPACT,
+    'by-complexity': BY_COMPLEXITY,
+    'by-status': BY_STATUS,
+}
+
+DEFAULT_VIEWS = (QUICK_WINS,)
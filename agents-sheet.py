@@ -1,3 +1,5 @@
+// Large catalogs: `python -m agent_portfolio.sheets` builds the same sheets with a
+// single batchUpdate call instead of a call per cell.
 function buildAgentForce() {
   const ss = SpreadsheetApp.getActiveSpreadsheet();
 
@@ -56,7 +58,12 @@ function buildAgentForce() {
 
   main.setRowHeights(1, 1, 72);
 
-  main.getRange('A2').setValue("Total Time Saved: 67 hours/week\nYour Current Week: 80 hours →\nFuture Week: 40 hours strategic")
+  // Categories and agents come from the shared catalog (sheets/agents_catalog.json),
+  // the same file create_agents_excel.py renders
+  const catalog = loadAgentCatalog();
+  const savings = timeSavings(catalog);
+
+  main.getRange('A2').setValue("Total Time Saved: " + savings.total + " hours/week\nYour Current Week: 80 hours →\nFuture Week: 40 hours strategic")
     .setHorizontalAlignment('center').setVerticalAlignment('middle')
     .setWrap(true).setBackground(colors.lightPurple).setFontSize(14);
 
@@ -116,95 +123,16 @@ function buildAgentForce() {
   // Row tracker
   let r = 7;
 
-  // STRATEGIC INTELLIGENCE
-  addCategoryRow(r, '🎯 STRATEGIC INTELLIGENCE', colors.purple); r++;
-  agentRow(r++, ['','Strategic Intelligence','Competitive Intelligence Agent','Monitors 20+ competitors daily - tracks publications, patents, clinical trials. Alerts on significant developments.','3 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Strategic Intelligence','Research Trend Scanner','Identifies emerging cancer research trends 6-12 months before mainstream through citation velocity analysis.','2 hours','HIGH','High','Not Started','', true]);
-  agentRow(r++, ['','Strategic Intelligence','IP Landscape Monitor','Tracks patent landscape, identifies freedom-to-operate risks and white space opportunities.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Strategic Intelligence','Grant Intelligence Agent','Finds relevant grants (NIH, NSF, DOD), analyzes winning proposals, estimates success probability.','3 hours','HIGH','Medium','Not Started','', true]);
-
-  // spacing
-  r++; // empty row
-
-  // INVESTOR RELATIONS
-  addCategoryRow(r, '💼 INVESTOR RELATIONS', colors.blue); r++;
-  agentRow(r++, ['','Investor Relations','Investor Update Generator','Auto-generates weekly/monthly investor updates from research progress, milestones, and achievements.','4 hours','HIGH','Low','Not Started','', true]);
-  agentRow(r++, ['','Investor Relations','Pitch Deck Intelligence','Keeps pitch deck current with latest milestones, competitive landscape, publications, team accomplishments.','2 hours','MEDIUM','Low','Not Started','', true]);
-  agentRow(r++, ['','Investor Relations','Fundraising Opportunity Scanner','Identifies potential investors, tracks VC fund raises, suggests timing and warm intro paths.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Investor Relations','Grant Writing Assistant','Helps write and improve grant proposals based on winning examples and reviewer feedback patterns.','3 hours','HIGH','High','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // RESEARCH OVERSIGHT
-  addCategoryRow(r, '🔬 RESEARCH OVERSIGHT', colors.green); r++;
-  agentRow(r++, ['','Research Oversight','Breakthrough Detector','Flags significant research findings from team before formal reporting. Suggests patent opportunities.','1 hour','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Research Oversight','Research Portfolio Dashboard','Real-time view of all projects: status, blockers, dependencies, timeline, risk flags.','2 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Research Oversight','Publication Opportunity Finder','Matches research to journals, estimates acceptance likelihood, tracks submission deadlines.','1 hour','MEDIUM','Low','Not Started','', false]);
-  agentRow(r++, ['','Research Oversight','Collaboration Matchmaker','Identifies external collaboration opportunities, finds complementary research partners.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Research Oversight','Research ROI Tracker','Tracks cost per publication, grant success rates, program efficiency across all research areas.','1 hour','MEDIUM','Low','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // TEAM MANAGEMENT
-  addCategoryRow(r, '👥 TEAM MANAGEMENT', colors.orange); r++;
-  agentRow(r++, ['','Team Management','Team Health Monitor','Analyzes communication patterns to detect burnout, disengagement before they escalate.','1 hour','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Team Management','Talent Pipeline Agent','Monitors top researchers in your field for hiring. Tracks publication records, identifies unhappy researchers.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Team Management','Productivity Insights','Shows team blockers without micromanaging. Identifies bottlenecks and suggests process improvements.','1 hour','MEDIUM','Low','Not Started','', false]);
-  agentRow(r++, ['','Team Management','Onboarding Accelerator','Creates personalized onboarding plans for new hires based on role and background.','1 hour','LOW','Low','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // BUSINESS DEVELOPMENT
-  addCategoryRow(r, '🤝 BUSINESS DEVELOPMENT', colors.cyan); r++;
-  agentRow(r++, ['','Business Development','Partnership Opportunity Scanner','Finds pharma/biotech working on complementary research. Identifies partnership fit and warm intros.','3 hours','HIGH','High','Not Started','', true]);
-  agentRow(r++, ['','Business Development','Clinical Trial Intelligence','Monitors relevant trials, identifies unmet needs, finds trial sponsors and partnership opportunities.','2 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Business Development','Licensing Opportunity Agent','Finds in-licensing and out-licensing opportunities. Tracks patent auctions and technology transfers.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Business Development','Conference ROI Analyzer','Recommends which conferences to attend/sponsor based on attendee analysis and partnership ROI.','1 hour','LOW','Low','Not Started','', false]);
-  agentRow(r++, ['','Business Development','Market Intelligence','Tracks cancer drug market trends, competitor pipelines, M&A activity, and exit opportunities.','2 hours','MEDIUM','Medium','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // COMMUNICATIONS & ADMIN
-  addCategoryRow(r, '📧 COMMUNICATIONS & ADMIN', colors.pink); r++;
-  agentRow(r++, ['','Communications','Email Prioritizer','Sorts 200+ daily emails into: urgent/review/delegate/ignore with smart summaries.','5 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Communications','Meeting Prep Agent','Prepares briefing docs for every meeting: attendee background, talking points, suggested outcomes.','3 hours','HIGH','Low','Not Started','', true]);
-  agentRow(r++, ['','Communications','Board Report Generator','Compiles monthly board reports from research progress, financials, team updates automatically.','4 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Communications','Internal Announcements Writer','Drafts team communications: milestone celebrations, new hires, policy updates.','1 hour','LOW','Low','Not Started','', false]);
-  agentRow(r++, ['','Communications','LinkedIn Content Generator','Creates LinkedIn posts highlighting research achievements, team milestones, thought leadership.','2 hours','MEDIUM','Low','Not Started','', false]);
-  agentRow(r++, ['','Communications','Press Release Writer','Drafts press releases for significant research breakthroughs and company milestones.','2 hours','MEDIUM','Low','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // FINANCIAL OPERATIONS
-  addCategoryRow(r, '💰 FINANCIAL OPERATIONS', colors.yellow, colors.black); r++;
-  agentRow(r++, ['','Financial','Budget Optimizer','Recommends resource reallocation based on research progress and ROI analysis.','2 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Financial','Burn Rate Monitor','Tracks spending velocity daily, alerts on budget risks, calculates runway.','1 hour','HIGH','Low','Not Started','', true]);
-  agentRow(r++, ['','Financial','Research ROI Analyzer','Calculates cost per publication, grant success ROI, program efficiency. Investment recommendations.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Financial','Vendor Intelligence','Monitors equipment/service vendors for better pricing, tracks contract renewals, suggests alternatives.','1 hour','LOW','Low','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // REGULATORY & COMPLIANCE
-  addCategoryRow(r, '⚖️ REGULATORY & COMPLIANCE', colors.red); r++;
-  agentRow(r++, ['','Regulatory','Regulatory Intelligence','Monitors FDA/regulatory changes affecting ACM research. Tracks approval trends and competitor approvals.','2 hours','MEDIUM','Medium','Not Started','', false]);
-  agentRow(r++, ['','Regulatory','Risk Monitor','Flags compliance risks, research ethics issues, safety concerns, IP infringement risks.','1 hour','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Regulatory','Audit Preparation','Maintains audit-ready documentation, flags potential audit issues before they become problems.','1 hour','MEDIUM','Low','Not Started','', false]);
-
-  // spacing
-  r++;
-
-  // PERSONAL PRODUCTIVITY
-  addCategoryRow(r, '🧠 PERSONAL PRODUCTIVITY', colors.indigo); r++;
-  agentRow(r++, ['','Personal','Decision Intelligence','Summarizes complex issues with pros/cons, risk assessment, data-driven recommendations.','3 hours','HIGH','High','Not Started','', true]);
-  agentRow(r++, ['','Personal','Reading Digest Agent','Curates must-read papers, industry news, competitor updates into 10-minute daily digest.','5 hours','HIGH','Medium','Not Started','', true]);
-  agentRow(r++, ['','Personal','Calendar Optimizer','Suggests meeting consolidation, blocks focus time, identifies unnecessary meetings.','2 hours','MEDIUM','Low','Not Started','', true]);
-  agentRow(r++, ['','Personal','Travel Coordinator','Books travel, manages itineraries, prepares trip briefs with meeting schedules and local intel.','2 hours','LOW','Low','Not Started','', false]);
+  catalog.categories.forEach((cat, i) => {
+    // spacing
+    if (i > 0) r++;
+
+    addCategoryRow(r, cat.name, colors[cat.color], colors[cat.font_color || 'white']); r++;
+    cat.agents.forEach(a => agentRow(r++, [
+      a.priority || '', a.area, a.name, a.description, a.time_saved,
+      a.impact, a.complexity, a.status, a.notes || '', a.quick_win
+    ]));
+  });
 
   const lastDataRow = r - 1;
 
@@ -339,9 +267,9 @@ function buildAgentForce() {
   main.getRange('L8').setValue('TIME SAVINGS:');
   bold(main.getRange('L8'));
   main.getRange('L9').setValue('Quick Wins:');
-  main.getRange('M9').setValue('25 hrs/week');
+  main.getRange('M9').setValue(savings.quickWins + ' hrs/week');
   main.getRange('L10').setValue('Total Possible:');
-  main.getRange('M10').setValue('67 hrs/week');
+  main.getRange('M10').setValue(savings.total + ' hrs/week');
 
   main.getRange('L12').setValue('COMPLEXITY:');
   bold(main.getRange('L12'));
@@ -352,15 +280,16 @@ function buildAgentForce() {
   main.getRange('L15').setValue('High:');
   main.getRange('M15').setFormula('=COUNTIF(G7:G'+lastDataRow+',"High")');
 
-  main.getRange('L17').setValue('TOP 5 PRIORITIES:');
+  // Top priorities are ranked once here (see topAgents) and written as values
+  const TOP_N = 5;
+  const top = topAgents(catalog, TOP_N);
+  main.getRange('L17').setValue('TOP ' + TOP_N + ' PRIORITIES:');
   bold(main.getRange('L17'));
-  main.getRange('L18').setValue('1.');
-  main.getRange('M18').setFormula('=INDEX(C7:C'+lastDataRow+', MATCH(MAX(A7:A'+lastDataRow+'), A7:A'+lastDataRow+', 0))');
-  // Simple examples for 2-5 (non-duplicate logic kept simple)
-  main.getRange('L19').setValue('2.');
-  main.getRange('M19').setFormula('=INDEX(C7:C'+lastDataRow+', MATCH(LARGE(A7:A'+lastDataRow+',2), A7:A'+lastDataRow+', 0))');
-  main.getRange('L20').setValue('3.');
-  main.getRange('M20').setFormula('=INDEX(C7:C'+lastDataRow+', MATCH(LARGE(A7:A'+lastDataRow+',3), A7:A'+lastDataRow+', 0))');
+  const topRows = [];
+  for (let k = 0; k < TOP_N; k++) {
+    topRows.push([(k + 1) + '.', top[k] ? top[k].agent.name : '']);
+  }
+  main.getRange(18, 12, TOP_N, 2).setValues(topRows);
 
   // === QUICK WINS SHEET ===
   quick.getRange('A1:J1').merge().setValue('⚡ QUICK WIN AGENTS\nHigh Impact + Fast to Build')
@@ -434,14 +363,11 @@ function buildAgentForce() {
   roadmap.getRange('A16:I16').merge().setValue('PHASE 3: AUTOMATION (Weeks 13-24)\nProcess optimization agents')
     .setBackground(colors.green).setFontColor(colors.white).setFontWeight('bold').setWrap(true);
 
-  // Auto-populate Top 5 (rows 5-9) — uses Priority column in main
-  // B5 (Agent Name highest rated)
-  roadmap.getRange('B5').setFormula(`=INDEX(SORT(FILTER('Agent Portfolio'!C7:C${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FILTER('Agent Portfolio'!A7:A${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FALSE), 1)`);
-  // Simple fill-down approach for next items (2-5) by k=2..5
-  roadmap.getRange('B6').setFormula(`=INDEX(SORT(FILTER('Agent Portfolio'!C7:C${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FILTER('Agent Portfolio'!A7:A${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FALSE), 2)`);
-  roadmap.getRange('B7').setFormula(`=INDEX(SORT(FILTER('Agent Portfolio'!C7:C${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FILTER('Agent Portfolio'!A7:A${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FALSE), 3)`);
-  roadmap.getRange('B8').setFormula(`=INDEX(SORT(FILTER('Agent Portfolio'!C7:C${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FILTER('Agent Portfolio'!A7:A${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FALSE), 4)`);
-  roadmap.getRange('B9').setFormula(`=INDEX(SORT(FILTER('Agent Portfolio'!C7:C${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FILTER('Agent Portfolio'!A7:A${lastDataRow}, 'Agent Portfolio'!A7:A${lastDataRow}<>""), FALSE), 5)`);
+  // Top-ranked agents fill the Phase 1 rows (5-9): name, priority score, time saved
+  if (top.length) {
+    roadmap.getRange(5, 2, top.length, 3)
+      .setValues(top.map(t => [t.agent.name, t.score, t.agent.time_saved]));
+  }
 
   // Column widths Roadmap
   const rWidths = [120,300,140,120,120,220,120,120,160];
@@ -466,3 +392,71 @@ function buildAgentForce() {
   // Done
   ss.setActiveSheet(main);
 }
+
+// Fetch the shared agent catalog. Set the AGENT_CATALOG_URL script property
+// (Project Settings > Script Properties) to the raw URL of sheets/agents_catalog.json.
+function loadAgentCatalog() {
+  const url = PropertiesService.getScriptProperties().getProperty('AGENT_CATALOG_URL');
+  if (!url) {
+    throw new Error('AGENT_CATALOG_URL script property is not set (raw URL of sheets/agents_catalog.json)');
+  }
+  return JSON.parse(UrlFetchApp.fetch(url).getContentText());
+}
+
+// Hours per week from a Time Saved value ('3 hours', '1 hour', '30 min'),
+// parsed the same way as agent_portfolio/columns.py
+function parseHours(value) {
+  if (typeof value === 'number') return value;
+  const m = String(value || '').match(/(\d+(?:\.\d+)?)\s*(min)?/i);
+  if (!m) return 0;
+  return m[2] ? parseFloat(m[1]) / 60 : parseFloat(m[1]);
+}
+
+// Total and quick-win hours saved per week across the catalog
+function timeSavings(catalog) {
+  let total = 0, quickWins = 0;
+  catalog.categories.forEach(cat => cat.agents.forEach(agent => {
+    const hours = parseHours(agent.time_saved);
+    total += hours;
+    if (agent.quick_win === true) quickWins += hours;
+  }));
+  return { total: total, quickWins: quickWins };
+}
+
+// Rank rated agents by priority; ties go to higher impact, then lower build
+// complexity, then more time saved, then catalog order (agent_portfolio/ranking.py
+// does the same for the Excel workbook). Keeps at most n entries while scanning.
+function topAgents(catalog, n) {
+  const impactRank = { HIGH: 3, MEDIUM: 2, LOW: 1 };
+  const easeRank = { Low: 3, Medium: 2, High: 1 };
+  const number = (v) => {
+    const m = String(v === undefined || v === null ? '' : v).match(/\d+(\.\d+)?/);
+    return m ? parseFloat(m[0]) : null;
+  };
+  const better = (a, b) => {
+    for (let i = 0; i < a.key.length; i++) {
+      if (a.key[i] !== b.key[i]) return a.key[i] > b.key[i];
+    }
+    return false;
+  };
+
+  const best = [];
+  let position = 0;
+  catalog.categories.forEach(cat => cat.agents.forEach(agent => {
+    position++;
+    const score = agent.priority ? number(agent.priority) : null;
+    if (score === null) return;
+    const entry = {
+      agent: agent,
+      score: score,
+      key: [score, impactRank[agent.impact] || 0, easeRank[agent.complexity] || 0,
+            parseHours(agent.time_saved), -position]
+    };
+    if (best.length === n && !better(entry, best[n - 1])) return;
+    let i = Math.min(best.length, n - 1);
+    while (i > 0 && better(entry, best[i - 1])) i--;
+    best.splice(i, 0, entry);
+    if (best.length > n) best.pop();
+  }));
+  return best;
+}
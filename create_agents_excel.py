@@ -2,351 +2,917 @@
 """
 Create AI Agent Portfolio Excel Spreadsheet
 Converts the Google Apps Script to a Python script that generates an Excel file
+
+Every sheet is produced by a row generator that emits its rows in order, so
+the same code drives both the regular in-memory workbook and the streaming
+(write-only) mode used for very large catalogs.
 """
 
-from openpyxl import Workbook
-from openpyxl.styles import Font, PatternFill, Alignment, Border, Side
+from openpyxl import Workbook, __version__ as openpyxl_version
+from openpyxl.cell import Cell, WriteOnlyCell
+from openpyxl.formatting.rule import Rule
+from openpyxl.styles.differential import DifferentialStyle
+from openpyxl.styles import Font, PatternFill, Alignment, Border, Side, NamedStyle
+from openpyxl.styles.fonts import DEFAULT_FONT
 from openpyxl.utils import get_column_letter
+from openpyxl.workbook.defined_name import DefinedName
+from openpyxl.worksheet.cell_range import CellRange
 from openpyxl.worksheet.datavalidation import DataValidation
+from concurrent.futures import ProcessPoolExecutor, as_completed
+from contextlib import nullcontext
+from copy import copy
+from functools import lru_cache
+from itertools import chain, repeat, zip_longest
+from types import SimpleNamespace
+import glob
+import hashlib
 import os
+import tempfile
+
+from agent_portfolio.catalog import DEFAULT_CATALOG_PATH, load_catalog
+from agent_portfolio.columns import AgentColumns, format_hours
+from agent_portfolio.dashboard import dashboard_values
+from agent_portfolio.instrument import from_environment
+from agent_portfolio.incremental import (
+    fingerprint, manifest_comment, read_manifest, reusable_sheets, sheet_part,
+)
+from agent_portfolio.layout import (
+    COLORS, DASHBOARD_COLUMN, FIRST_DATA_ROW, HEADERS, R_HEADERS, S_HEADERS, DEFAULT_TITLE, ROADMAP_PHASES,
+    SHEET_MAIN, SHEET_ROADMAP, SHEET_SCENARIOS, SHEET_LISTS, VALUE_COLORS,
+)
+from agent_portfolio.lookups import lookup_lists, lookup_rows, row_spans, validations
+from agent_portfolio.native import NativeCell, NativeSheet, NativeWorkbook, frozen_strings, render_part
+from agent_portfolio.skeleton import Skeleton, load_skeleton, skeleton_key, store_skeleton
+from agent_portfolio.ranking import TOP_N, top_agents
+from agent_portfolio.roadmap import phase_rows, schedule
+from agent_portfolio.scenarios import assumptions, simulate
+from agent_portfolio.records import SPACING, Agent, Category, Spacing, filter_records
+from agent_portfolio.package import DEFAULT_COMPRESSION, compression_profile, write_package
+from agent_portfolio.views import DEFAULT_VIEWS, CatalogIndex
+
+# Column widths in Excel character units
+WIDTHS = [10, 20, 25, 45, 15, 15, 15, 13, 32, 10]
+R_WIDTHS = [15, 38, 18, 15, 15, 28, 15, 15, 20]
+S_WIDTHS = [38, 18, 15, 15, 15, 15, 17, 21]
+
+# Workbook writers: openpyxl, or agent_portfolio.native for the largest catalogs
+BACKENDS = ('openpyxl', 'native')
+
+# Instrumented stages of create_agent_portfolio_excel(); in streaming mode
+# the dashboard is built before the header. With worker processes, header
+# through lookups run in the workers and are timed together as 'sheets'
+STAGES = ('catalog', 'prepare', 'header', 'agents', 'dashboard', 'validations',
+          'views', 'roadmap', 'scenarios', 'lookups', 'sheets', 'save')
+
+# Column headers of a derived sheet (Quick Wins, ...); its agents follow
+VIEW_HEADER_ROW = 3
+
+# Column headers of the Build Roadmap; phase banners and agents follow
+ROADMAP_HEADER_ROW = 3
+
+# Group banners of the grouped derived sheets
+GROUP_COLOR = 'darkGray'
+
+# Widths of the summary dashboard's columns, L:N
+DASHBOARD_WIDTHS = [18, 25, 15]
+
+# Column numbers (1-based) that get wrapped / centered agent cells
+WRAP_COLUMNS = (4, 9)
+CENTER_COLUMNS = (1, 5, 6, 7, 8, 10)
+AGENT_STYLES = ['agent-wrap' if col_num in WRAP_COLUMNS else
+                'agent-center' if col_num in CENTER_COLUMNS else None
+                for col_num in range(1, len(HEADERS) + 1)]
+
+
+def build_agents_data(colors=COLORS, catalog_path=DEFAULT_CATALOG_PATH):
+    """Return the agent catalog as a flat list of Category, Agent and Spacing records.
+
+    Every record occupies exactly one row of the Agent Portfolio sheet. The
+    catalog itself is shared with agents-sheet.py and loaded from
+    ``catalog_path`` (see agent_portfolio.catalog).
+    """
+    agents_data = []
 
-def create_agent_portfolio_excel(output_dir='./sheets'):
-    """Create the Agent Portfolio Excel workbook"""
-
-    # Create output directory if it doesn't exist
-    os.makedirs(output_dir, exist_ok=True)
-
-    # Create workbook
-    wb = Workbook()
-    wb.remove(wb.active)  # Remove default sheet
-
-    # Colors (hex codes from the original script)
-    colors = {
-        'purpleGrad': '8B5CF6',
-        'lightPurple': 'F3E8FF',
-        'lightBlue': 'DBEAFE',
-        'darkGray': '374151',
-        'white': 'FFFFFF',
-        'purple': 'A78BFA',
-        'blue': '60A5FA',
-        'green': '34D399',
-        'orange': 'FB923C',
-        'cyan': '22D3EE',
-        'pink': 'F472B6',
-        'yellow': 'FBBF24',
-        'red': 'EF4444',
-        'indigo': '6366F1',
-        'lightGray': 'E5E7EB',
-        'black': '000000',
-        'amber': 'F59E0B',
-        'gray700': '6B7280',
-        'blue500': '3B82F6',
-        'green500': '10B981',
-        'red600': 'DC2626'
-    }
-
-    # Create sheets
-    main = wb.create_sheet('Agent Portfolio', 0)
-    quick = wb.create_sheet('Quick Wins', 1)
-    roadmap = wb.create_sheet('Build Roadmap', 2)
+    # Helper function to add category and agents
+    def add_category(category_name, category_color, agents, font_color=colors['white']):
+        agents_data.append(Category(category_name, category_color, font_color))
+        agents_data.extend(agents)
+        agents_data.append(SPACING)
+
+    for category in load_catalog(catalog_path):
+        add_category(category['name'], colors[category['color']], category['agents'],
+                     colors[category['font_color']])
+
+    return agents_data
+
+
+# Kept under its original name; the logic lives with the records
+filter_agents_data = filter_records
+
+
+def _solid(color):
+    return PatternFill(start_color=color, end_color=color, fill_type='solid')
+
+
+class StyleRegistry:
+    """Named styles shared by every cell of one workbook.
+
+    The styles are built once from the ``colors`` palette and registered on the
+    workbook; cells then reference them by name instead of carrying their own
+    Font/PatternFill/Alignment objects.
+
+    ``categories`` lists the (color, font color) pairs of the catalog's
+    category rows so their styles can be registered up front as well. Every
+    style registered here gets a fixed cell format index, which keeps a
+    sheet's XML independent of the other sheets in the workbook.
+
+    ``value_colors`` holds the differential styles of the VALUE_COLORS
+    conditional format rules, as (column header, match, value, style).
+
+    A native workbook starts from a prebuilt skeleton of all these styles
+    (see agent_portfolio.skeleton), built by the first registry for the same
+    palette and categories.
+    """
+
+    def __init__(self, wb, colors=COLORS, categories=()):
+        self.wb = wb
+        self.colors = colors
+        self._color_names = {value: key for key, value in colors.items()}
+        self._names = set()
+        categories = sorted(set(categories))
+
+        if isinstance(wb, NativeWorkbook):
+            key = skeleton_key(_render_version(), sorted(colors.items()), categories)
+            skeleton = load_skeleton(key)
+            if skeleton is not None:
+                wb.styles = skeleton.styles.copy()
+                self._names = set(skeleton.names)
+                self.value_colors = skeleton.value_colors
+                return
+            self._register(categories)
+            wb.styles.xml()  # serialized once, into the skeleton
+            store_skeleton(Skeleton(key, wb.styles.copy(), frozenset(self._names), self.value_colors))
+        else:
+            self._register(categories)
+
+    def _register(self, categories):
+        colors = self.colors
+        white = colors['white']
+        center = Alignment(horizontal='center', vertical='center')
+        center_wrap = Alignment(horizontal='center', vertical='center', wrap_text=True)
+
+        # Title banners
+        self.add('portfolio-title', Font(size=24, bold=True, color=white), colors['purpleGrad'], center_wrap)
+        self.add('portfolio-summary', Font(size=14), colors['lightPurple'], center_wrap)
+        self.add('portfolio-instructions', Font(size=12, italic=True), colors['lightBlue'], center_wrap)
+        self.add('quick-title', Font(size=24, bold=True, color=white), colors['amber'], center_wrap)
+        self.add('view-title', Font(size=24, bold=True, color=white), colors['purpleGrad'], center_wrap)
+        self.add('roadmap-title', Font(size=24, bold=True, color=white), colors['purpleGrad'], center)
+
+        # Column headers
+        self.add('column-header', Font(size=11, bold=True, color=white), colors['darkGray'], center)
+        self.add('roadmap-header', Font(bold=True, color=white), colors['darkGray'], center)
+
+        # Agent cells
+        self.add('agent-center', alignment=center)
+        self.add('agent-wrap', alignment=Alignment(wrap_text=True, vertical='top'))
+
+        # Summary dashboard
+        self.add('dashboard-header', Font(size=14, bold=True, color=white), colors['darkGray'], center)
+        self.add('dashboard-label', Font(bold=True))
+
+        # Catalog-dependent styles, in a stable order
+        for color, font_color in categories:
+            self.category_header(color, font_color)
+        for _, color_key in ROADMAP_PHASES:
+            self.phase_banner(colors[color_key])
+
+        # Value color coding, applied by conditional format rules
+        self.value_colors = [
+            (header, match, value, DifferentialStyle(font=Font(bold=bold or None, color=colors[font_color]),
+                                                     fill=_solid(colors[fill])))
+            for header, match, value, fill, font_color, bold in VALUE_COLORS
+        ]
+        if isinstance(self.wb, NativeWorkbook):
+            # Numbered now rather than on first use, so sheets rendered in
+            # separate processes agree on them
+            for *_, dxf in self.value_colors:
+                self.wb.styles.dxf(dxf)
+
+        self._pin_cell_styles()
+
+    def _pin_cell_styles(self):
+        # openpyxl numbers cell formats in order of first use; registering
+        # them now makes the numbering depend only on the registry. The
+        # native writer numbers them as they are registered.
+        if isinstance(self.wb, NativeWorkbook):
+            return
+        for style in self.wb._named_styles:
+            self.wb._cell_styles.add(style.as_tuple())
+        # Same for the differential styles of conditional format rules
+        for *_, dxf in self.value_colors:
+            self.wb._differential_styles.add(dxf)
+
+    def add(self, name, font=None, fill_color=None, alignment=None):
+        """Register a named style on the workbook and return its name"""
+        if name not in self._names:
+            self.wb.add_named_style(NamedStyle(
+                name=name,
+                font=font or copy(DEFAULT_FONT),
+                fill=_solid(fill_color) if fill_color else None,
+                alignment=alignment,
+            ))
+            self._names.add(name)
+        return name
+
+    def _color_key(self, color):
+        return self._color_names.get(color, color)
+
+    def category_header(self, color, font_color=None):
+        """Style for a merged category row, registered on first use of ``color``"""
+        name = f'category-header-{self._color_key(color)}'
+        if font_color is None:
+            font_color = self.colors['white']
+        elif font_color != self.colors['white']:
+            name = f'{name}-{self._color_key(font_color)}-text'
+        return self.add(name, Font(size=12, bold=True, color=font_color), color,
+                        Alignment(horizontal='left', vertical='center'))
+
+    def phase_banner(self, color):
+        """Style for a roadmap phase banner, registered on first use of ``color``"""
+        return self.add(f'phase-banner-{self._color_key(color)}',
+                        Font(bold=True, color=self.colors['white']), color,
+                        Alignment(wrap_text=True))
+
+
+def _cell(ws, value=None, style=None):
+    """Create a detached cell that can be appended to a regular or write-only sheet"""
+    if isinstance(ws, NativeSheet):
+        return NativeCell(value, style)
+    cell = WriteOnlyCell(ws, value=value)
+    if style is not None:
+        cell.style = style
+    return cell
+
+
+def _put(ws, row, column, value):
+    """Write a value or detached cell at a fixed position of a regular worksheet"""
+    if isinstance(value, Cell):
+        ws.cell(row, column, value.value).style = value.style
+    else:
+        ws.cell(row, column, value)
+
+
+def _merge(ws, ref):
+    """Merge a range on a regular worksheet, or record it on a write-only one.
+
+    Row generators call this right after yielding the anchor row: merging on a
+    regular sheet creates placeholder cells, which would otherwise shift where
+    ``append`` puts the row.
+    """
+    if hasattr(ws, 'merge_cells'):
+        ws.merge_cells(ref)
+    else:
+        # MultiCellRange.add() scans every existing range; category rows never
+        # overlap, so add straight to the underlying set
+        ws.merged_cells.ranges.add(CellRange(ref))
+
+
+def _set_widths(ws, widths, first_column=1):
+    for col_num, width in enumerate(widths, first_column):
+        ws.column_dimensions[get_column_letter(col_num)].width = width
+
+
+def _header_cells(ws, headers, style='column-header'):
+    return [_cell(ws, header, style) for header in headers]
+
+
+def _agent_cells(ws, agent):
+    return [_cell(ws, value, style) for value, style in zip(agent.cells(), AGENT_STYLES)]
+
+
+def iter_header_rows(ws, title=DEFAULT_TITLE, columns=None):
+    """Yield the Agent Portfolio header section (rows 1-6, columns A:J) in order
+
+    ``columns`` (an AgentColumns over the catalog) supplies the time-saved
+    total for the summary banner.
+    """
+    if columns is None:
+        columns = AgentColumns()
 
     # === MAIN SHEET HEADER SECTION ===
     # Row 1: Title
-    main.merge_cells('A1:J1')
-    main['A1'] = "🤖 MADHAVAN'S AI AGENT FORCE\nIntelligent Agents to 10x Your\nExecutive Leverage"
-    main['A1'].font = Font(size=24, bold=True, color=colors['white'])
-    main['A1'].fill = PatternFill(start_color=colors['purpleGrad'], end_color=colors['purpleGrad'], fill_type='solid')
-    main['A1'].alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    main.row_dimensions[1].height = 72
+    yield [_cell(ws, title, 'portfolio-title')]
+    _merge(ws, 'A1:J1')
 
     # Row 2: Summary
-    main.merge_cells('A2:J2')
-    main['A2'] = "Total Time Saved: 67 hours/week\nYour Current Week: 80 hours →\nFuture Week: 40 hours strategic"
-    main['A2'].font = Font(size=14)
-    main['A2'].fill = PatternFill(start_color=colors['lightPurple'], end_color=colors['lightPurple'], fill_type='solid')
-    main['A2'].alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    main.row_dimensions[2].height = 60
+    yield [_cell(ws, f"Total Time Saved: {format_hours(columns.total_hours())} hours/week\n"
+                     "Your Current Week: 80 hours →\nFuture Week: 40 hours strategic",
+                 'portfolio-summary')]
+    _merge(ws, 'A2:J2')
 
     # Row 3: Spacing
+    yield []
+
     # Row 4: Instructions
-    main.merge_cells('A4:J4')
-    main['A4'] = "INSTRUCTIONS: Rate each agent 1-5 (1=Low Priority, 5=Critical)\nWe'll build your top 5 first"
-    main['A4'].font = Font(size=12, italic=True)
-    main['A4'].fill = PatternFill(start_color=colors['lightBlue'], end_color=colors['lightBlue'], fill_type='solid')
-    main['A4'].alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
+    yield [_cell(ws, "INSTRUCTIONS: Rate each agent 1-5 (1=Low Priority, 5=Critical)\nWe'll build your top 5 first",
+                 'portfolio-instructions')]
+    _merge(ws, 'A4:J4')
 
     # Row 5: Spacing
+    yield []
 
     # Row 6: Column Headers
-    headers = ['Priority', 'Area', 'Agent Name', 'What It Does', 'Time Saved/Week',
-               'Business Impact', 'Build Complexity', 'Status', 'Your Notes', 'Quick Win?']
+    yield _header_cells(ws, HEADERS)
 
-    for col_num, header in enumerate(headers, 1):
-        cell = main.cell(row=6, column=col_num, value=header)
-        cell.font = Font(size=11, bold=True, color=colors['white'])
-        cell.fill = PatternFill(start_color=colors['darkGray'], end_color=colors['darkGray'], fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
 
-    # Column widths
-    widths = [10, 20, 25, 45, 15, 15, 15, 13, 32, 10]
-    for col_num, width in enumerate(widths, 1):
-        main.column_dimensions[get_column_letter(col_num)].width = width
+def iter_agent_rows(ws, agents_data, styles):
+    """Yield one Agent Portfolio row (columns A:J) per catalog record, from FIRST_DATA_ROW down"""
+    row = FIRST_DATA_ROW
+    for item in agents_data:
+        if isinstance(item, Agent):
+            yield _agent_cells(ws, item)
+        elif isinstance(item, Category):
+            yield [_cell(ws, item.name, styles.category_header(item.color, item.font_color))]
+            _merge(ws, f'A{row}:J{row}')
+        elif isinstance(item, Spacing):
+            yield []
+        row += 1
+
+
+def iter_main_rows(ws, agents_data, styles, title=DEFAULT_TITLE, columns=None):
+    """Yield the Agent Portfolio rows (columns A:J) in order, starting at row 1"""
+    if columns is None:
+        columns = AgentColumns.from_agents_data(agents_data)
+    yield from iter_header_rows(ws, title, columns)
+    yield from iter_agent_rows(ws, agents_data, styles)
+
+
+def iter_dashboard_rows(ws, first_data_row, last_data_row, top=(), top_n=TOP_N, columns=None):
+    """Yield the summary dashboard rows (columns L:N) in order, starting at row 1
+
+    ``top`` holds the ranked (score, Agent) pairs from top_agents(); the
+    list is written as values, one row per rank down to ``top_n``. The time
+    savings come from ``columns`` (an AgentColumns over the catalog).
+    """
+    if columns is None:
+        columns = AgentColumns()
+    a = f'A{first_data_row}:A{last_data_row}'
+    c = f'C{first_data_row}:C{last_data_row}'
+    g = f'G{first_data_row}:G{last_data_row}'
+
+    yield [_cell(ws, '📊 SUMMARY DASHBOARD', 'dashboard-header')]
+    _merge(ws, 'L1:N1')
+    yield []
+    yield ['Total Agents:', f'=COUNTA({c})']
+    yield []
+    yield ['Rated by You:', f'=COUNTA({a})']
+    yield ['Avg Priority:', f'=AVERAGE({a})']
+    yield []
+    yield [_cell(ws, 'TIME SAVINGS:', 'dashboard-label')]
+    yield ['Quick Wins:', f'{format_hours(columns.quick_win_hours())} hrs/week']
+    yield ['Total Possible:', f'{format_hours(columns.total_hours())} hrs/week']
+    yield []
+    yield [_cell(ws, 'COMPLEXITY:', 'dashboard-label')]
+    yield ['Low:', f'=COUNTIF({g},"Low")']
+    yield ['Medium:', f'=COUNTIF({g},"Medium")']
+    yield ['High:', f'=COUNTIF({g},"High")']
+    yield []
+    yield [_cell(ws, f'TOP {top_n} PRIORITIES:', 'dashboard-label')]
+    for rank, (_, agent) in zip_longest(range(1, top_n + 1), top, fillvalue=(None, None)):
+        yield [f'{rank}.'] + ([agent.name] if agent is not None else [])
+
+
+def iter_view_rows(ws, view, index, styles):
+    """Yield the rows of a derived sheet (see agent_portfolio.views) in order, starting at row 1
+
+    The agents come from ``index`` (a CatalogIndex over the catalog); a
+    grouped view puts a merged banner row above each group.
+    """
+    yield [_cell(ws, view.banner, view.style)]
+    _merge(ws, 'A1:J1')
+    yield []
 
-    # === AGENT DATA ===
-    agents_data = []
+    # Headers
+    yield _header_cells(ws, HEADERS)
 
-    # Helper function to add category and agents
-    def add_category(category_name, category_color, agents):
-        agents_data.append({'type': 'category', 'name': category_name, 'color': category_color})
+    row = VIEW_HEADER_ROW + 1
+    for key, agents in view.groups(index):
+        if view.group_by is not None:
+            yield [_cell(ws, str(key), styles.category_header(styles.colors[GROUP_COLOR]))]
+            _merge(ws, f'A{row}:J{row}')
+            row += 1
         for agent in agents:
-            agents_data.append({'type': 'agent', 'data': agent})
-        agents_data.append({'type': 'spacing'})
-
-    # STRATEGIC INTELLIGENCE
-    add_category('🎯 STRATEGIC INTELLIGENCE', colors['purple'], [
-        ['', 'Strategic Intelligence', 'Competitive Intelligence Agent', 'Monitors 20+ competitors daily - tracks publications, patents, clinical trials. Alerts on significant developments.', '3 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Strategic Intelligence', 'Research Trend Scanner', 'Identifies emerging cancer research trends 6-12 months before mainstream through citation velocity analysis.', '2 hours', 'HIGH', 'High', 'Not Started', '', True],
-        ['', 'Strategic Intelligence', 'IP Landscape Monitor', 'Tracks patent landscape, identifies freedom-to-operate risks and white space opportunities.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Strategic Intelligence', 'Grant Intelligence Agent', 'Finds relevant grants (NIH, NSF, DOD), analyzes winning proposals, estimates success probability.', '3 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-    ])
-
-    # INVESTOR RELATIONS
-    add_category('💼 INVESTOR RELATIONS', colors['blue'], [
-        ['', 'Investor Relations', 'Investor Update Generator', 'Auto-generates weekly/monthly investor updates from research progress, milestones, and achievements.', '4 hours', 'HIGH', 'Low', 'Not Started', '', True],
-        ['', 'Investor Relations', 'Pitch Deck Intelligence', 'Keeps pitch deck current with latest milestones, competitive landscape, publications, team accomplishments.', '2 hours', 'MEDIUM', 'Low', 'Not Started', '', True],
-        ['', 'Investor Relations', 'Fundraising Opportunity Scanner', 'Identifies potential investors, tracks VC fund raises, suggests timing and warm intro paths.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Investor Relations', 'Grant Writing Assistant', 'Helps write and improve grant proposals based on winning examples and reviewer feedback patterns.', '3 hours', 'HIGH', 'High', 'Not Started', '', False],
-    ])
-
-    # RESEARCH OVERSIGHT
-    add_category('🔬 RESEARCH OVERSIGHT', colors['green'], [
-        ['', 'Research Oversight', 'Breakthrough Detector', 'Flags significant research findings from team before formal reporting. Suggests patent opportunities.', '1 hour', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Research Oversight', 'Research Portfolio Dashboard', 'Real-time view of all projects: status, blockers, dependencies, timeline, risk flags.', '2 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Research Oversight', 'Publication Opportunity Finder', 'Matches research to journals, estimates acceptance likelihood, tracks submission deadlines.', '1 hour', 'MEDIUM', 'Low', 'Not Started', '', False],
-        ['', 'Research Oversight', 'Collaboration Matchmaker', 'Identifies external collaboration opportunities, finds complementary research partners.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Research Oversight', 'Research ROI Tracker', 'Tracks cost per publication, grant success rates, program efficiency across all research areas.', '1 hour', 'MEDIUM', 'Low', 'Not Started', '', False],
-    ])
-
-    # TEAM MANAGEMENT
-    add_category('👥 TEAM MANAGEMENT', colors['orange'], [
-        ['', 'Team Management', 'Team Health Monitor', 'Analyzes communication patterns to detect burnout, disengagement before they escalate.', '1 hour', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Team Management', 'Talent Pipeline Agent', 'Monitors top researchers in your field for hiring. Tracks publication records, identifies unhappy researchers.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Team Management', 'Productivity Insights', 'Shows team blockers without micromanaging. Identifies bottlenecks and suggests process improvements.', '1 hour', 'MEDIUM', 'Low', 'Not Started', '', False],
-        ['', 'Team Management', 'Onboarding Accelerator', 'Creates personalized onboarding plans for new hires based on role and background.', '1 hour', 'LOW', 'Low', 'Not Started', '', False],
-    ])
-
-    # BUSINESS DEVELOPMENT
-    add_category('🤝 BUSINESS DEVELOPMENT', colors['cyan'], [
-        ['', 'Business Development', 'Partnership Opportunity Scanner', 'Finds pharma/biotech working on complementary research. Identifies partnership fit and warm intros.', '3 hours', 'HIGH', 'High', 'Not Started', '', True],
-        ['', 'Business Development', 'Clinical Trial Intelligence', 'Monitors relevant trials, identifies unmet needs, finds trial sponsors and partnership opportunities.', '2 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Business Development', 'Licensing Opportunity Agent', 'Finds in-licensing and out-licensing opportunities. Tracks patent auctions and technology transfers.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Business Development', 'Conference ROI Analyzer', 'Recommends which conferences to attend/sponsor based on attendee analysis and partnership ROI.', '1 hour', 'LOW', 'Low', 'Not Started', '', False],
-        ['', 'Business Development', 'Market Intelligence', 'Tracks cancer drug market trends, competitor pipelines, M&A activity, and exit opportunities.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-    ])
-
-    # COMMUNICATIONS & ADMIN
-    add_category('📧 COMMUNICATIONS & ADMIN', colors['pink'], [
-        ['', 'Communications', 'Email Prioritizer', 'Sorts 200+ daily emails into: urgent/review/delegate/ignore with smart summaries.', '5 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Communications', 'Meeting Prep Agent', 'Prepares briefing docs for every meeting: attendee background, talking points, suggested outcomes.', '3 hours', 'HIGH', 'Low', 'Not Started', '', True],
-        ['', 'Communications', 'Board Report Generator', 'Compiles monthly board reports from research progress, financials, team updates automatically.', '4 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Communications', 'Internal Announcements Writer', 'Drafts team communications: milestone celebrations, new hires, policy updates.', '1 hour', 'LOW', 'Low', 'Not Started', '', False],
-        ['', 'Communications', 'LinkedIn Content Generator', 'Creates LinkedIn posts highlighting research achievements, team milestones, thought leadership.', '2 hours', 'MEDIUM', 'Low', 'Not Started', '', False],
-        ['', 'Communications', 'Press Release Writer', 'Drafts press releases for significant research breakthroughs and company milestones.', '2 hours', 'MEDIUM', 'Low', 'Not Started', '', False],
-    ])
-
-    # FINANCIAL OPERATIONS
-    add_category('💰 FINANCIAL OPERATIONS', colors['yellow'], [
-        ['', 'Financial', 'Budget Optimizer', 'Recommends resource reallocation based on research progress and ROI analysis.', '2 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Financial', 'Burn Rate Monitor', 'Tracks spending velocity daily, alerts on budget risks, calculates runway.', '1 hour', 'HIGH', 'Low', 'Not Started', '', True],
-        ['', 'Financial', 'Research ROI Analyzer', 'Calculates cost per publication, grant success ROI, program efficiency. Investment recommendations.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Financial', 'Vendor Intelligence', 'Monitors equipment/service vendors for better pricing, tracks contract renewals, suggests alternatives.', '1 hour', 'LOW', 'Low', 'Not Started', '', False],
-    ])
-
-    # REGULATORY & COMPLIANCE
-    add_category('⚖️ REGULATORY & COMPLIANCE', colors['red'], [
-        ['', 'Regulatory', 'Regulatory Intelligence', 'Monitors FDA/regulatory changes affecting ACM research. Tracks approval trends and competitor approvals.', '2 hours', 'MEDIUM', 'Medium', 'Not Started', '', False],
-        ['', 'Regulatory', 'Risk Monitor', 'Flags compliance risks, research ethics issues, safety concerns, IP infringement risks.', '1 hour', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Regulatory', 'Audit Preparation', 'Maintains audit-ready documentation, flags potential audit issues before they become problems.', '1 hour', 'MEDIUM', 'Low', 'Not Started', '', False],
-    ])
-
-    # PERSONAL PRODUCTIVITY
-    add_category('🧠 PERSONAL PRODUCTIVITY', colors['indigo'], [
-        ['', 'Personal', 'Decision Intelligence', 'Summarizes complex issues with pros/cons, risk assessment, data-driven recommendations.', '3 hours', 'HIGH', 'High', 'Not Started', '', True],
-        ['', 'Personal', 'Reading Digest Agent', 'Curates must-read papers, industry news, competitor updates into 10-minute daily digest.', '5 hours', 'HIGH', 'Medium', 'Not Started', '', True],
-        ['', 'Personal', 'Calendar Optimizer', 'Suggests meeting consolidation, blocks focus time, identifies unnecessary meetings.', '2 hours', 'MEDIUM', 'Low', 'Not Started', '', True],
-        ['', 'Personal', 'Travel Coordinator', 'Books travel, manages itineraries, prepares trip briefs with meeting schedules and local intel.', '2 hours', 'LOW', 'Low', 'Not Started', '', False],
-    ])
-
-    # Write data to sheet
-    row = 7
-    first_data_row = 7
+            yield _agent_cells(ws, agent)
+        row += len(agents)
 
-    for item in agents_data:
-        if item['type'] == 'category':
-            main.merge_cells(f'A{row}:J{row}')
-            cell = main[f'A{row}']
-            cell.value = item['name']
-            cell.font = Font(size=12, bold=True, color=colors['white'])
-            cell.fill = PatternFill(start_color=item['color'], end_color=item['color'], fill_type='solid')
-            cell.alignment = Alignment(horizontal='left', vertical='center')
-            row += 1
-        elif item['type'] == 'agent':
-            for col_num, value in enumerate(item['data'], 1):
-                cell = main.cell(row=row, column=col_num, value=value)
-                # Wrap text for description and notes
-                if col_num in [4, 9]:
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
-                # Center alignment for specific columns
-                if col_num in [1, 5, 6, 7, 8, 10]:
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-            row += 1
-        elif item['type'] == 'spacing':
-            row += 1
 
-    last_data_row = row - 1
-
-    # Add data validation
-    # Priority dropdown
-    priority_dv = DataValidation(type="list", formula1='"5 - Critical,4 - High,3 - Medium,2 - Low,1 - Not Now"', allow_blank=True)
-    main.add_data_validation(priority_dv)
-    priority_dv.add(f'A{first_data_row}:A{last_data_row}')
-
-    # Business Impact dropdown
-    impact_dv = DataValidation(type="list", formula1='"HIGH,MEDIUM,LOW"', allow_blank=True)
-    main.add_data_validation(impact_dv)
-    impact_dv.add(f'F{first_data_row}:F{last_data_row}')
-
-    # Build Complexity dropdown
-    complexity_dv = DataValidation(type="list", formula1='"Low,Medium,High"', allow_blank=True)
-    main.add_data_validation(complexity_dv)
-    complexity_dv.add(f'G{first_data_row}:G{last_data_row}')
-
-    # Status dropdown
-    status_dv = DataValidation(type="list", formula1='"Not Started,Planning,In Progress,Complete"', allow_blank=True)
-    main.add_data_validation(status_dv)
-    status_dv.add(f'H{first_data_row}:H{last_data_row}')
-
-    # === SUMMARY DASHBOARD (L1:N20) ===
-    main.merge_cells('L1:N1')
-    dash_header = main['L1']
-    dash_header.value = '📊 SUMMARY DASHBOARD'
-    dash_header.font = Font(size=14, bold=True, color=colors['white'])
-    dash_header.fill = PatternFill(start_color=colors['darkGray'], end_color=colors['darkGray'], fill_type='solid')
-    dash_header.alignment = Alignment(horizontal='center', vertical='center')
-
-    main['L3'] = 'Total Agents:'
-    main['M3'] = f'=COUNTA(C{first_data_row}:C{last_data_row})'
-
-    main['L5'] = 'Rated by You:'
-    main['M5'] = f'=COUNTA(A{first_data_row}:A{last_data_row})'
-
-    main['L6'] = 'Avg Priority:'
-    main['M6'] = f'=AVERAGE(A{first_data_row}:A{last_data_row})'
-
-    main['L8'] = 'TIME SAVINGS:'
-    main['L8'].font = Font(bold=True)
-    main['L9'] = 'Quick Wins:'
-    main['M9'] = '25 hrs/week'
-    main['L10'] = 'Total Possible:'
-    main['M10'] = '67 hrs/week'
-
-    main['L12'] = 'COMPLEXITY:'
-    main['L12'].font = Font(bold=True)
-    main['L13'] = 'Low:'
-    main['M13'] = f'=COUNTIF(G{first_data_row}:G{last_data_row},"Low")'
-    main['L14'] = 'Medium:'
-    main['M14'] = f'=COUNTIF(G{first_data_row}:G{last_data_row},"Medium")'
-    main['L15'] = 'High:'
-    main['M15'] = f'=COUNTIF(G{first_data_row}:G{last_data_row},"High")'
-
-    main['L17'] = 'TOP 5 PRIORITIES:'
-    main['L17'].font = Font(bold=True)
-    main['L18'] = '1.'
-    main['M18'] = f'=IFERROR(INDEX(C{first_data_row}:C{last_data_row}, MATCH(MAX(A{first_data_row}:A{last_data_row}), A{first_data_row}:A{last_data_row}, 0)), "")'
-    main['L19'] = '2.'
-    main['M19'] = f'=IFERROR(INDEX(C{first_data_row}:C{last_data_row}, MATCH(LARGE(A{first_data_row}:A{last_data_row},2), A{first_data_row}:A{last_data_row}, 0)), "")'
-    main['L20'] = '3.'
-    main['M20'] = f'=IFERROR(INDEX(C{first_data_row}:C{last_data_row}, MATCH(LARGE(A{first_data_row}:A{last_data_row},3), A{first_data_row}:A{last_data_row}, 0)), "")'
-
-    # Set dashboard column widths
-    main.column_dimensions['L'].width = 18
-    main.column_dimensions['M'].width = 25
-    main.column_dimensions['N'].width = 15
-
-    # === QUICK WINS SHEET ===
-    quick.merge_cells('A1:J1')
-    quick['A1'] = '⚡ QUICK WIN AGENTS\nHigh Impact + Fast to Build'
-    quick['A1'].font = Font(size=24, bold=True, color=colors['white'])
-    quick['A1'].fill = PatternFill(start_color=colors['amber'], end_color=colors['amber'], fill_type='solid')
-    quick['A1'].alignment = Alignment(horizontal='center', vertical='center', wrap_text=True)
-    quick.row_dimensions[1].height = 72
+def iter_roadmap_rows(ws, styles, top=(), top_n=TOP_N, scheduled=None):
+    """Yield the Build Roadmap rows in order, starting at row 1
+
+    The ranked ``top`` agents fill the rows under the Phase 1 banner. A
+    ``scheduled`` roadmap (ScheduledAgents from agent_portfolio.roadmap)
+    fills every phase instead, with dates, dependencies and owners.
+    """
+    colors = styles.colors
+    yield [_cell(ws, '🚀 AGENT BUILD ROADMAP', 'roadmap-title')]
+    _merge(ws, 'A1:I1')
+    yield []
 
     # Headers
-    for col_num, header in enumerate(headers, 1):
-        cell = quick.cell(row=3, column=col_num, value=header)
-        cell.font = Font(size=11, bold=True, color=colors['white'])
-        cell.fill = PatternFill(start_color=colors['darkGray'], end_color=colors['darkGray'], fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    # Column widths
-    for col_num, width in enumerate(widths, 1):
-        quick.column_dimensions[get_column_letter(col_num)].width = width
-
-    # Add quick win agents (filter by Quick Win? = True)
-    quick_row = 4
-    for item in agents_data:
-        if item['type'] == 'agent' and item['data'][9] == True:
-            for col_num, value in enumerate(item['data'], 1):
-                cell = quick.cell(row=quick_row, column=col_num, value=value)
-                if col_num in [4, 9]:
-                    cell.alignment = Alignment(wrap_text=True, vertical='top')
-                if col_num in [1, 5, 6, 7, 8, 10]:
-                    cell.alignment = Alignment(horizontal='center', vertical='center')
-            quick_row += 1
-
-    # === BUILD ROADMAP SHEET ===
-    roadmap.merge_cells('A1:I1')
-    roadmap['A1'] = '🚀 AGENT BUILD ROADMAP'
-    roadmap['A1'].font = Font(size=24, bold=True, color=colors['white'])
-    roadmap['A1'].fill = PatternFill(start_color=colors['purpleGrad'], end_color=colors['purpleGrad'], fill_type='solid')
-    roadmap['A1'].alignment = Alignment(horizontal='center', vertical='center')
+    yield _header_cells(ws, R_HEADERS, 'roadmap-header')
+
+    # Phase sections; the top-ranked agents go under Phase 1
+    row = ROADMAP_HEADER_ROW + 1
+    for (label, color_key), (rows, size) in zip(ROADMAP_PHASES, phase_rows(top, top_n, scheduled)):
+        yield [_cell(ws, label, styles.phase_banner(colors[color_key]))]
+        _merge(ws, f'A{row}:I{row}')
+        yield from chain(rows, repeat([], size - len(rows)))
+        row += 1 + size
+
+
+def _roadmap_data_rows(top=(), top_n=TOP_N, scheduled=None):
+    """Row numbers of the Build Roadmap below its phase banners"""
+    row = ROADMAP_HEADER_ROW + 1
+    for _, size in phase_rows(top, top_n, scheduled):
+        yield from range(row + 1, row + 1 + size)
+        row += 1 + size
+
+
+def iter_scenario_rows(ws, styles, bands, banner):
+    """Yield the Scenarios rows in order, starting at row 1
+
+    ``bands`` are the ScenarioBands from agent_portfolio.scenarios.simulate();
+    ``banner`` states the assumptions behind them.
+    """
+    colors = styles.colors
+    yield [_cell(ws, '🎲 TIME SAVINGS SCENARIOS', 'roadmap-title')]
+    _merge(ws, 'A1:H1')
+    yield [_cell(ws, banner, 'portfolio-instructions')]
+    _merge(ws, 'A2:H2')
+    yield []
 
     # Headers
-    r_headers = ['Phase', 'Agent Name', 'Priority Score', 'Time Saved', 'Build Time', 'Dependencies', 'Start Date', 'Launch Date', 'Owner']
-    for col_num, header in enumerate(r_headers, 1):
-        cell = roadmap.cell(row=3, column=col_num, value=header)
-        cell.font = Font(bold=True, color=colors['white'])
-        cell.fill = PatternFill(start_color=colors['darkGray'], end_color=colors['darkGray'], fill_type='solid')
-        cell.alignment = Alignment(horizontal='center', vertical='center')
-
-    # Phase sections
-    roadmap.merge_cells('A4:I4')
-    roadmap['A4'] = 'PHASE 1: FOUNDATIONS (Weeks 1-4)\nQuick wins with immediate impact'
-    roadmap['A4'].font = Font(bold=True, color=colors['white'])
-    roadmap['A4'].fill = PatternFill(start_color=colors['blue'], end_color=colors['blue'], fill_type='solid')
-    roadmap['A4'].alignment = Alignment(wrap_text=True)
-
-    roadmap.merge_cells('A10:I10')
-    roadmap['A10'] = 'PHASE 2: INTELLIGENCE (Weeks 5-12)\nStrategic and analytical agents'
-    roadmap['A10'].font = Font(bold=True, color=colors['white'])
-    roadmap['A10'].fill = PatternFill(start_color=colors['cyan'], end_color=colors['cyan'], fill_type='solid')
-    roadmap['A10'].alignment = Alignment(wrap_text=True)
-
-    roadmap.merge_cells('A16:I16')
-    roadmap['A16'] = 'PHASE 3: AUTOMATION (Weeks 13-24)\nProcess optimization agents'
-    roadmap['A16'].font = Font(bold=True, color=colors['white'])
-    roadmap['A16'].fill = PatternFill(start_color=colors['green'], end_color=colors['green'], fill_type='solid')
-    roadmap['A16'].alignment = Alignment(wrap_text=True)
-
-    # Column widths for roadmap
-    r_widths = [15, 38, 18, 15, 15, 28, 15, 15, 20]
-    for col_num, width in enumerate(r_widths, 1):
-        roadmap.column_dimensions[get_column_letter(col_num)].width = width
-
-    # Save workbook
-    output_path = os.path.join(output_dir, 'Agent_Portfolio.xlsx')
-    wb.save(output_path)
-    print(f"✅ Excel file created successfully: {output_path}")
+    yield _header_cells(ws, S_HEADERS, 'roadmap-header')
+
+    for band in bands:
+        label, *values = band.cells()
+        style = (styles.phase_banner(colors[ROADMAP_PHASES[band.phase][1]]) if band.phase is not None
+                 else 'dashboard-label')
+        yield [_cell(ws, label, style)] + [_cell(ws, value, 'agent-center') for value in values]
+
+
+def _add_validations(ws, validated, rows):
+    """Add one dropdown per (column, LookupList) of ``validated`` over the data ``rows`` given.
+
+    ``rows`` are sorted row numbers; banner rows between them are left out
+    of the ranges. The dropdowns refer to their list by defined name (see
+    agent_portfolio.lookups). Return how many were added.
+    """
+    spans = row_spans(rows)
+    if not spans:
+        return 0
+    for column, lookup in validated:
+        letter = get_column_letter(column)
+        dv = DataValidation(type="list", formula1=lookup.name, allow_blank=True)
+        for first_row, last_row in spans:
+            dv.add(f'{letter}{first_row}:{letter}{last_row}')
+        # Write-only sheets have no add_data_validation(), so append directly
+        ws.data_validations.append(dv)
+    return len(validated)
+
+
+def _add_value_colors(ws, styles, first_row, last_row, columns=None):
+    """Color cells by value with one conditional format rule per value per column range.
+
+    The rules come from VALUE_COLORS, limited to the ``columns`` headers when
+    given. Return how many were added.
+    """
+    count = 0
+    for header, match, value, dxf in styles.value_colors:
+        if columns is not None and header not in columns:
+            continue
+        letter = get_column_letter(HEADERS.index(header) + 1)
+        if match == 'contains':
+            rule = Rule(type='containsText', operator='containsText', text=value, dxf=dxf,
+                        formula=[f'NOT(ISERROR(SEARCH("{value}",{letter}{first_row})))'])
+        else:
+            rule = Rule(type='cellIs', operator='equal', formula=[f'"{value}"'], dxf=dxf)
+        ws.conditional_formatting.add(f'{letter}{first_row}:{letter}{last_row}', rule)
+        count += 1
+    return count
+
+
+def _append_rows(ws, rows, beside=(), first_row=1, last=False):
+    """Append ``rows`` to ``ws`` and return how many rows were written.
+
+    ``beside`` holds the dashboard rows of a write-only sheet, indexed from
+    row 1; each is padded in from column L next to the row of the same number.
+    With ``last``, dashboard rows still left once ``rows`` run out (a small
+    catalog) are written on rows of their own.
+    """
+    beside = beside[first_row - 1:]
+    pairs = zip_longest(rows, beside, fillvalue=[]) if last else zip(rows, chain(beside, repeat([])))
+    count = 0
+    for count, (row, dash_row) in enumerate(pairs, 1):
+        if dash_row:
+            row = list(row) + [None] * (DASHBOARD_COLUMN - 1 - len(row)) + list(dash_row)
+        ws.append(row)
+    return count
+
+
+@lru_cache(maxsize=None)
+def _render_version():
+    """Changes whenever the rendering code or openpyxl does, invalidating stored fingerprints"""
+    package_dir = os.path.join(os.path.dirname(os.path.abspath(__file__)), 'agent_portfolio')
+    digest = hashlib.sha256()
+    for path in [__file__] + sorted(glob.glob(os.path.join(package_dir, '*.py'))):
+        with open(path, 'rb') as f:
+            digest.update(f.read())
+    return digest.hexdigest() + openpyxl_version
+
+
+def _sheet_fingerprints(wb, agents_data, colors, title, top, top_n, views, index, scheduled, lists,
+                        scenario_options=None):
+    """Fingerprint everything each sheet is rendered from.
+
+    The sheet titles go into the 'styles' fingerprint: sheets are reused by
+    position in the package, so adding or dropping a view renders them all.
+    So do the names of the lookup lists, which decide what gets validated.
+    """
+    version = _render_version()
+    palette = sorted(colors.items())
+    fingerprints = {
+        'styles': fingerprint([palette, wb.named_styles, wb.sheetnames, list(lists)], version),
+        SHEET_LISTS: fingerprint(lists.values(), version),
+        SHEET_MAIN: fingerprint(chain([title, HEADERS, WIDTHS, DASHBOARD_WIDTHS, top_n], agents_data), version),
+        SHEET_ROADMAP: fingerprint(chain([R_HEADERS, R_WIDTHS, ROADMAP_PHASES, palette, top_n, top],
+                                         ([entry.phase, entry.cells()] for entry in scheduled or ())), version),
+    }
+    for view in views:
+        fingerprints[view.title] = fingerprint(chain([HEADERS, WIDTHS, view], view.groups(index)), version)
+    if scenario_options is not None:
+        # Seeded, so the same inputs simulate to the same sheet
+        fingerprints[SHEET_SCENARIOS] = fingerprint(
+            chain([S_HEADERS, S_WIDTHS, ROADMAP_PHASES, palette, sorted(scenario_options.items())], agents_data),
+            version)
+    return fingerprints
+
+
+def _untimed(name):
+    return nullcontext(SimpleNamespace(rows=0))
+
+
+def _render_main(ws, styles, job, stage=_untimed):
+    """Fill the Agent Portfolio sheet and its summary dashboard (columns L:N); return the rows written"""
+    # Each catalog item fills exactly one row, so the data range is known
+    # before any row is written
+    first_data_row = FIRST_DATA_ROW
+    last_data_row = first_data_row + len(job.agents_data) - 1
+
+    _set_widths(ws, WIDTHS)
+    _set_widths(ws, DASHBOARD_WIDTHS, DASHBOARD_COLUMN)
+    ws.row_dimensions[1].height = 72
+    ws.row_dimensions[2].height = 60
+    if isinstance(ws, NativeSheet):
+        # Formula results go out with the rows instead of being patched in on save
+        ws.cached_values = dashboard_values(job.agents_data, job.columns)
+
+    dashboard = iter_dashboard_rows(ws, first_data_row, last_data_row, job.top, job.top_n, job.columns)
+    dash_rows = []
+    if job.streaming:
+        # Write-only rows go out strictly in order, so the dashboard is
+        # built first and padded into rows 1.. as they are written
+        with stage('dashboard') as phase:
+            dash_rows = list(dashboard)
+            phase.rows = len(dash_rows)
+
+    with stage('header') as phase:
+        phase.rows = rows = _append_rows(ws, iter_header_rows(ws, job.title, job.columns), dash_rows)
+
+    with stage('agents') as phase:
+        phase.rows = _append_rows(ws, iter_agent_rows(ws, job.agents_data, styles), dash_rows, first_data_row,
+                                  last=True)
+        rows += phase.rows
+
+    if not job.streaming:
+        # A regular sheet takes cells anywhere, so the dashboard goes in
+        # last; padding rows with None would put real cells inside the
+        # merged title and category rows
+        with stage('dashboard') as phase:
+            for row_index, dash_row in enumerate(dashboard, 1):
+                for col_num, value in enumerate(dash_row, DASHBOARD_COLUMN):
+                    _put(ws, row_index, col_num, value)
+                phase.rows = row_index
+
+    with stage('validations') as phase:
+        # A filter matching no agents leaves no data rows to validate or color
+        if last_data_row >= first_data_row:
+            agent_rows = (row for row, item in enumerate(job.agents_data, first_data_row) if isinstance(item, Agent))
+            phase.rows = _add_validations(ws, validations(SHEET_MAIN, HEADERS, job.lists), agent_rows)
+            phase.rows += _add_value_colors(ws, styles, first_data_row, last_data_row)
+    return rows
+
+
+def _render_view(ws, styles, view, job):
+    """Fill a derived sheet; return the rows written"""
+    _set_widths(ws, WIDTHS)
+    ws.row_dimensions[1].height = 72
+    rows = _append_rows(ws, iter_view_rows(ws, view, job.index, styles))
+    if rows > VIEW_HEADER_ROW:
+        _add_value_colors(ws, styles, VIEW_HEADER_ROW + 1, rows, view.value_columns)
+    return rows
+
+
+def _render_roadmap(ws, styles, job):
+    """Fill the Build Roadmap sheet; return the rows written"""
+    _set_widths(ws, R_WIDTHS)
+    rows = _append_rows(ws, iter_roadmap_rows(ws, styles, job.top, job.top_n, job.scheduled))
+    _add_validations(ws, validations(SHEET_ROADMAP, R_HEADERS, job.lists),
+                     _roadmap_data_rows(job.top, job.top_n, job.scheduled))
+    return rows
+
+
+def _render_scenarios(ws, styles, job):
+    """Simulate the roadmap and fill the Scenarios sheet; return the rows written"""
+    _set_widths(ws, S_WIDTHS)
+    ws.row_dimensions[2].height = 36
+    bands = simulate(job.agents_data, **job.scenario_options)
+    return _append_rows(ws, iter_scenario_rows(ws, styles, bands, assumptions(**job.scenario_options)))
+
+
+def _catalog_strings(agents_data):
+    """The strings of the catalog's cells, in the order the Agent Portfolio writes them"""
+    for item in agents_data:
+        if isinstance(item, Agent):
+            for value in item.cells():
+                if type(value) is str and value and not value.startswith('='):
+                    yield value
+        elif isinstance(item, Category):
+            yield item.name
+
+
+# What a worker process renders from; see _render_parallel()
+_worker_job = None
+
+
+def _init_worker(job):
+    global _worker_job
+    _worker_job = job
+
+
+def _render_part(position, directory):
+    """Worker: render the sheet at ``position`` and deflate its part into ``directory``.
+
+    Returns (position, RenderedPart, rows written, shared string references).
+    """
+    job = _worker_job
+    job.strings.count = 0
+    wb = NativeWorkbook()
+    wb.shared_strings = job.strings
+    styles = StyleRegistry(wb, job.colors, job.categories)
+    ws = wb.create_sheet(job.titles[position])
+    views = job.views
+    if position == 0:
+        rows = _render_main(ws, styles, job)
+    elif position <= len(views):
+        rows = _render_view(ws, styles, views[position - 1], job)
+    elif ws.title == SHEET_ROADMAP:
+        rows = _render_roadmap(ws, styles, job)
+    elif ws.title == SHEET_SCENARIOS:
+        rows = _render_scenarios(ws, styles, job)
+    else:
+        rows = _append_rows(ws, lookup_rows(job.lists))
+    part = render_part(ws, directory, selected=position == 0, compression=job.compression)
+    return position, part, rows, job.strings.count
+
+
+def _render_parallel(wb, job, workers, directory):
+    """Render the sheets of native ``wb`` on ``workers`` processes; return the rows written.
+
+    Every worker starts from the same style skeleton and the same frozen
+    table of catalog strings (``job.strings``), so the sheet parts they
+    deflate into ``directory`` go into the package as they are. Sheets are
+    handed out in workbook order, the Agent Portfolio (the largest) first.
+    """
+    rows = 0
+    with ProcessPoolExecutor(max_workers=workers, initializer=_init_worker, initargs=(job,)) as pool:
+        futures = [pool.submit(_render_part, position, directory) for position in range(len(wb.worksheets))]
+        for future in as_completed(futures):
+            position, part, count, references = future.result()
+            wb.worksheets[position].rendered = part
+            wb.shared_strings.count += references
+            rows += count
+    return rows
+
+
+def create_agent_portfolio_excel(output_dir='./sheets', agents_data=None, streaming=False,
+                                 catalog_path=DEFAULT_CATALOG_PATH, incremental=False,
+                                 output_path=None, title=DEFAULT_TITLE, top_n=TOP_N, verbose=True,
+                                 stage=None, backend='openpyxl', views=DEFAULT_VIEWS, roadmap_plan=None,
+                                 workers=None, compression=DEFAULT_COMPRESSION, scenarios=None):
+    """Create the Agent Portfolio Excel workbook
+
+    With ``streaming=True`` the workbook is built from write-only worksheets:
+    rows are serialized as they are produced, so peak memory stays flat
+    regardless of how many agents the catalog holds.
+
+    With ``incremental=True`` the inputs of each sheet are fingerprinted and
+    any sheet unchanged since the previous output is copied from that file
+    instead of being rendered again (see agent_portfolio.incremental).
+
+    The ``top_n`` highest-priority agents are ranked once in Python (see
+    agent_portfolio.ranking) and written as values to the dashboard and the
+    first Build Roadmap phase.
+
+    The catalog is read from ``catalog_path`` unless ``agents_data`` is given.
+    The workbook is written to ``output_dir``/Agent_Portfolio.xlsx, or to
+    ``output_path`` when one is given; that can also be a binary file object
+    such as a BytesIO, for rendering in memory.
+
+    ``stage(name)``, if given, must return a context manager whose value has
+    a ``rows`` attribute; each of the STAGES runs inside it and records how
+    many rows it wrote. agent_portfolio.instrument provides one that reports
+    duration, rows and allocations per stage. Without it, instrumentation is
+    switched on by the AGENT_PORTFOLIO_TRACE / AGENT_PORTFOLIO_PROFILE
+    environment variables (see agent_portfolio.instrument.from_environment).
+
+    ``backend='native'`` writes the same layout with agent_portfolio.native,
+    which serializes rows straight to XML instead of building openpyxl cells.
+    It always streams, and does not support incremental mode. Only it starts
+    from a prebuilt style skeleton (agent_portfolio.skeleton); the openpyxl
+    backend, the default, registers its named styles anew for every workbook.
+
+    ``views`` lists the derived sheets (agent_portfolio.views.View) placed
+    between the Agent Portfolio and the Build Roadmap; by default only
+    Quick Wins. They all select their agents from one CatalogIndex built
+    with the workbook.
+
+    ``roadmap_plan``, a dict of agent_portfolio.roadmap.schedule() options (as
+    read by load_plan()), has the Build Roadmap scheduled from agent
+    dependencies, effort and team capacity instead of listing the top-N.
+
+    ``workers`` (native backend only) renders the sheets in that many worker
+    processes, each serializing and compressing whole sheet parts that are
+    then copied into the package, so a large workbook takes about as long as
+    its largest sheet. Catalog strings are shared; any other string is
+    written inline. The sheet stages are then timed together as 'sheets'.
+
+    ``compression`` names the agent_portfolio.package.CompressionProfile the
+    parts are zipped with: 'fast' for local handoffs, 'balanced' (the zip
+    defaults) or 'smallest' for copies that are sent around.
+
+    ``scenarios``, a dict of agent_portfolio.scenarios.simulate() options
+    (runs, seed, hours_spread, effort_spread, target; {} for the defaults),
+    adds a Scenarios sheet after the Build Roadmap with P10/P50/P90 hours
+    saved per week at the end of each phase, simulated over the same
+    roadmap plan. It needs NumPy.
+    """
+    if output_path is None:
+        output_path = os.path.join(output_dir, 'Agent_Portfolio.xlsx')
+    in_memory = hasattr(output_path, 'write')
+
+    if stage is None:
+        probe = from_environment(output='<memory>' if in_memory else output_path)
+        if probe is not None:
+            with probe:
+                return create_agent_portfolio_excel(
+                    output_dir, agents_data, streaming, catalog_path, incremental,
+                    output_path, title, top_n, verbose, stage=probe, backend=backend, views=views,
+                    roadmap_plan=roadmap_plan, workers=workers, compression=compression,
+                    scenarios=scenarios)
+        stage = _untimed
+
+    if backend not in BACKENDS:
+        raise ValueError(f'unknown backend {backend!r}; expected one of {", ".join(BACKENDS)}')
+    compression_profile(compression)  # an unknown profile fails before any rendering
+    native = backend == 'native'
+    if native:
+        if incremental:
+            raise ValueError('incremental mode needs the openpyxl backend')
+        # The native writer only appends rows in order, like a write-only sheet
+        streaming = True
+    elif workers:
+        raise ValueError('rendering sheets in parallel needs the native backend')
+
+    if in_memory:
+        if incremental:
+            raise ValueError('incremental mode needs an output file to reuse sheets from')
+    else:
+        # Create output directory if it doesn't exist
+        os.makedirs(os.path.dirname(output_path) or '.', exist_ok=True)
+
+    colors = COLORS
+    with stage('catalog') as phase:
+        if agents_data is None:
+            agents_data = build_agents_data(colors, catalog_path)
+        phase.rows = len(agents_data)
+
+    with stage('prepare'):
+        # Create workbook
+        if native:
+            wb = NativeWorkbook()
+        elif streaming:
+            wb = Workbook(write_only=True)
+        else:
+            wb = Workbook()
+            wb.remove(wb.active)  # Remove default sheet
+
+        # Shared named styles, referenced by name from every cell
+        categories = [(item.color, item.font_color) for item in agents_data if isinstance(item, Category)]
+        if any(view.group_by is not None for view in views):
+            categories.append((colors[GROUP_COLOR], colors['white']))
+        styles = StyleRegistry(wb, colors, categories)
+
+        # Create sheets: the portfolio, the derived sheets, then the roadmap
+        main = wb.create_sheet(SHEET_MAIN, 0)
+        view_sheets = [wb.create_sheet(view.title, position) for position, view in enumerate(views, 1)]
+        roadmap = wb.create_sheet(SHEET_ROADMAP, len(views) + 1)
+        scenario_sheet = wb.create_sheet(SHEET_SCENARIOS, len(views) + 2) if scenarios is not None else None
+        lists_sheet = wb.create_sheet(SHEET_LISTS, len(wb.worksheets))
+        lists_sheet.sheet_state = 'hidden'
+
+        top = top_agents(agents_data, top_n)
+        columns = AgentColumns.from_agents_data(agents_data)
+        index = CatalogIndex(agents_data)
+        scheduled = schedule(agents_data, **roadmap_plan) if roadmap_plan is not None else None
+        # The scenarios replay the roadmap's plan
+        scenario_options = {**(roadmap_plan or {}), **scenarios} if scenarios is not None else None
+
+        # Dropdown values live on the hidden Lists sheet, under defined names
+        lists = lookup_lists(index, (roadmap_plan or {}).get('owners', ()))
+        for lookup in lists.values():
+            wb.defined_names[lookup.name] = DefinedName(lookup.name, attr_text=lookup.ref)
+
+        job = SimpleNamespace(agents_data=agents_data, colors=colors, categories=categories, title=title,
+                              top=top, top_n=top_n, columns=columns, index=index, scheduled=scheduled,
+                              lists=lists, views=views, streaming=streaming, compression=compression,
+                              scenario_options=scenario_options,
+                              titles=[ws.title for ws in wb.worksheets])
+        if workers:
+            # One string table for every worker, so sheet parts need no merging
+            wb.shared_strings = job.strings = frozen_strings(_catalog_strings(agents_data))
+
+        reuse = set()
+        if incremental:
+            fingerprints = _sheet_fingerprints(wb, agents_data, colors, title, top, top_n, views, index,
+                                               scheduled, lists, scenario_options)
+            reuse = reusable_sheets(read_manifest(output_path), fingerprints, wb.sheetnames)
+
+    # Dimensions are set before each sheet's rows are streamed out
+    if workers:
+        with tempfile.TemporaryDirectory(prefix='portfolio-') as directory:
+            with stage('sheets') as phase:
+                phase.rows = _render_parallel(wb, job, workers, directory)
+            with stage('save'):
+                wb.save(output_path, compression)
+    else:
+        # === AGENT PORTFOLIO + SUMMARY DASHBOARD (columns L:N) ===
+        if SHEET_MAIN not in reuse:
+            _render_main(main, styles, job, stage)
+
+        # === DERIVED SHEETS (QUICK WINS, ...) ===
+        with stage('views') as phase:
+            for view, ws in zip(views, view_sheets):
+                if view.title not in reuse:
+                    phase.rows += _render_view(ws, styles, view, job)
+
+        # === BUILD ROADMAP SHEET ===
+        if SHEET_ROADMAP not in reuse:
+            with stage('roadmap') as phase:
+                phase.rows = _render_roadmap(roadmap, styles, job)
+
+        # === SCENARIOS SHEET ===
+        if scenario_sheet is not None and SHEET_SCENARIOS not in reuse:
+            with stage('scenarios') as phase:
+                phase.rows = _render_scenarios(scenario_sheet, styles, job)
+
+        # === LOOKUP LISTS (hidden) ===
+        if SHEET_LISTS not in reuse:
+            with stage('lookups') as phase:
+                phase.rows = _append_rows(lists_sheet, lookup_rows(lists))
+
+        # Save workbook, storing the dashboard results next to their formulas so
+        # readers get values without recalculating. Every formula in the workbook
+        # now carries its result, so there is no need to force a full recalc.
+        with stage('save'):
+            if native:
+                wb.save(output_path, compression)
+            else:
+                wb.calculation.fullCalcOnLoad = False
+                cached = {} if SHEET_MAIN in reuse else {sheet_part(1): dashboard_values(agents_data, columns)}
+                if incremental:
+                    reuse_parts = [sheet_part(index) for index, ws in enumerate(wb.worksheets, 1)
+                                   if ws.title in reuse]
+                    write_package(wb, output_path, manifest_comment(fingerprints), cached,
+                                  reuse_parts, output_path, compression)
+                else:
+                    write_package(wb, output_path, cached_values=cached, compression=compression)
+
+    if incremental and reuse and verbose:
+        print(f"♻️  Reused unchanged sheets: {', '.join(sorted(reuse))}")
+    if verbose:
+        print(f"✅ Excel file created successfully: {output_path}")
     return output_path
 
 if __name__ == '__main__':
@@ -0,0 +1,56 @@
+"""Batch rendering of per-stakeholder portfolios on a process pool"""
+
+import json
+
+import pytest
+from openpyxl import load_workbook
+
+import create_agents_excel as generator
+from agent_portfolio.batch import load_specs, run_batch
+
+
+def _agent_names(path):
+    ws = load_workbook(path, read_only=True)[generator.SHEET_MAIN]
+    rows = ws.iter_rows(min_row=generator.FIRST_DATA_ROW, max_col=3, values_only=True)
+    return {row[2] for row in rows if row[2]}
+
+
+def test_each_stakeholder_gets_their_own_workbook(tmp_path):
+    agents_data = generator.build_agents_data()
+    regulatory = generator.filter_agents_data(agents_data, areas=['Regulatory'])
+    investors = [item for item in agents_data if isinstance(item, generator.Category)][1].name
+    specs = [
+        {'output': str(tmp_path / 'teams' / 'legal' / 'regulatory.xlsx'), 'areas': ['Regulatory'],
+         'title': 'LEGAL AGENT FORCE'},
+        {'output': str(tmp_path / 'ceo.xlsx'), 'categories': [investors]},
+    ]
+    landed = []
+    report = run_batch(specs, workers=2, on_result=lambda output, agents, seconds: landed.append((output, agents)))
+
+    expected = {item.name for item in regulatory if isinstance(item, generator.Agent)}
+    assert _agent_names(specs[0]['output']) == expected
+    title = load_workbook(specs[0]['output'], read_only=True)[generator.SHEET_MAIN]['A1'].value
+    assert title == 'LEGAL AGENT FORCE'
+    ceo = _agent_names(specs[1]['output'])
+    assert ceo and not ceo & expected
+
+    assert sorted(landed) == sorted([(specs[0]['output'], len(expected)), (specs[1]['output'], len(ceo))])
+    assert report['workbooks'] == 2
+    assert sum(stats['workbooks'] for stats in report['workers'].values()) == 2
+    assert sum(stats['agents'] for stats in report['workers'].values()) == len(expected) + len(ceo)
+
+
+def test_worker_failure_reaches_the_caller(tmp_path):
+    specs = [{'output': str(tmp_path / 'good.xlsx')}, {'output': str(tmp_path / 'bad.xlsx'), 'top_n': 'five'}]
+    with pytest.raises(TypeError):
+        run_batch(specs, workers=2)
+    # The other spec still renders
+    assert (tmp_path / 'good.xlsx').exists()
+    assert not (tmp_path / 'bad.xlsx').exists()
+
+
+def test_specs_need_an_output_path(tmp_path):
+    path = tmp_path / 'specs.json'
+    path.write_text(json.dumps([{'output': 'a.xlsx'}, {'title': 'No file'}]), encoding='utf-8')
+    with pytest.raises(ValueError, match='spec 2 has no "output" path'):
+        load_specs(str(path))
@@ -0,0 +1,39 @@
+"""The openpyxl package writer: cached formula results and incremental reuse"""
+
+import zipfile
+
+from openpyxl import load_workbook
+
+import create_agents_excel as generator
+from agent_portfolio.dashboard import dashboard_values
+from agent_portfolio.incremental import sheet_part
+
+
+def test_streamed_package_caches_dashboard_results(tmp_path):
+    agents_data = generator.build_agents_data()
+    path = generator.create_agent_portfolio_excel(
+        agents_data=agents_data, streaming=True, verbose=False, output_path=str(tmp_path / 'portfolio.xlsx'))
+
+    ws = load_workbook(path, data_only=True)[generator.SHEET_MAIN]
+    for cell, value in dashboard_values(agents_data).items():
+        assert ws[cell].value == value
+
+
+def test_incremental_run_copies_unchanged_sheets(tmp_path):
+    agents_data = generator.build_agents_data()
+    path = str(tmp_path / 'portfolio.xlsx')
+    generator.create_agent_portfolio_excel(agents_data=agents_data, output_path=path, verbose=False,
+                                           incremental=True)
+    with zipfile.ZipFile(path) as archive:
+        before = {name: archive.read(name) for name in archive.namelist()}
+
+    generator.create_agent_portfolio_excel(agents_data=agents_data, output_path=path, verbose=False,
+                                           incremental=True, title='Another Title')
+    with zipfile.ZipFile(path) as archive:
+        after = {name: archive.read(name) for name in archive.namelist()}
+
+    assert after.keys() == before.keys()
+    assert after[sheet_part(1)] != before[sheet_part(1)]
+    assert after[sheet_part(2)] == before[sheet_part(2)]
+    assert load_workbook(path, data_only=True)[generator.SHEET_MAIN]['M3'].value == \
+        dashboard_values(agents_data)['M3']
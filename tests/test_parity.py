@@ -0,0 +1,13 @@
+"""Both workbook backends must produce what a reader sees as the same workbook"""
+
+from agent_portfolio.parity import check_backends
+
+
+def test_backends_match():
+    assert check_backends() == []
+
+
+def test_backends_match_on_filtered_catalog():
+    # Fewer agent rows than dashboard rows, so the dashboard runs past the table
+    assert check_backends(areas=['Regulatory']) == []
+    assert check_backends(areas=['Regulatory'], streaming=True) == []
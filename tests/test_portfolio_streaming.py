@@ -0,0 +1,45 @@
+"""Streaming (write-only) and native output against the regular in-memory workbook"""
+
+import zipfile
+
+import pytest
+from openpyxl import load_workbook
+
+import create_agents_excel as generator
+from agent_portfolio.incremental import sheet_part
+
+
+def _sheet(path, title):
+    ws = load_workbook(path)[title]
+    cells = {cell.coordinate: (cell.value, cell.style)
+             for row in ws.iter_rows() for cell in row if cell.value is not None}
+    return ws.max_row, cells, sorted(map(str, ws.merged_cells.ranges))
+
+
+def test_filtered_catalog_streams_like_regular_mode(tmp_path):
+    # Fewer agent rows than dashboard rows, so the dashboard runs past the table
+    agents_data = generator.filter_agents_data(generator.build_agents_data(), areas=['Regulatory'])
+    paths = {}
+    for streaming in (False, True):
+        paths[streaming] = generator.create_agent_portfolio_excel(
+            agents_data=agents_data, streaming=streaming, verbose=False,
+            output_path=str(tmp_path / f'portfolio_{streaming}.xlsx'))
+
+    regular = _sheet(paths[False], generator.SHEET_MAIN)
+    streamed = _sheet(paths[True], generator.SHEET_MAIN)
+    assert regular[0] > generator.FIRST_DATA_ROW + len(agents_data)
+    assert streamed == regular
+
+
+@pytest.mark.parametrize('options', [{}, {'streaming': True}, {'backend': 'native'}],
+                         ids=['regular', 'streaming', 'native'])
+def test_empty_filtered_catalog(tmp_path, options):
+    agents_data = generator.filter_agents_data(generator.build_agents_data(), areas=['No Such Area'])
+    path = generator.create_agent_portfolio_excel(
+        agents_data=agents_data, verbose=False, output_path=str(tmp_path / 'portfolio.xlsx'), **options)
+
+    with zipfile.ZipFile(path) as archive:
+        sheet_xml = archive.read(sheet_part(1))
+    assert b'<conditionalFormatting' not in sheet_xml
+    assert b'<dataValidation ' not in sheet_xml
+    assert load_workbook(path)[generator.SHEET_MAIN]['M3'].value.startswith('=COUNTA(')
@@ -0,0 +1,44 @@
+"""Top-N priority ranking"""
+
+from agent_portfolio.records import SPACING, Agent, Category
+from agent_portfolio.ranking import top_agents
+
+
+def _agent(name, priority, impact='MEDIUM', complexity='Medium', time_saved='1 hour'):
+    return Agent(priority, 'Ops', name, '', time_saved, impact, complexity, 'Not Started')
+
+
+def _names(top):
+    return [agent.name for _, agent in top]
+
+
+def test_ties_break_on_impact_complexity_time_then_catalog_order():
+    agents_data = [
+        Category('Ops', '000000', 'FFFFFF'),
+        _agent('First', 4),
+        _agent('Low impact', 4, impact='LOW'),
+        _agent('High impact', 4, impact='HIGH'),
+        _agent('Easy', 4, complexity='Low'),
+        _agent('Half hour', 4, time_saved='30 min'),
+        _agent('Two hours', 4, time_saved='2 hours'),
+        _agent('Second', 4),
+        SPACING,
+        _agent('Critical', '5 - Critical'),
+    ]
+    top = top_agents(agents_data, 10)
+
+    assert _names(top) == ['Critical', 'High impact', 'Easy', 'Two hours', 'First', 'Second',
+                           'Half hour', 'Low impact']
+    assert [score for score, _ in top[:2]] == [5, 4]
+
+
+def test_unrated_agents_are_left_out():
+    agents_data = [_agent('Rated', 2), _agent('Blank', ''), _agent('None', None), _agent('Text', 'later')]
+    assert _names(top_agents(agents_data, 5)) == ['Rated']
+
+
+def test_top_n_larger_than_the_catalog():
+    agents_data = [_agent('A', 1), _agent('B', 3), _agent('C', 2)]
+    assert _names(top_agents(agents_data, 50)) == ['B', 'C', 'A']
+    assert _names(top_agents(agents_data, 2)) == ['B', 'C']
+    assert top_agents([], 5) == []
@@ -0,0 +1,42 @@
+"""Returned workbooks: reading ratings back and merging them into the catalog"""
+
+from openpyxl import load_workbook
+
+import create_agents_excel as generator
+from agent_portfolio.catalog import load_catalog
+from agent_portfolio.ratings import merge_ratings, normalize_priority
+
+
+def test_normalize_priority():
+    assert normalize_priority(5) == '5 - Critical'
+    assert normalize_priority(4.0) == '4 - High'
+    assert normalize_priority(' 3 ') == '3 - Medium'
+    assert normalize_priority('2 - Low') == '2 - Low'
+    for value in (10, '10', 4.7, '9', 0, -1, 'High', '3 - Mediocre', True):
+        assert normalize_priority(value) is None, value
+
+
+def test_returned_workbook_round_trip(tmp_path):
+    path = generator.create_agent_portfolio_excel(output_path=str(tmp_path / 'portfolio.xlsx'), verbose=False)
+    wb = load_workbook(path)
+    ws = wb[generator.SHEET_MAIN]
+    rows = [row for row in range(generator.FIRST_DATA_ROW, ws.max_row + 1) if ws.cell(row, 3).value]
+    typed = ['4 - High', 5, 2.0, '10', 4.7, '9']
+    for row, value in zip(rows, typed):
+        ws.cell(row, 1).value = value
+    ws.cell(rows[0], 8).value = 'Almost Done'
+    ws.cell(rows[0], 9).value = ' Needs API access '
+    wb.save(path)
+
+    categories = load_catalog(use_cache=False)
+    report = merge_ratings(categories, [path])
+    agents = {agent.name: agent for category in categories for agent in category['agents']}
+    names = [ws.cell(row, 3).value for row in rows]
+
+    assert [agents[name].priority for name in names[:3]] == ['4 - High', '5 - Critical', '2 - Low']
+    assert agents[names[0]].notes == 'Needs API access'
+    assert report['updated'] == 4
+    assert report['rejected'] == [(path, names[0], 'status', 'Almost Done')] + [
+        (path, name, 'priority', value) for name, value in zip(names[3:], typed[3:])]
+    # Rejected ratings leave the catalog as it was
+    assert all(agents[name].priority == '' for name in names[3:6])
@@ -0,0 +1,82 @@
+"""Build roadmap scheduling: dependencies, builders and phases"""
+
+import datetime
+
+import pytest
+
+from agent_portfolio.records import Agent
+from agent_portfolio.roadmap import DONE, schedule
+
+MONDAY = datetime.date(2026, 1, 5)
+
+
+def _agent(name, priority=None, complexity='Low', status='Not Started'):
+    return Agent(priority, 'Ops', name, '', '1 hour', 'MEDIUM', complexity, status)
+
+
+def _plan(entries):
+    return {entry.agent.name: entry for entry in entries}
+
+
+def test_dependencies_wait_for_launch():
+    agents = [_agent('Report', priority=5), _agent('Data', priority=1, complexity='Medium')]
+    plan = _plan(schedule(agents, {'Report': ['Data']}, capacity=2, start=MONDAY))
+
+    assert plan['Data'].start == MONDAY
+    assert plan['Report'].start == MONDAY + datetime.timedelta(weeks=2)
+    assert plan['Report'].dependencies == ('Data',)
+
+
+def test_built_dependencies_are_satisfied():
+    agents = [_agent('Report'), _agent('Data', status=DONE)]
+    entries = schedule(agents, {'Report': ['Data']}, start=MONDAY)
+
+    assert [entry.agent.name for entry in entries] == ['Report']
+    assert entries[0].start == MONDAY
+
+
+@pytest.mark.parametrize('dependencies, message', [
+    ({'A': ['B'], 'B': ['C'], 'C': ['A']}, 'cycle'),
+    ({'A': ['A']}, 'depends on itself'),
+    ({'A': ['Nobody']}, "unknown agent 'Nobody'"),
+    ({'Nobody': ['A']}, "unknown agent 'Nobody'"),
+])
+def test_bad_dependencies(dependencies, message):
+    agents = [_agent('A'), _agent('B'), _agent('C')]
+    with pytest.raises(ValueError, match=message):
+        schedule(agents, dependencies)
+
+
+def test_ambiguous_dependency_name():
+    with pytest.raises(ValueError, match='2 agents share'):
+        schedule([_agent('A'), _agent('A'), _agent('B')], {'B': ['A']})
+
+
+def test_owners_set_the_capacity():
+    agents = [_agent(name, priority) for name, priority in (('A', 5), ('B', 4), ('C', 3))]
+    plan = _plan(schedule(agents, owners=('Alex', 'Sam'), start=MONDAY))
+
+    assert (plan['A'].owner, plan['B'].owner) == ('Alex', 'Sam')
+    assert plan['A'].start == plan['B'].start == MONDAY
+    assert plan['C'].start == MONDAY + datetime.timedelta(weeks=1)
+
+
+def test_capacity_overrides_owners():
+    agents = [_agent('A', 5), _agent('B', 4)]
+    plan = _plan(schedule(agents, capacity=1, owners=('Alex', 'Sam'), start=MONDAY))
+
+    assert plan['B'].start == MONDAY + datetime.timedelta(weeks=1)
+    assert {entry.owner for entry in plan.values()} == {'Alex'}
+    with pytest.raises(ValueError, match='capacity'):
+        schedule(agents, capacity=0)
+
+
+def test_phase_follows_launch_week():
+    # One builder and four weeks each: launches in weeks 4, 8, 12, 16, ..., 32
+    agents = [_agent(f'Agent {rank}', priority=10 - rank, complexity='High') for rank in range(8)]
+    entries = schedule(agents, start=MONDAY)
+
+    assert [entry.phase for entry in entries] == [0, 1, 1, 2, 2, 2, 2, 2]
+    assert [entry.agent.name for entry in entries] == [agent.name for agent in agents]
+    # Launch is the Friday of the last build week
+    assert entries[0].launch == MONDAY + datetime.timedelta(weeks=4, days=-3)
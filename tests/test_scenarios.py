@@ -0,0 +1,57 @@
+"""Monte Carlo time-savings scenarios over the build roadmap"""
+
+import pytest
+
+import create_agents_excel as generator
+from agent_portfolio.layout import ROADMAP_PHASES
+from agent_portfolio.scenarios import simulate
+
+pytest.importorskip('numpy')
+
+RUNS = 2000
+
+
+@pytest.fixture(scope='module')
+def agents_data():
+    return generator.build_agents_data()
+
+
+def _bands(bands):
+    return [(band.label, band.agents, band.p10, band.p50, band.p90, band.added, band.chance) for band in bands]
+
+
+def test_same_seed_same_bands(agents_data):
+    first = simulate(agents_data, runs=RUNS, seed=7)
+
+    assert _bands(simulate(agents_data, runs=RUNS, seed=7)) == _bands(first)
+    assert _bands(simulate(agents_data, runs=RUNS, seed=8)) != _bands(first)
+    assert len(first) == len(ROADMAP_PHASES) + 2
+    assert (first[0].label, first[-1].label) == ('Live now', 'All agents built')
+
+
+def test_percentiles_are_ordered(agents_data):
+    bands = simulate(agents_data, runs=RUNS, capacity=2)
+
+    for band in bands:
+        assert band.p10 <= band.p50 <= band.p90, band
+        assert 0 <= band.chance <= 1
+    # Every band adds the agents launched since the one before
+    assert [band.p50 for band in bands] == sorted(band.p50 for band in bands)
+    assert [band.agents for band in bands] == sorted(band.agents for band in bands)
+
+
+def test_fixed_spreads_are_the_point_estimate(agents_data):
+    bands = simulate(agents_data, runs=10, hours_spread=(1, 1, 1), effort_spread=(1, 1, 1))
+    assert all(band.p10 == band.p50 == band.p90 for band in bands)
+
+
+@pytest.mark.parametrize('options, message', [
+    ({'runs': 0}, 'runs must be at least 1'),
+    ({'runs': -5}, 'runs must be at least 1'),
+    ({'hours_spread': (1.5, 1.0, 0.5)}, 'hours_spread'),
+    ({'hours_spread': (-0.5, 1.0, 1.5)}, 'hours_spread'),
+    ({'effort_spread': (0.75, 2.5, 2.0)}, 'effort_spread'),
+])
+def test_bad_arguments(agents_data, options, message):
+    with pytest.raises(ValueError, match=message):
+        simulate(agents_data, **options)
@@ -0,0 +1,79 @@
+"""The warm rendering service: cache, metrics and error replies"""
+
+import threading
+import urllib.error
+import urllib.request
+
+import pytest
+
+import create_agents_excel as generator
+from agent_portfolio.service import PortfolioService, RenderCache, make_server
+
+
+@pytest.fixture
+def server():
+    service = PortfolioService()
+    server = make_server(service, port=0)
+    threading.Thread(target=server.serve_forever, daemon=True).start()
+    yield service, f'http://127.0.0.1:{server.server_address[1]}'
+    server.shutdown()
+    server.server_close()
+
+
+def _get(url):
+    try:
+        with urllib.request.urlopen(url) as response:
+            return response.status, response.read()
+    except urllib.error.HTTPError as e:
+        return e.code, e.read()
+
+
+def _metrics(url):
+    _, body = _get(f'{url}/metrics')
+    return dict(line.split(' ') for line in body.decode('utf-8').splitlines() if not line.startswith('#'))
+
+
+def test_cache_evicts_least_recently_used():
+    cache = RenderCache(10)
+    cache.put('a', b'aaaa')
+    cache.put('b', b'bbbb')
+    assert cache.get('a') == b'aaaa'
+    cache.put('c', b'cccc')
+
+    assert cache.get('b') is None
+    assert cache.get('a') == b'aaaa' and cache.get('c') == b'cccc'
+    assert (cache.bytes, cache.evictions, len(cache)) == (8, 1, 2)
+    cache.put('huge', b'x' * 11)
+    assert cache.peek('huge') is None and len(cache) == 2
+
+
+def test_repeated_request_is_a_cache_hit(server):
+    service, url = server
+    status, first = _get(f'{url}/portfolio.xlsx?area=Regulatory')
+    assert status == 200
+    assert _get(f'{url}/portfolio.xlsx?area=Regulatory') == (200, first)
+
+    metrics = _metrics(url)
+    assert metrics['portfolio_cache_hits_total'] == '1'
+    assert metrics['portfolio_cache_misses_total'] == '1'
+    assert metrics['portfolio_render_seconds_count'] == '1'
+    assert metrics['portfolio_cache_bytes'] == str(len(first))
+
+
+def test_filter_selecting_nothing_is_a_bad_request(server):
+    _, url = server
+    status, body = _get(f'{url}/portfolio.xlsx?area=Nope')
+    assert status == 400
+    assert b'no agents' in body
+
+
+def test_render_failure_is_a_server_error(server, monkeypatch):
+    _, url = server
+
+    def broken(**options):
+        raise RuntimeError('disk full')
+
+    monkeypatch.setattr(generator, 'create_agent_portfolio_excel', broken)
+    assert _get(f'{url}/portfolio.xlsx?top_n=3') == (500, b'render failed: disk full\n')
+    # The server keeps answering
+    assert _get(f'{url}/healthz') == (200, b'ok\n')
@@ -0,0 +1,37 @@
+"""publish() must never leave the spreadsheet without a sheet mid-batch"""
+
+import create_agents_excel as generator
+from agent_portfolio.layout import SHEET_MAIN
+from agent_portfolio.sheets import SHEET_IDS, StubEndpoint, build_requests, publish
+
+
+def _replay(sheets, requests):
+    """Apply the add/delete requests to the sheet ids in order, as the API would"""
+    sheets = set(sheets)
+    for request in requests:
+        if 'addSheet' in request:
+            sheets.add(request['addSheet']['properties']['sheetId'])
+        elif 'deleteSheet' in request:
+            sheets.remove(request['deleteSheet']['sheetId'])
+            assert sheets, 'deleted the last sheet of the spreadsheet'
+    return sheets
+
+
+def test_republish_over_portfolio_sheets_only():
+    requests = build_requests(generator.build_agents_data())
+    previous = [{'sheetId': sheet_id, 'title': title} for title, sheet_id in SHEET_IDS.items()]
+    with StubEndpoint(previous) as stub:
+        publish('sheet', requests, endpoint=stub.url)
+
+    assert _replay(SHEET_IDS.values(), stub.calls[0]['requests']) == set(SHEET_IDS.values())
+
+
+def test_republish_keeps_other_sheets():
+    requests = build_requests(generator.build_agents_data())
+    previous = [{'sheetId': 0, 'title': 'Notes'}, {'sheetId': SHEET_IDS[SHEET_MAIN], 'title': SHEET_MAIN}]
+    with StubEndpoint(previous) as stub:
+        publish('sheet', requests, endpoint=stub.url)
+
+    sent = stub.calls[0]['requests']
+    assert len(sent) == len(requests) + 1
+    assert _replay([0, SHEET_IDS[SHEET_MAIN]], sent) == {0} | set(SHEET_IDS.values())
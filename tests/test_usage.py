@@ -0,0 +1,109 @@
+"""Usage-driven Time Saved/Week and Business Impact from the platform tables"""
+
+import datetime
+import sqlite3
+
+import pytest
+
+from agent_portfolio.records import Agent, Category
+from agent_portfolio.usage import apply_usage, connect, read_usage
+
+START = datetime.datetime(2026, 1, 5, 9, 0)
+
+MAPPING = {
+    'sources': {'patents': 'IP Monitor', 'openalex': 'Trend Scanner'},
+    'digest_agent': 'Digest',
+    'minutes_per_run': {'*': 30, 'IP Monitor': 60},
+    'cost_per_run': {'patents': 0.5},
+}
+
+
+def _at(days, seconds=0):
+    return (START + datetime.timedelta(days=days, seconds=seconds)).isoformat(sep=' ')
+
+
+@pytest.fixture
+def database(tmp_path):
+    path = tmp_path / 'platform.db'
+    db = sqlite3.connect(path)
+    db.executescript('''
+        CREATE TABLE "Query" ("id" INTEGER PRIMARY KEY, "startedAt" TEXT, "completedAt" TEXT);
+        CREATE TABLE "Response" ("id" INTEGER PRIMARY KEY, "queryId" INTEGER, "source" TEXT, "createdAt" TEXT);
+        CREATE TABLE "Feedback" ("id" INTEGER PRIMARY KEY, "responseId" INTEGER, "type" TEXT, "importance" INTEGER);
+        CREATE TABLE "ResearchDigest" ("id" INTEGER PRIMARY KEY, "date" INTEGER);
+    ''')
+    # Two weeks of responses; the last patents query never completed
+    responses = [('patents', 0, 2), ('patents', 7, 4), ('patents', 14, None),
+                 ('openalex', 1, 3), ('openalex', 2, 5), ('mystery', 3, 1), ('mystery', 4, 1)]
+    for query, (source, day, latency) in enumerate(responses, 1):
+        completed = _at(day, latency) if latency is not None else None
+        db.execute('INSERT INTO "Query" VALUES (?, ?, ?)', (query, _at(day), completed))
+        db.execute('INSERT INTO "Response" VALUES (?, ?, ?, ?)', (query, query, source, _at(day)))
+    feedback = [(1, 'IMPORTANT', 5), (2, 'DISLIKE', 4), (3, 'DISLIKE', None),
+                (4, 'LIKE', None), (5, 'DISLIKE', None), (4, 'WRONG', None), (6, 'LIKE', 5)]
+    db.executemany('INSERT INTO "Feedback" ("responseId", "type", "importance") VALUES (?, ?, ?)', feedback)
+    # Prisma's SQLite connector stores DateTime as milliseconds
+    digests = [int((START + datetime.timedelta(days=day)).timestamp() * 1000) for day in (0, 5, 10, 12)]
+    db.executemany('INSERT INTO "ResearchDigest" ("date") VALUES (?)', [(date,) for date in digests])
+    db.commit()
+    db.close()
+    return str(path)
+
+
+def _read(database, mapping=MAPPING, chunk_rows=2):
+    connection = connect(f'sqlite:///{database}')
+    try:
+        return read_usage(connection, mapping, chunk_rows)
+    finally:
+        connection.close()
+
+
+def test_read_usage(database):
+    usage = _read(database)
+
+    assert usage.rows == 7 + 7 + 4
+    assert usage.weeks == 2
+    assert dict(usage.unmapped) == {'mystery': 2}
+    assert set(usage.agents) == {'IP Monitor', 'Trend Scanner', 'Digest'}
+
+    patents = usage.agents['IP Monitor']
+    assert (patents.runs, patents.timed_runs, patents.latency, patents.cost) == (3, 2, 3.0, 1.5)
+    assert patents.hours_per_week(usage.weeks) == 1.5
+    # Importance wins over the votes, two of which are negative
+    assert (patents.positive, patents.negative, patents.rated) == (1, 2, 2)
+    assert patents.impact() == 'HIGH'
+
+    scanner = usage.agents['Trend Scanner']
+    assert (scanner.runs, scanner.latency, scanner.cost, scanner.rated) == (2, 4.0, 0, 0)
+    # One positive vote out of three
+    assert scanner.impact() == 'LOW'
+
+    digest = usage.agents['Digest']
+    assert (digest.runs, digest.latency, digest.impact()) == (4, None, None)
+    assert digest.hours_per_week(usage.weeks) == 1
+
+
+def test_without_digest_agent(database):
+    mapping = {key: value for key, value in MAPPING.items() if key != 'digest_agent'}
+    usage = _read(database, mapping, chunk_rows=100)
+    assert 'Digest' not in usage.agents
+    assert usage.rows == 7 + 7
+
+
+def test_apply_usage(database):
+    usage = _read(database)
+    records = [
+        Category('Research', '000000', 'FFFFFF'),
+        Agent('', 'Research', 'IP Monitor', '', '30 min', 'LOW', 'Low', 'Built'),
+        Agent('', 'Research', 'Trend Scanner', '', '2 hours', 'HIGH', 'Low', 'Built'),
+        Agent('', 'Research', 'Digest', '', '3 hours', 'MEDIUM', 'Low', 'Built'),
+        Agent('', 'Research', 'Unused', '', '4 hours', 'HIGH', 'Low', 'Not Started'),
+    ]
+    result = apply_usage(records, usage)
+
+    assert [(item.time_saved, item.impact) for item in result[1:]] == [
+        ('1.5 hours', 'HIGH'), ('30 min', 'LOW'), ('1 hour', 'MEDIUM'), ('4 hours', 'HIGH')]
+    # Unchanged items are passed through; changed agents are copies
+    assert result[0] is records[0] and result[4] is records[4]
+    assert all(new is not old for new, old in zip(result[1:4], records[1:4]))
+    assert (records[1].time_saved, records[1].impact) == ('30 min', 'LOW')